@@ -0,0 +1,260 @@
+"""
+Benchmark preprocessing, scoring and HTTP serving of the bundled models on synthetic cohorts.
+
+Usage:
+    python benchmarks/benchmark_models.py [--models SPECS] [--sizes 1,100,10000] [--repeats N]
+                                          [--output benchmarks/benchmark_results.json]
+                                          [--baseline OLD.json [--tolerance 0.25]]
+
+Cohorts are drawn within the ranges and categories of each model's feature schema. For every
+model and cohort size the stages below are timed, and their throughput, p50/p99 latency and the
+peak RSS of the process are written to a JSON file:
+- preprocess: model._preprocess on the list of records
+- score_single: model._calculate_probability_single for every preprocessed record
+- score_batch: model._calculate_probability_batch on the preprocessed records
+- predict_columns: model.predict_columns on one numpy array per feature
+- http_predict: POST /models/{name}/predict through an in-process ASGI client
+
+With --baseline, the p50 latencies are compared against an earlier result file and the script
+exits with status 1 when a stage got slower than the tolerance allows.
+
+Requires httpx for the http_predict stage.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import sys
+import time
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# next to this script, whatever the working directory (and ignored by git)
+DEFAULT_OUTPUT = os.path.join(REPO_DIR, "benchmarks", "benchmark_results.json")
+SERVICE_DIR = os.path.join(REPO_DIR, "willemsen_PEG_tubefeed")
+sys.path.insert(0, SERVICE_DIR)
+
+from model_registry import load_model_spec, parse_model_specs  # noqa: E402
+
+DEFAULT_MODELS = ",".join([
+    "willemsen_tubefeed=" + os.path.join(SERVICE_DIR, "willemsen_tubefeed.py"),
+    "stiphout_pCR_Clinical=" + os.path.join(REPO_DIR, "stiphout_pCR-Clinical", "stiphout_pCR_Clinical.py"),
+    "ntcp_model_dysphalgia=" + os.path.join(REPO_DIR, "ntcp_model", "ntcp_model_dysphalgia.json"),
+])
+
+
+def synthetic_cohort(model_obj, rows, seed=0):
+    """
+    Draw a cohort of valid input records for a model.
+
+    Numerical features are drawn uniformly within their minimum/maximum (standard normal when the
+    metadata gives no range), categorical features uniformly from their numerical categories.
+
+    Parameters:
+    - model_obj: the model object
+    - rows: number of records
+    - seed: seed of the random generator
+
+    Returns:
+    - columns: dictionary mapping feature name to a numpy array of values
+    """
+    rng = np.random.default_rng(seed)
+    schema = model_obj.get_feature_schema()
+    columns = {}
+    for feature in schema:
+        if feature.type == "categorical" and feature.categories:
+            categories = sorted(category for category in feature.categories if not isinstance(category, str))
+            columns[feature.name] = rng.choice(np.array(categories), size=rows)
+        elif feature.minimum is not None and feature.maximum is not None:
+            # stay inside the range, also for models whose bounds are exclusive
+            low = np.nextafter(feature.minimum, feature.maximum)
+            high = np.nextafter(feature.maximum, feature.minimum)
+            columns[feature.name] = rng.uniform(low, high, size=rows)
+        else:
+            columns[feature.name] = rng.standard_normal(rows)
+    return columns
+
+
+def columns_to_records(columns):
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*(columns[name].tolist() for name in names))]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(run, repeats, setup=None):
+    """
+    Time a function several times.
+
+    Parameters:
+    - run: function called with the result of setup
+    - repeats: number of timed calls
+    - setup: optional function preparing the argument of every call, not timed
+
+    Returns:
+    - durations: list of wall clock durations in seconds
+    """
+    durations = []
+    for _ in range(repeats):
+        argument = setup() if setup is not None else None
+        start = time.perf_counter()
+        run(argument)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def summarize(model_name, stage, rows, durations):
+    durations = np.asarray(durations)
+    p50 = float(np.percentile(durations, 50))
+    return {
+        "model": model_name,
+        "stage": stage,
+        "rows": rows,
+        "repeats": len(durations),
+        "p50_seconds": p50,
+        "p99_seconds": float(np.percentile(durations, 99)),
+        "rows_per_second": rows / p50 if p50 > 0 else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def http_durations(client, path, body, repeats):
+    async def run():
+        durations = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            response = await client.post(path, content=body, headers={"content-type": "application/json"})
+            response.raise_for_status()
+            durations.append(time.perf_counter() - start)
+        return durations
+
+    return asyncio.run(run())
+
+
+def benchmark_model(model_name, model_obj, sizes, repeats, single_max_rows, http_max_rows, client):
+    """
+    Run all stages of one model for every cohort size.
+
+    Returns:
+    - results: list of summaries, one per stage and cohort size
+    """
+    results = []
+    for rows in sizes:
+        start = len(results)
+        stage_repeats = repeats or max(5, min(200, 200000 // rows))
+        columns = synthetic_cohort(model_obj, rows)
+        records = columns_to_records(columns)
+
+        # preprocessing may convert values in place, so every run gets fresh copies
+        copies = lambda: [dict(record) for record in records]  # noqa: E731
+        results.append(summarize(model_name, "preprocess", rows,
+                                 measure(model_obj._preprocess, stage_repeats, copies)))
+        preprocessed = model_obj._preprocess(copies())
+
+        if rows <= single_max_rows:
+            results.append(summarize(model_name, "score_single", rows, measure(
+                lambda _: [model_obj._calculate_probability_single(record) for record in preprocessed],
+                stage_repeats)))
+        results.append(summarize(model_name, "score_batch", rows, measure(
+            lambda _: model_obj._calculate_probability_batch(preprocessed), stage_repeats)))
+        results.append(summarize(model_name, "predict_columns", rows, measure(
+            lambda _: model_obj.predict_columns(columns), stage_repeats)))
+
+        if client is not None and rows <= http_max_rows:
+            body = json.dumps(records[0] if rows == 1 else records).encode()
+            results.append(summarize(model_name, "http_predict", rows, http_durations(
+                client, f"/models/{model_name}/predict", body, stage_repeats)))
+
+        for result in results[start:]:
+            print(f"{model_name:<24} {result['stage']:<16} {rows:>8} rows  p50 {result['p50_seconds'] * 1000:10.3f} ms"
+                  f"  p99 {result['p99_seconds'] * 1000:10.3f} ms  {result['rows_per_second'] or 0:14.0f} rows/s")
+    return results
+
+
+def make_client(specs):
+    """
+    Create an in-process ASGI client for the service, serving the benchmarked models under /models/{name}.
+    """
+    try:
+        import httpx
+    except ImportError:
+        print("httpx is not installed, skipping the http_predict stage")
+        return None
+    os.environ["MODELS"] = ",".join(f"{name}={spec}" for name, spec in specs.items())
+    import main
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://benchmark")
+
+
+def compare(results, baseline_path, tolerance):
+    """
+    Compare p50 latencies with a baseline result file.
+
+    Returns:
+    - regressions: list of messages, one per stage that got slower than the tolerance allows
+    """
+    with open(baseline_path, 'r') as f:
+        baseline = {(result["model"], result["stage"], result["rows"]): result for result in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        previous = baseline.get((result["model"], result["stage"], result["rows"]))
+        if previous is not None and result["p50_seconds"] > previous["p50_seconds"] * (1 + tolerance):
+            regressions.append(f"{result['model']} {result['stage']} {result['rows']} rows: p50 "
+                               f"{previous['p50_seconds'] * 1000:.3f} ms -> {result['p50_seconds'] * 1000:.3f} ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the bundled models on synthetic cohorts.")
+    parser.add_argument("--models", default=DEFAULT_MODELS,
+                        help="comma separated name=spec entries, as in the MODELS environment variable")
+    parser.add_argument("--sizes", default="1,100,10000,100000", help="comma separated cohort sizes")
+    parser.add_argument("--repeats", type=int, default=None,
+                        help="timed runs per stage (default: between 5 and 200, fewer for larger cohorts)")
+    parser.add_argument("--single-max-rows", type=int, default=100000,
+                        help="largest cohort scored record by record")
+    parser.add_argument("--http-max-rows", type=int, default=100000, help="largest cohort sent over HTTP")
+    parser.add_argument("--no-http", action="store_true", help="skip the http_predict stage")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON file for the results")
+    parser.add_argument("--baseline", help="earlier result file to compare the p50 latencies with")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative p50 increase against the baseline")
+    args = parser.parse_args(argv)
+
+    specs = parse_model_specs(args.models)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    client = None if args.no_http else make_client(specs)
+
+    results = []
+    for model_name, spec in specs.items():
+        model_obj = load_model_spec(spec)
+        results.extend(benchmark_model(model_name, model_obj, sizes, args.repeats,
+                                       args.single_max_rows, args.http_max_rows, client))
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "results": results,
+        }, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for regression in regressions:
+            print("Regression:", regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
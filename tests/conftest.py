@@ -0,0 +1,51 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVICE_DIR = os.path.join(REPO_DIR, "willemsen_PEG_tubefeed")
+STIPHOUT_DIR = os.path.join(REPO_DIR, "stiphout_pCR-Clinical")
+VALIDATION_DIR = os.path.join(REPO_DIR, "validation")
+NTCP_PARAMETERS = os.path.join(REPO_DIR, "ntcp_model", "ntcp_model_dysphalgia.json")
+# the service modules import each other by module name, as in the Docker image; the client is
+# imported from the validation directory, as by the notebooks there
+sys.path[:0] = [SERVICE_DIR, STIPHOUT_DIR, VALIDATION_DIR]
+# main.py serves willemsen_tubefeed as its default model, as in the willemsen image
+os.environ.setdefault("MODULE_NAME", "willemsen_tubefeed")
+os.environ.setdefault("CLASS_NAME", "willemsen_tubefeed")
+
+WILLEMSEN_RECORD = {
+    "BMI": 19.5, "WeightLoss": -8, "TF": 1, "PS": 0, "Tumorlocation": 1, "Tclassification": 2,
+    "Nclassification": 2, "Systherapy": 0, "RTdose_subman": 36, "RTdosesalivary": 29,
+}
+STIPHOUT_RECORD = {"cT": 4, "cN": 1, "tLength": 15}
+
+
+def import_service(module_name):
+    """
+    Import a separate copy of main.py, for the endpoints it only registers when the environment
+    (e.g. METRICS_ENABLED or LOCAL_DATA_DIR) asks for them at import.
+    """
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(SERVICE_DIR, "main.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def willemsen_record():
+    return dict(WILLEMSEN_RECORD)
+
+
+@pytest.fixture
+def willemsen():
+    from willemsen_tubefeed import willemsen_tubefeed
+    return willemsen_tubefeed()
+
+
+@pytest.fixture
+def stiphout():
+    from stiphout_pCR_Clinical import stiphout_pCR_Clinical
+    return stiphout_pCR_Clinical()
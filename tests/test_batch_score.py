@@ -0,0 +1,56 @@
+import pytest
+
+from conftest import NTCP_PARAMETERS, WILLEMSEN_RECORD
+
+pd = pytest.importorskip("pandas")
+import batch_score  # noqa: E402
+
+
+def _cohort():
+    records = [dict(WILLEMSEN_RECORD, BMI=15 + index, patient_id=f"p{index}") for index in range(5)]
+    records[3]["BMI"] = 60
+    return records
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_csv_round_trip(tmp_path, willemsen, workers):
+    records = _cohort()
+    input_path, output_path = tmp_path / "cohort.csv", tmp_path / "scored.csv"
+    pd.DataFrame(records).to_csv(input_path, index=False)
+
+    batch_score.main(["willemsen_tubefeed", str(input_path), str(output_path), "--chunk-size", "2",
+                      "--workers", str(workers), "--keep-columns"])
+
+    output = pd.read_csv(output_path)
+    assert list(output["patient_id"]) == [record["patient_id"] for record in records]
+    for index, record in enumerate(records):
+        inputs = {name: value for name, value in record.items() if name != "patient_id"}
+        if index == 3:
+            assert output["error"][index] == "Validation error: Invalid BMI value in item 3: 60"
+            assert pd.isna(output["probability"][index])
+        else:
+            assert output["probability"][index] == pytest.approx(willemsen.predict(inputs))
+            assert pd.isna(output["error"][index])
+
+
+def test_renamed_columns(tmp_path, willemsen):
+    input_path, output_path = tmp_path / "cohort.csv", tmp_path / "scored.csv"
+    pd.DataFrame([WILLEMSEN_RECORD]).rename(columns={"BMI": "bmi"}).to_csv(input_path, index=False)
+    batch_score.main(["willemsen_tubefeed", str(input_path), str(output_path), "--workers", "1",
+                      "--rename", "bmi=BMI"])
+    assert pd.read_csv(output_path)["probability"][0] == pytest.approx(willemsen.predict(dict(WILLEMSEN_RECORD)))
+
+
+def test_missing_columns_are_named(tmp_path):
+    input_path, output_path = tmp_path / "cohort.csv", tmp_path / "scored.csv"
+    pd.DataFrame(_cohort()).to_csv(input_path, index=False)
+    with pytest.raises(SystemExit, match="lacks the input columns Dmean_Oral_cavity, .*Baseline_dysphagia"):
+        batch_score.main([NTCP_PARAMETERS, str(input_path), str(output_path), "--workers", "1"])
+    assert not output_path.exists()
+
+
+def test_one_missing_column_is_named(tmp_path):
+    input_path, output_path = tmp_path / "cohort.csv", tmp_path / "scored.csv"
+    pd.DataFrame([WILLEMSEN_RECORD]).drop(columns=["PS"]).to_csv(input_path, index=False)
+    with pytest.raises(SystemExit, match=r"lacks the input columns PS of the model"):
+        batch_score.main(["willemsen_tubefeed", str(input_path), str(output_path), "--workers", "1"])
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from conftest import WILLEMSEN_RECORD
+from model_validation import (
+    METRICS, _bootstrap_shard, _resample_counts, area_under_curve, bootstrap_intervals, calibration,
+)
+from parallel_scoring import parallel_scorer
+
+
+@pytest.fixture(scope="module")
+def cohort():
+    generator = np.random.default_rng(11)
+    # rounded, so there are tied predictions
+    predictions = np.round(generator.uniform(0.02, 0.98, 150), 2)
+    outcomes = (generator.uniform(size=150) < predictions).astype(np.float64)
+    order = np.argsort(predictions, kind="stable")
+    return predictions[order], outcomes[order]
+
+
+def _point_metrics(predictions, outcomes):
+    intercept, slope = calibration(predictions, outcomes)
+    return {
+        "auc": area_under_curve(predictions, outcomes),
+        "brier": float(np.mean(np.square(predictions - outcomes))),
+        "calibration_intercept": intercept,
+        "calibration_slope": slope,
+        "observed_expected_ratio": outcomes.sum() / predictions.sum(),
+    }
+
+
+def test_a_resample_gives_the_metrics_of_the_resampled_cohort(cohort):
+    predictions, outcomes = cohort
+    seed = np.random.SeedSequence(5)
+    values = _bootstrap_shard(predictions, outcomes, seed, 1)
+    counts = _resample_counts(np.random.default_rng(seed), len(predictions), 1)[0].astype(int)
+    expected = _point_metrics(np.repeat(predictions, counts), np.repeat(outcomes, counts))
+    for metric in METRICS:
+        assert values[metric][0] == pytest.approx(expected[metric], rel=1e-8, abs=1e-10), metric
+
+
+def test_intervals_depend_only_on_the_seed(cohort):
+    predictions, outcomes = cohort
+    first = bootstrap_intervals(predictions, outcomes, resamples=250, seed=3)
+    assert first == bootstrap_intervals(predictions, outcomes, resamples=250, seed=3)
+    assert first != bootstrap_intervals(predictions, outcomes, resamples=250, seed=4)
+    scorer = parallel_scorer(processes=2)
+    try:
+        assert first == bootstrap_intervals(predictions, outcomes, resamples=250, seed=3, map_function=scorer.map)
+    finally:
+        scorer.shutdown()
+
+
+def test_intervals_surround_the_point_metrics(cohort):
+    predictions, outcomes = cohort
+    bootstrap = bootstrap_intervals(predictions, outcomes, resamples=400, confidence=0.9)
+    assert isinstance(bootstrap["seed"], int)
+    assert (bootstrap["resamples"], bootstrap["confidence"]) == (400, 0.9)
+    for metric, value in _point_metrics(predictions, outcomes).items():
+        low, up = bootstrap["intervals"][metric]
+        assert low < value < up, metric
+
+
+def test_undefined_metrics_have_no_interval():
+    bootstrap = bootstrap_intervals(np.array([0.2, 0.4, 0.6]), np.ones(3), resamples=50, seed=1)
+    assert bootstrap["intervals"]["auc"] is None
+    assert bootstrap["intervals"]["brier"] is not None
+
+
+@pytest.fixture(scope="module")
+def client():
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    import main
+    with TestClient(main.app) as client:
+        yield client
+
+
+def _validation_cohort():
+    generator = np.random.default_rng(2)
+    return [dict(WILLEMSEN_RECORD, BMI=round(float(bmi), 1), TF=int(tf), PEG=int(peg))
+            for bmi, tf, peg in zip(generator.uniform(15, 35, 60), generator.integers(0, 2, 60),
+                                    generator.integers(0, 2, 60))]
+
+
+def test_validate_with_bootstrap(client):
+    params = {"outcome": "PEG", "bootstrap": 200, "seed": 7, "confidence": 0.9}
+    summary = client.post("/validate", params=params, json=_validation_cohort()).json()
+    assert summary["records"] == 60
+    bootstrap = summary["bootstrap"]
+    assert (bootstrap["resamples"], bootstrap["confidence"], bootstrap["seed"]) == (200, 0.9, 7)
+    assert set(bootstrap["intervals"]) == set(METRICS)
+    low, up = bootstrap["intervals"]["auc"]
+    assert low < summary["auc"] < up
+    assert client.post("/validate", params=params, json=_validation_cohort()).json() == summary
+    assert "bootstrap" not in client.post("/validate", params={"outcome": "PEG"}, json=_validation_cohort()).json()
+
+
+@pytest.mark.parametrize("params", [
+    {"bootstrap": -1},
+    {"bootstrap": 100001},
+    {"bootstrap": 10, "confidence": 1},
+    {"bootstrap": 10, "confidence": 0},
+])
+def test_validate_bootstrap_parameters_are_bounded(client, params):
+    response = client.post("/validate", params={"outcome": "PEG", **params}, json=_validation_cohort())
+    assert response.status_code == 422
@@ -0,0 +1,46 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from conftest import STIPHOUT_DIR
+
+import cli_build
+
+
+def _stage(tmp_path, monkeypatch, python_file, module_name):
+    monkeypatch.chdir(STIPHOUT_DIR)
+    context_dir = tmp_path / "context"
+    context_dir.mkdir()
+    cli_build.stage_context(python_file, module_name, str(context_dir))
+    return context_dir
+
+
+def test_context_holds_every_file_the_dockerfile_copies(tmp_path, monkeypatch):
+    context_dir = _stage(tmp_path, monkeypatch, "stiphout_pCR_Clinical.py", "stiphout_pCR_Clinical")
+    dockerfile = cli_build.render_dockerfile(
+        "stiphout_pCR_Clinical.py", "stiphout_pCR_Clinical", "stiphout_pCR_Clinical")
+    copied = re.findall(r"^COPY (\S+) ", dockerfile, re.MULTILINE)
+    assert "feature_schema.py" in copied
+    assert sorted(os.listdir(context_dir)) == sorted(copied)
+    assert "ENV CLASS_NAME=stiphout_pCR_Clinical" in dockerfile
+
+
+def test_staged_service_runs_without_the_repository(tmp_path, monkeypatch):
+    context_dir = _stage(tmp_path, monkeypatch, "stiphout_pCR_Clinical.py", "stiphout_pCR_Clinical")
+    env = dict(os.environ, MODULE_NAME="stiphout_pCR_Clinical", CLASS_NAME="stiphout_pCR_Clinical")
+    env.pop("PYTHONPATH", None)
+    # importing main imports every service module; scoring a record loads the model with its schema
+    result = subprocess.run(
+        [sys.executable, "-c", "import main; print(main.registry.get().predict({'cT': 4, 'cN': 1, 'tLength': 15}))"],
+        cwd=context_dir, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert 0 < float(result.stdout) < 1
+
+
+def test_missing_model_metadata_fails_staging(tmp_path, monkeypatch):
+    with pytest.raises(FileNotFoundError):
+        _stage(tmp_path, monkeypatch, "stiphout_pCR_Clinical.py", "missing_model")
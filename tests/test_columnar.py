@@ -0,0 +1,93 @@
+import copy
+
+import pytest
+
+from conftest import WILLEMSEN_RECORD
+
+pa = pytest.importorskip("pyarrow")
+pytest.importorskip("httpx")
+import pyarrow.ipc  # noqa: E402
+import pyarrow.parquet  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import columnar  # noqa: E402
+import main  # noqa: E402
+from columnar import ARROW_STREAM_MEDIA_TYPE  # noqa: E402
+
+RECORDS = [dict(WILLEMSEN_RECORD, BMI=15 + index, TF=index % 2) for index in range(5)]
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+def _arrow(records):
+    table = pa.Table.from_pylist(records)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _parquet(records):
+    sink = pa.BufferOutputStream()
+    pa.parquet.write_table(pa.Table.from_pylist(records), sink)
+    return sink.getvalue().to_pybytes()
+
+
+def _read_arrow(body):
+    return pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+
+
+def test_arrow_input_gives_arrow_probabilities(client, willemsen):
+    response = client.post("/predict", content=_arrow(RECORDS), headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+    table = _read_arrow(response.content)
+    assert table.column_names == ["probability"]
+    assert table.column("probability").to_pylist() == pytest.approx(willemsen.predict(copy.deepcopy(RECORDS)))
+
+
+def test_parquet_input_with_json_output(client, willemsen):
+    response = client.post("/predict", content=_parquet(RECORDS),
+                           headers={"Content-Type": "application/vnd.apache.parquet", "Accept": "application/json"})
+    assert response.status_code == 200
+    assert response.json()["probability"] == pytest.approx(willemsen.predict(copy.deepcopy(RECORDS)))
+
+
+def test_echo_returns_the_input_columns(client, willemsen):
+    response = client.post("/predict", params={"echo": "true"}, content=_arrow(RECORDS),
+                           headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE})
+    table = _read_arrow(response.content)
+    assert table.column_names == list(WILLEMSEN_RECORD) + ["probability"]
+    assert table.column("BMI").to_pylist() == [record["BMI"] for record in RECORDS]
+
+    response = client.post("/predict", params={"echo": "true"}, content=_arrow(RECORDS),
+                           headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE, "Accept": "application/json"})
+    results = response.json()
+    assert [{key: value for key, value in result.items() if key != "probability"} for result in results] == RECORDS
+    assert [result["probability"] for result in results] == pytest.approx(willemsen.predict(copy.deepcopy(RECORDS)))
+
+
+def test_invalid_value_gives_the_error_of_json_input(client, willemsen):
+    records = RECORDS[:2] + [dict(WILLEMSEN_RECORD, BMI=60)]
+    response = client.post("/predict", content=_arrow(records), headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE})
+    assert response.status_code == 200
+    assert response.json() == willemsen.predict(copy.deepcopy(records))
+    assert response.json() == {"error": "Validation error: Invalid BMI value in item 2: 60"}
+
+
+def test_unreadable_body_is_an_error(client):
+    response = client.post("/predict", content=b"not arrow", headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE})
+    assert response.status_code == 200
+    assert response.json()["error"].startswith(
+        f"Validation error: Could not read {ARROW_STREAM_MEDIA_TYPE} input: ")
+
+
+def test_columnar_input_without_pyarrow_is_unsupported(client, monkeypatch):
+    monkeypatch.setattr(columnar, "pa", None)
+    response = client.post("/predict", content=_arrow(RECORDS), headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE})
+    assert response.status_code == 415
+    assert response.json() == {"detail": "pyarrow is required for Arrow and Parquet input"}
@@ -0,0 +1,74 @@
+"""
+Error messages of the willemsen and stiphout models, as returned by the original implementation.
+Clients match on these messages, so the faster validation has to return them unchanged.
+"""
+import copy
+
+import pytest
+
+from conftest import STIPHOUT_RECORD, WILLEMSEN_RECORD
+
+
+def _with(**changes):
+    return dict(WILLEMSEN_RECORD, **changes)
+
+
+def _predict(model_obj, input_object):
+    # predict transforms the records in place
+    return model_obj.predict(copy.deepcopy(input_object))
+
+
+def _without(name):
+    return {key: value for key, value in WILLEMSEN_RECORD.items() if key != name}
+
+
+@pytest.mark.parametrize("input_object, expected", [
+    (_with(BMI=60), "Validation error: Invalid BMI value in item: 60 (Allowed range: 5.0-40.0)"),
+    (_with(BMI=5.0), "Validation error: Invalid BMI value in item: 5.0 (Allowed range: 5.0-40.0)"),
+    (_with(BMI=True), "Validation error: Invalid BMI value in item: True (Allowed range: 5.0-40.0)"),
+    ([WILLEMSEN_RECORD, _with(BMI=60)], "Validation error: Invalid BMI value in item 1: 60"),
+    ([_with(BMI=True), _with(WeightLoss=False)], "Validation error: Invalid BMI value in item 0: True"),
+    (_with(TF="1"), "Validation error: Invalid TF value: 1"),
+    ([WILLEMSEN_RECORD, _with(TF="1")], "Validation error: Invalid TF value in item 1: 1"),
+    (_with(Tclassification="x"), "Validation error: invalid literal for int() with base 10: 'x'"),
+    (_without("BMI"), "Validation error: Missing BMI"),
+    ([WILLEMSEN_RECORD, _without("BMI")], "Validation error: Missing BMI in item 1"),
+    (_with(BMI="a"), "Type error: Invalid BMI type, expected a number"),
+    (_with(BMI=None), "Type error: Invalid BMI type, expected a number"),
+    ([WILLEMSEN_RECORD, _with(BMI=None)], "Type error: Invalid BMI type in item 1, expected a number"),
+    (_with(WeightLoss=40), "Validation error: Invalid WeightLoss value: 40"),
+    ([WILLEMSEN_RECORD, _with(WeightLoss=40)], "Validation error: Invalid WeightLoss value in item 1: 40"),
+    ([WILLEMSEN_RECORD, 3], "Type error: argument of type 'int' is not iterable"),
+])
+def test_willemsen_error_messages(willemsen, input_object, expected):
+    assert _predict(willemsen, input_object) == {"error": expected}
+
+
+@pytest.mark.parametrize("records, expected", [
+    # the features are checked one by one, each in every record
+    ([_with(WeightLoss=40), _with(BMI=60)], "Validation error: Invalid BMI value in item 1: 60"),
+    ([_with(BMI=60), _with(Tclassification=9)], "Validation error: Invalid Tclassification value in item 1: 9"),
+    ([_with(RTdose_subman="x"), _with(PS=7)], "Validation error: Invalid PS value in item 1: 7"),
+])
+def test_willemsen_reports_the_first_invalid_feature(willemsen, records, expected):
+    assert _predict(willemsen, records) == {"error": expected}
+
+
+@pytest.mark.parametrize("changes", [{"WeightLoss": True}, {"RTdose_subman": True}, {"Systherapy": True}])
+def test_willemsen_accepts_booleans_as_numbers(willemsen, changes):
+    numbers = {name: int(value) for name, value in changes.items()}
+    expected = _predict(willemsen, _with(**numbers))
+    assert _predict(willemsen, _with(**changes)) == expected
+    assert _predict(willemsen, [WILLEMSEN_RECORD, _with(**changes)])[1] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("input_object, expected", [
+    (dict(STIPHOUT_RECORD, cT=5), "Validation error: Invalid cT value in object: 5 (Allowed range: 0.0-4.0)"),
+    (dict(STIPHOUT_RECORD, cN=True), "Type error: Invalid cN type in object, expected a number"),
+    ({"cT": 1}, "Validation error: Missing tLength"),
+    ([STIPHOUT_RECORD, dict(STIPHOUT_RECORD, tLength=-1)],
+     "Validation error: Invalid tLength value in item 1: -1 (Allowed range: 0.0-1000.0)"),
+    ([STIPHOUT_RECORD, 3], "Type error: Invalid input at item 1: expected a dict"),
+])
+def test_stiphout_error_messages(stiphout, input_object, expected):
+    assert _predict(stiphout, input_object) == {"error": expected}
@@ -0,0 +1,74 @@
+import pytest
+
+from feature_schema import feature_schema, feature_type_error, feature_value_error
+
+METADATA = {
+    "Input data": [
+        {"Description": {"@value": "age"}, "Minimum - for numerical": {"@value": "18"},
+         "Maximum - for numerical": {"@value": "90"}},
+        {"Description": {"@value": "stage"}, "Categories": [
+            {"Identification for category used in model": {"@value": "1"}},
+            {"Identification for category used in model": {"@value": "2"}},
+        ]},
+        {"Description": {"@value": "smoker"}, "Type of input": {"@value": "categorical"}},
+        {"Description": {"@value": ""}},
+        "not a feature",
+    ],
+}
+
+
+@pytest.fixture
+def schema():
+    return feature_schema.from_metadata(METADATA, transforms={"stage": lambda value: value * 10},
+                                        optional_features=["smoker"])
+
+
+def test_metadata_is_compiled_into_feature_specs(schema):
+    assert schema.names == ["age", "stage", "smoker"]
+    assert (schema["age"].type, schema["age"].minimum, schema["age"].maximum) == ("numerical", 18.0, 90.0)
+    assert schema["stage"].type == "categorical"
+    assert schema["stage"].categories == frozenset([1, 2])
+    assert schema["smoker"].categories is None
+    assert not schema["smoker"].required
+    assert "weight" not in schema
+    with pytest.raises(ValueError, match="No metadata found for feature 'weight'"):
+        schema["weight"]
+
+
+def test_invalid_bound_is_rejected():
+    metadata = {"Input data": [{"Description": {"@value": "age"}, "Minimum - for numerical": {"@value": "x"}}]}
+    with pytest.raises(ValueError, match="Invalid Minimum - for numerical value for feature 'age'"):
+        feature_schema.from_metadata(metadata)
+
+
+def test_valid_record_is_transformed_in_place(schema):
+    record = {"age": 40, "stage": 2}
+    assert schema.validate_record(record) is record
+    assert record == {"age": 40, "stage": 20}
+    assert schema.validate_record(schema.example_record()) == {"age": 54.0, "stage": 10}
+
+
+@pytest.mark.parametrize("record, error, feature, reason, message", [
+    ({"stage": 1}, feature_value_error, "age", "missing", "Missing age in item 3"),
+    ({"age": 91, "stage": 1}, feature_value_error, "age", "range",
+     "Invalid age value in item 3: 91 (Allowed range: 18.0-90.0)"),
+    ({"age": 40, "stage": 3}, feature_value_error, "stage", "category", "Invalid stage value in item 3: 3"),
+    ({"age": True, "stage": 1}, feature_type_error, "age", "type", "Invalid age type in item 3, expected a number"),
+])
+def test_invalid_record_names_feature_and_reason(schema, record, error, feature, reason, message):
+    with pytest.raises(error) as excinfo:
+        schema.validate_record(record, index=3)
+    assert str(excinfo.value) == message
+    assert (excinfo.value.feature, excinfo.value.reason) == (feature, reason)
+
+
+def test_record_must_be_a_dict(schema):
+    with pytest.raises(TypeError, match="Invalid input at item 2: expected a dict"):
+        schema.validate_record([40, 1], index=2)
+
+
+def test_schema_is_compiled_once_per_model_class(willemsen, stiphout):
+    from willemsen_tubefeed import willemsen_tubefeed
+    assert willemsen.get_feature_schema() is willemsen_tubefeed().get_feature_schema()
+    assert willemsen.get_feature_schema() is not stiphout.get_feature_schema()
+    assert "BMI" in willemsen.get_feature_schema()
@@ -0,0 +1,78 @@
+import json
+
+import numpy as np
+import pytest
+
+import json_codec
+from conftest import WILLEMSEN_RECORD
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return json_codec
+
+
+def test_loads_bytes_and_str(codec):
+    document = {"BMI": 19.5, "records": [1, -8, None, True], "name": "é"}
+    assert codec.loads(json.dumps(document).encode()) == document
+    assert codec.loads(json.dumps(document)) == document
+
+
+@pytest.mark.parametrize("body", [b"", b"{", b"[1,]", b"\xff"])
+def test_invalid_json_is_a_value_error(codec, body):
+    with pytest.raises(ValueError):
+        codec.loads(body)
+
+
+def test_dumps_numpy_values(codec):
+    value = {"probability": np.array([0.25, 0.5]), "count": np.int64(3), "mean": np.float64(0.125), "ok": True}
+    encoded = codec.dumps(value)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == {"probability": [0.25, 0.5], "count": 3, "mean": 0.125, "ok": True}
+
+
+def test_dumps_keeps_float_precision(codec):
+    values = [0.1, 1 / 3, 2.5e-300, 0.9999999999999999]
+    assert json.loads(codec.dumps(values)) == values
+
+
+def test_dumps_rejects_unknown_types(codec):
+    with pytest.raises(TypeError):
+        codec.dumps({"value": object()})
+
+
+def test_json_response(codec):
+    response = codec.json_response([np.float64(0.5), {"error": "Validation error"}])
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [0.5, {"error": "Validation error"}]
+
+
+@pytest.fixture(scope="module")
+def client():
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    import main
+    with TestClient(main.app) as client:
+        yield client
+
+
+def test_predict_answers_with_the_codec(client, willemsen):
+    response = client.post("/predict", content=json.dumps([WILLEMSEN_RECORD]),
+                           headers={"Content-Type": "application/json"})
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == pytest.approx(willemsen.predict([dict(WILLEMSEN_RECORD)]))
+
+
+@pytest.mark.parametrize("body, detail", [
+    (b"{\"BMI\": ", "Request body is not valid JSON"),
+    (b"42", "Request body must be a JSON object or array"),
+])
+def test_predict_rejects_bodies_the_codec_cannot_use(client, body, detail):
+    response = client.post("/predict", content=body, headers={"Content-Type": "application/json"})
+    assert response.status_code == 422
+    assert response.json() == {"detail": detail}
@@ -0,0 +1,114 @@
+import copy
+import os
+
+import numpy as np
+import pytest
+
+import local_batch
+from conftest import WILLEMSEN_RECORD, import_service
+
+RECORDS = [dict(WILLEMSEN_RECORD, BMI=15.5 + index, TF=index % 2) for index in range(6)]
+
+
+def _structured(records):
+    names = list(records[0])
+    array = np.empty(len(records), dtype=[(name, np.float64) for name in names])
+    for name in names:
+        array[name] = [record[name] for record in records]
+    return array
+
+
+def _write_arrow(path, records, stream=False):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    table = pa.Table.from_pylist(records)
+    writer = pa.ipc.new_stream if stream else pa.ipc.new_file
+    with pa.OSFile(str(path), "wb") as sink, writer(sink, table.schema) as file_writer:
+        file_writer.write_table(table)
+
+
+def test_paths_stay_inside_the_data_directory(tmp_path):
+    (tmp_path / "cohorts").mkdir()
+    assert local_batch.resolve_path(str(tmp_path), "cohorts/a.npy") == str(tmp_path / "cohorts" / "a.npy")
+    for path in ["../a.npy", "cohorts/../../a.npy", "/etc/passwd"]:
+        with pytest.raises(ValueError, match="Path is outside the local data directory"):
+            local_batch.resolve_path(str(tmp_path / "cohorts"), path)
+
+
+def test_symbolic_links_out_of_the_data_directory_are_refused(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (tmp_path / "secret.npy").write_bytes(b"")
+    os.symlink(tmp_path / "secret.npy", data_dir / "link.npy")
+    with pytest.raises(ValueError, match="Path is outside the local data directory: link.npy"):
+        local_batch.resolve_path(str(data_dir), "link.npy")
+
+
+@pytest.mark.parametrize("file_name, write", [
+    ("cohort.npy", lambda path, records: np.save(path, _structured(records))),
+    ("cohort.arrow", _write_arrow),
+    ("cohort.arrows", lambda path, records: _write_arrow(path, records, stream=True)),
+])
+def test_columns_are_read_from_memory_mapped_files(tmp_path, file_name, write):
+    write(tmp_path / file_name, RECORDS)
+    batch = local_batch.read_columns(str(tmp_path / file_name))
+    assert len(batch) == 6
+    assert batch.to_records() == RECORDS
+
+
+def test_unsupported_input_files_are_refused(tmp_path):
+    np.save(tmp_path / "plain.npy", np.zeros(3))
+    with pytest.raises(ValueError, match="must hold a structured array"):
+        local_batch.read_columns(str(tmp_path / "plain.npy"))
+    with pytest.raises(ValueError, match="Unsupported input file type: .csv"):
+        local_batch.read_columns(str(tmp_path / "cohort.csv"))
+
+
+def test_probabilities_are_written_as_npy(tmp_path):
+    local_batch.write_probabilities(str(tmp_path / "out.npy"), np.array([0.25, 0.5]))
+    assert np.load(tmp_path / "out.npy", mmap_mode="r").tolist() == [0.25, 0.5]
+    assert os.listdir(tmp_path) == ["out.npy"]
+    with pytest.raises(ValueError, match="Unsupported output file type: .csv, use .npy"):
+        local_batch.write_probabilities(str(tmp_path / "out.csv"), [0.5])
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+    # main only registers /predict/local with a LOCAL_DATA_DIR
+    monkeypatch.setenv("LOCAL_DATA_DIR", str(tmp_path / "data"))
+    (tmp_path / "data").mkdir()
+    with TestClient(import_service("main_with_local_data").app) as client:
+        yield client
+
+
+def test_local_file_is_scored(client, tmp_path, willemsen):
+    np.save(tmp_path / "data" / "cohort.npy", _structured(RECORDS))
+    response = client.post("/predict/local", json={"input": "cohort.npy", "output": "cohort_probabilities.npy"})
+    assert response.json() == {"input": "cohort.npy", "output": "cohort_probabilities.npy", "rows": 6}
+    probabilities = np.load(tmp_path / "data" / "cohort_probabilities.npy").tolist()
+    assert probabilities == pytest.approx(willemsen.predict(copy.deepcopy(RECORDS)), rel=1e-12)
+
+
+def test_invalid_local_file_gives_the_validation_error(client, tmp_path):
+    np.save(tmp_path / "data" / "cohort.npy", _structured(RECORDS[:2] + [dict(WILLEMSEN_RECORD, BMI=60.5)]))
+    response = client.post("/predict/local", json={"input": "cohort.npy", "output": "out.npy"})
+    assert response.json() == {"error": "Validation error: Invalid BMI value in item 2: 60.5"}
+    assert not (tmp_path / "data" / "out.npy").exists()
+
+    response = client.post("/predict/local", json={"input": "missing.npy", "output": "out.npy"})
+    assert response.json()["error"].startswith("Validation error: Could not read input file: ")
+
+
+@pytest.mark.parametrize("body, status_code, detail", [
+    ({"input": "../cohort.npy", "output": "out.npy"}, 403, "Path is outside the local data directory: ../cohort.npy"),
+    ({"input": "cohort.npy", "output": "/tmp/out.npy"}, 403, "Path is outside the local data directory: /tmp/out.npy"),
+    ({"input": "cohort.npy", "output": "out.csv"}, 422, "The output file must be a .npy file"),
+    ({"input": "cohort.npy"}, 422, 'Request body must be {"input": path, "output": path}'),
+])
+def test_local_requests_are_checked(client, tmp_path, body, status_code, detail):
+    np.save(tmp_path / "cohort.npy", _structured(RECORDS))
+    response = client.post("/predict/local", json=body)
+    assert response.status_code == status_code
+    assert response.json() == {"detail": detail}
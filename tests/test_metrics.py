@@ -0,0 +1,97 @@
+import re
+
+import pytest
+
+import metrics
+from conftest import WILLEMSEN_RECORD, import_service
+
+pytest.importorskip("httpx")
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+def _value(text, sample):
+    match = re.search("^" + re.escape(sample) + r" (\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else None
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(metrics, "enabled", True)
+
+
+def test_counter_and_histogram_rendering():
+    registry = metrics.metrics_registry()
+    errors = registry.counter("errors_total", "Errors.", ("feature",))
+    sizes = registry.histogram("sizes", "Sizes.", ("model",), buckets=(1, 10))
+    errors.inc(('say "hi"\n',), 2)
+    for value in (1, 5, 50):
+        sizes.observe(("m",), value)
+    assert registry.render().splitlines() == [
+        "# HELP errors_total Errors.",
+        "# TYPE errors_total counter",
+        'errors_total{feature="say \\"hi\\"\\n"} 2',
+        "# HELP sizes Sizes.",
+        "# TYPE sizes histogram",
+        'sizes_bucket{model="m",le="1"} 1',
+        'sizes_bucket{model="m",le="10"} 2',
+        'sizes_bucket{model="m",le="+Inf"} 3',
+        'sizes_sum{model="m"} 56.0',
+        'sizes_count{model="m"} 3',
+    ]
+
+
+def test_middleware_labels_requests_by_endpoint_and_status(enabled):
+    app = FastAPI()
+    app.add_middleware(metrics.metrics_middleware)
+
+    @app.post("/labelled")
+    async def labelled_endpoint(request: Request):
+        return {"size": len(await request.body())}
+
+    with TestClient(app) as client:
+        client.post("/labelled", content=b"x" * 300)
+        client.post("/labelled")
+        client.get("/missing")
+    text = metrics.registry.render()
+    assert _value(text, 'faivor_request_duration_seconds_count{endpoint="labelled_endpoint",status="200"}') == 2
+    assert _value(text, 'faivor_request_body_bytes_sum{endpoint="labelled_endpoint"}') == 300
+    # requests without a route keep a fixed label instead of their path
+    assert _value(text, 'faivor_request_duration_seconds_count{endpoint="unknown",status="404"}') >= 1
+    assert "/missing" not in text
+
+
+def test_helpers_do_nothing_when_disabled(monkeypatch, willemsen):
+    monkeypatch.setattr(metrics, "enabled", False)
+    before = metrics.registry.render()
+    assert metrics.stage_timer(willemsen, "score") is metrics.stage_timer(None, "parse")
+    willemsen.predict(dict(WILLEMSEN_RECORD, BMI=60))
+    metrics.observe_records(willemsen, 10)
+    assert metrics.registry.render() == before
+
+
+@pytest.fixture
+def service(monkeypatch, enabled):
+    # main registers /metrics and the middleware at import, so a copy is imported with metrics on
+    with TestClient(import_service("main_with_metrics").app) as client:
+        yield client
+
+
+def test_metrics_endpoint_reports_stages_records_and_errors(service, willemsen):
+    label = metrics.model_label(willemsen)
+    before = metrics.registry.render()
+    service.post("/predict", json=[WILLEMSEN_RECORD, WILLEMSEN_RECORD])
+    service.post("/predict", json=dict(WILLEMSEN_RECORD, BMI=60))
+    response = service.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == metrics.PROMETHEUS_MEDIA_TYPE
+    text = response.text
+
+    def increase(sample):
+        return _value(text, sample) - (_value(before, sample) or 0)
+
+    assert increase(f'faivor_scored_records_total{{model="{label}"}}') == 2
+    assert increase(f'faivor_prediction_errors_total{{model="{label}",feature="BMI",error_type="range"}}') == 1
+    assert increase(f'faivor_request_records_count{{model="{label}"}}') == 2
+    assert increase(f'faivor_stage_duration_seconds_count{{model="{label}",stage="score"}}') == 1
+    assert increase('faivor_request_duration_seconds_count{endpoint="predict",status="200"}') == 2
@@ -0,0 +1,150 @@
+import socket
+import threading
+import time
+from typing import List, Union
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from conftest import WILLEMSEN_RECORD
+
+pytest.importorskip("requests")
+uvicorn = pytest.importorskip("uvicorn")
+
+from model_client import model_client  # noqa: E402
+
+
+def _older_service(model_obj):
+    """
+    The service as it was before columnar input and partial results: /predict takes a JSON
+    dictionary or list, and answers {"error": ...} for a whole list with an invalid record.
+    """
+    app = FastAPI()
+
+    @app.post("/predict")
+    def predict(data: Union[dict, List[dict]]):
+        return model_obj.predict(data)
+
+    return app
+
+
+def _json_only_service(model_obj):
+    """
+    A service without an OpenAPI document that answers 422 on a body that is not JSON.
+    """
+    app = FastAPI(openapi_url=None)
+
+    @app.post("/predict")
+    async def predict(request: Request):
+        try:
+            body = await request.json()
+        except ValueError:
+            return JSONResponse(status_code=422, content={"detail": "Request body is not valid JSON"})
+        return model_obj.predict_records(body) if isinstance(body, list) else model_obj.predict(body)
+
+    return app
+
+
+def _failing_first(app, status_code, paths=("/predict",)):
+    """
+    Wrap an ASGI app so that the first request to one of the paths fails with status_code.
+    """
+    failures = [status_code]
+
+    async def wrapped(scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in paths and failures:
+            await send({"type": "http.response.start", "status": failures.pop(),
+                        "headers": [(b"content-type", b"application/json")]})
+            await send({"type": "http.response.body", "body": b'{"detail": "Service Unavailable"}'})
+            return
+        await app(scope, receive, send)
+
+    return wrapped
+
+
+class _server:
+    def __init__(self, app):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.server = uvicorn.Server(uvicorn.Config(app, port=self.port, log_level="critical"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline:
+                raise TimeoutError("The test service did not start")
+            time.sleep(0.01)
+        return f"http://127.0.0.1:{self.port}"
+
+    def __exit__(self, *exc_info):
+        self.server.should_exit = True
+        self.thread.join()
+
+
+def _cohort(rows):
+    return [dict(WILLEMSEN_RECORD, BMI=10 + index % 20) for index in range(rows)]
+
+
+@pytest.mark.parametrize("make_app", [_older_service, _json_only_service])
+def test_client_falls_back_to_json(willemsen, make_app):
+    pandas = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    records = _cohort(30)
+    expected = willemsen.predict([dict(record) for record in records])
+    with _server(make_app(willemsen)) as url, model_client(url, batch_size=10) as client:
+        assert client.predict_many(pandas.DataFrame(records)) == pytest.approx(expected)
+        assert not client._arrow
+
+
+def test_client_rejects_a_batch_error(willemsen):
+    records = _cohort(30)
+    records[12]["BMI"] = 60
+    with _server(_older_service(willemsen)) as url, model_client(url, batch_size=10) as client:
+        with pytest.raises(RuntimeError, match="Invalid BMI value in item 2: 60"):
+            client.predict_many(records)
+
+
+def test_client_keeps_arrow_after_it_was_accepted(willemsen):
+    pandas = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    import main
+
+    records = _cohort(30)
+    with _server(main.app) as url, model_client(url, batch_size=10) as client:
+        client.wait_until_ready(timeout=30)
+        probabilities = client.predict_many(pandas.DataFrame(records))
+        assert client._arrow
+    assert probabilities == pytest.approx(willemsen.predict([dict(record) for record in records]))
+
+
+def test_client_retries_a_busy_service_with_arrow(willemsen):
+    pandas = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    import main
+
+    records = _cohort(10)
+    with _server(_failing_first(main.app, 503)) as url, model_client(url, backoff=0) as client:
+        client.wait_until_ready(timeout=30)
+        probabilities = client.predict_many(pandas.DataFrame(records))
+        assert client._arrow
+    assert probabilities == pytest.approx(willemsen.predict([dict(record) for record in records]))
+
+
+def test_client_keeps_arrow_after_a_server_error(willemsen):
+    pandas = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    requests = pytest.importorskip("requests")
+    import main
+
+    records = _cohort(10)
+    with _server(_failing_first(main.app, 500)) as url, model_client(url, backoff=0) as client:
+        client.wait_until_ready(timeout=30)
+        with pytest.raises(requests.HTTPError, match="500"):
+            client.predict_many(pandas.DataFrame(records))
+        assert client._arrow
+        assert client.predict_many(pandas.DataFrame(records)) == pytest.approx(
+            willemsen.predict([dict(record) for record in records]))
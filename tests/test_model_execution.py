@@ -0,0 +1,94 @@
+import math
+
+import numpy as np
+import pytest
+
+from model_execution import INVERSE_LINK_FUNCTIONS, _inverse_probit, _sigmoid, logistic_regression
+from model_execution_default import model_execution_default
+
+
+def _normal_cdf(value):
+    return 0.5 * math.erfc(-value / math.sqrt(2))
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0.0, 0.5),
+    (1.0, 0.8413447460685429),
+    (-1.959963984540054, 0.025),
+    (3.0, 0.9986501019683699),
+    (-8.0, 6.22096057427178e-16),
+    (-20.0, 2.7536241186062337e-89),
+])
+def test_inverse_probit_known_values(value, expected):
+    assert _inverse_probit(np.array([value]))[0] == pytest.approx(expected, rel=1e-13)
+
+
+def test_inverse_probit_matches_erfc():
+    values = np.linspace(-37, 37, 20001)
+    expected = np.array([_normal_cdf(value) for value in values])
+    np.testing.assert_allclose(_inverse_probit(values), expected, rtol=1e-13, atol=0)
+
+
+def test_inverse_probit_edge_values():
+    result = _inverse_probit(np.array([np.inf, -np.inf, np.nan, 40.0, -40.0]))
+    assert result[0] == 1.0 and result[1] == 0.0 and np.isnan(result[2])
+    assert result[3] == 1.0 and 0.0 <= result[4] < 1e-300
+    assert _inverse_probit(np.zeros((2, 3))).shape == (2, 3)
+    assert _inverse_probit(np.array([])).shape == (0,)
+
+
+def test_sigmoid_does_not_overflow():
+    with np.errstate(over="raise"):
+        result = _sigmoid(np.array([-1000.0, 0.0, 1000.0]))
+    np.testing.assert_allclose(result, [0.0, 0.5, 1.0])
+
+
+@pytest.mark.parametrize("model_type, link", [
+    ("linear_regression", "identity"),
+    ("logistic_regression", "logit"),
+    ("poisson_regression", "log"),
+    ("probit_regression", "probit"),
+])
+def test_parameter_file_models(model_type, link):
+    model_obj = model_execution_default(model_parameters={
+        "model_type": model_type, "model_name": "test", "model_uri": "test",
+        "intercept": -0.5, "covariate_weights": {"a": 0.25, "b": -1.5},
+    })
+    records = [{"a": 1.0, "b": 0.5}, {"a": -2, "b": 1}, {"a": 4, "b": -3}]
+    linear_predictors = np.array([-0.5 + 0.25 * r["a"] - 1.5 * r["b"] for r in records])
+    expected = INVERSE_LINK_FUNCTIONS[link](linear_predictors)
+    assert model_obj.predict([dict(record) for record in records]) == pytest.approx(expected.tolist(), rel=1e-12)
+    assert model_obj.predict(dict(records[0])) == pytest.approx(expected[0], rel=1e-12)
+    assert model_obj.predict({"a": 1.0}) == {"error": "Validation error: Missing b"}
+
+
+LOGISTIC_PARAMETERS = {
+    "model_name": "test", "model_uri": "test", "intercept": -0.5, "covariate_weights": {"a": 0.25, "b": -1.5},
+}
+
+
+def test_logistic_batch_matches_single_records():
+    model_obj = logistic_regression(model_parameters=LOGISTIC_PARAMETERS)
+    rng = np.random.default_rng(3)
+    records = [{"b": float(b), "a": int(a)} for a, b in zip(rng.integers(-50, 50, 200), rng.normal(0, 5, 200))]
+    expected = [model_obj._calculate_probability_single(record) for record in records]
+    assert model_obj.predict(records) == pytest.approx(expected, rel=1e-12, abs=1e-300)
+    assert model_obj.predict([]) == []
+
+
+def test_logistic_weights_follow_replaced_parameters():
+    model_obj = logistic_regression(model_parameters=LOGISTIC_PARAMETERS)
+    assert model_obj.predict([{"a": 0, "b": 0}]) == pytest.approx([_sigmoid(np.array(-0.5))])
+    model_obj._model_parameters = dict(LOGISTIC_PARAMETERS, intercept=1.0)
+    assert model_obj.predict([{"a": 0, "b": 0}]) == pytest.approx([_sigmoid(np.array(1.0))])
+
+
+@pytest.mark.parametrize("record, error", [
+    ({"a": "x", "b": 1}, "Validation error: could not convert string to float: 'x'"),
+    ({"a": None, "b": 1}, "Type error: float() argument must be a string or a real number, not 'NoneType'"),
+    ({"b": 1}, "Unexpected error: 'a'"),
+])
+def test_logistic_batch_errors_match_single_records(record, error):
+    model_obj = logistic_regression(model_parameters=LOGISTIC_PARAMETERS)
+    assert model_obj.predict(dict(record)) == {"error": error}
+    assert model_obj.predict([{"a": 1, "b": 1}, dict(record)]) == {"error": error}
@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import NTCP_PARAMETERS
+from model_registry import model_registry, model_spec_name, multi_model_registry, parse_model_specs
+
+
+def test_model_is_loaded_once_and_shared_by_threads():
+    registry = model_registry("willemsen_tubefeed", "willemsen_tubefeed")
+    assert not registry.loaded
+    with ThreadPoolExecutor(8) as executor:
+        instances = list(executor.map(lambda _: registry.get(), range(32)))
+    assert all(instance is instances[0] for instance in instances)
+    assert registry.get() is instances[0]
+
+
+def test_reload_replaces_the_shared_instance():
+    registry = model_registry("willemsen_tubefeed", "willemsen_tubefeed")
+    instance = registry.get()
+    reloaded = registry.reload()
+    assert reloaded is not instance
+    assert registry.get() is reloaded
+
+
+def test_parameter_file_spec():
+    registry = model_registry(spec=NTCP_PARAMETERS)
+    assert registry.spec == NTCP_PARAMETERS
+    assert registry.get().get_feature_schema() is not None
+
+
+def test_model_spec_names():
+    assert model_spec_name("../stiphout_pCR-Clinical/stiphout_pCR_Clinical.py") == "stiphout_pCR_Clinical"
+    assert model_spec_name("../ntcp_model/ntcp_model_dysphalgia.json:metadata.json") == "ntcp_model_dysphalgia"
+    assert model_spec_name("willemsen_tubefeed:willemsen_tubefeed") == "willemsen_tubefeed"
+
+
+def test_parse_model_specs():
+    specs = parse_model_specs("tubefeed=willemsen_tubefeed,\n stiphout_pCR_Clinical.py")
+    assert specs == {"tubefeed": "willemsen_tubefeed", "stiphout_pCR_Clinical": "stiphout_pCR_Clinical.py"}
+    with pytest.raises(ValueError, match="Duplicate model name: tubefeed"):
+        parse_model_specs("tubefeed=willemsen_tubefeed, tubefeed=stiphout_pCR_Clinical")
+
+
+def test_multi_model_registry_loads_on_first_use():
+    registry = multi_model_registry({"tubefeed": "willemsen_tubefeed"})
+    assert "tubefeed" in registry and not registry.loaded("tubefeed")
+    assert registry.get("tubefeed") is registry.get("tubefeed")
+    assert registry.loaded("tubefeed")
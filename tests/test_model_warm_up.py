@@ -0,0 +1,95 @@
+import time
+
+import pytest
+
+import metrics
+from model_execution import generalized_linear_model
+from model_registry import multi_model_registry
+from model_warm_up import warm_up
+from prediction_cache import prediction_cache
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = prediction_cache(max_entries=10)
+    monkeypatch.setattr(generalized_linear_model, "prediction_cache", cache)
+    monkeypatch.setattr(metrics, "enabled", True)
+    return cache
+
+
+@pytest.mark.parametrize("model_name", ["willemsen", "stiphout"])
+def test_warm_up_is_not_counted_or_cached(request, cache, model_name):
+    model_obj = request.getfixturevalue(model_name)
+    before = metrics.registry.render()
+
+    result = warm_up(model_obj)
+    assert 0 < result["probability"] < 1
+    assert cache.stats()["entries"] == 0
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (0, 0)
+    assert metrics.registry.render() == before
+
+
+def test_warm_up_probability_matches_predict(willemsen):
+    result = warm_up(willemsen)
+    assert result["probability"] == pytest.approx(willemsen.predict(dict(result["record"])))
+
+
+def test_warm_up_reports_a_record_that_cannot_be_scored(willemsen, monkeypatch):
+    def fail(data):
+        raise ValueError("no coefficients")
+
+    monkeypatch.setattr(willemsen, "_calculate_probability_single", fail)
+    with pytest.raises(RuntimeError, match="Warm-up prediction failed: Validation error: no coefficients"):
+        warm_up(willemsen)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    import main
+    monkeypatch.setattr(main, "readiness", {"status": "starting", "models": {}})
+    return main, TestClient
+
+
+def _ready(client):
+    deadline = time.monotonic() + 30
+    response = client.get("/readyz")
+    while response.json()["status"] == "starting" and time.monotonic() < deadline:
+        time.sleep(0.01)
+        response = client.get("/readyz")
+    return response
+
+
+def test_healthz_answers_while_starting(service):
+    main, TestClient = service
+    # without the lifespan the warm-up never runs
+    client = TestClient(main.app)
+    assert client.get("/healthz").json() == {"status": "ok"}
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.json() == {"status": "starting", "models": {}}
+
+
+def test_readyz_reports_the_warm_up(service, willemsen):
+    main, TestClient = service
+    with TestClient(main.app) as client:
+        response = _ready(client)
+    assert response.status_code == 200
+    warm_up = response.json()["models"]["/predict"]
+    assert warm_up["probability"] == pytest.approx(willemsen.predict(dict(warm_up["record"])))
+    assert warm_up["seconds"] >= 0
+
+
+def test_readyz_reports_a_failed_warm_up(service, monkeypatch):
+    main, TestClient = service
+    monkeypatch.setattr(main, "models", multi_model_registry({"broken": "no_such_model_module"}))
+    monkeypatch.setattr(main, "WARM_UP_MODELS", "broken")
+    with TestClient(main.app) as client:
+        response = _ready(client)
+        assert client.get("/healthz").status_code == 200
+    assert response.status_code == 503
+    assert response.json()["status"] == "failed"
+    assert response.json()["detail"].startswith("Warm-up of /models/broken/predict failed: ")
+    assert "/predict" in response.json()["models"]
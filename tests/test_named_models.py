@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from conftest import STIPHOUT_RECORD, WILLEMSEN_RECORD
+from model_registry import multi_model_registry
+
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "models", multi_model_registry({
+        "stiphout": "stiphout_pCR_Clinical",
+        "tubefeed": "willemsen_tubefeed:willemsen_tubefeed",
+    }))
+    with TestClient(main.app) as client:
+        yield client
+
+
+def test_models_are_listed_without_loading_them(client):
+    listed = client.get("/").json()["models"]
+    assert listed[0]["path"] == "/predict"
+    assert listed[1:] == [
+        {"name": "stiphout", "loaded": False, "path": "/models/stiphout/predict",
+         "path_parameters": "/models/stiphout/input_parameters"},
+        {"name": "tubefeed", "loaded": False, "path": "/models/tubefeed/predict",
+         "path_parameters": "/models/tubefeed/input_parameters"},
+    ]
+    assert not main.models.loaded("stiphout")
+
+    client.post("/models/stiphout/predict", json=STIPHOUT_RECORD)
+    stiphout = client.get("/").json()["models"][1]
+    assert stiphout["loaded"] is True
+    assert stiphout["model_name"] == main.models.get("stiphout").get_model_metadata()["model_name"]
+
+
+def test_each_model_answers_under_its_name(client, stiphout, willemsen):
+    response = client.post("/models/stiphout/predict", json=[STIPHOUT_RECORD, STIPHOUT_RECORD])
+    assert response.json() == pytest.approx(stiphout.predict([dict(STIPHOUT_RECORD), dict(STIPHOUT_RECORD)]))
+    response = client.post("/models/tubefeed/predict", json=WILLEMSEN_RECORD)
+    assert response.json() == pytest.approx(willemsen.predict(dict(WILLEMSEN_RECORD)))
+    assert client.get("/models/stiphout/input_parameters").json() == stiphout.get_input_parameters()
+    assert client.get("/models/stiphout/input_schema").json()["anyOf"]
+
+
+def test_named_model_errors_are_its_own(client, stiphout):
+    record = dict(STIPHOUT_RECORD, cT=9)
+    response = client.post("/models/stiphout/predict", json=record).json()
+    assert response == stiphout.predict(dict(record))
+    assert response["error"].startswith("Validation error: Invalid cT value")
+
+
+def test_named_model_stream(client, stiphout):
+    body = "".join(json.dumps(record) + "\n" for record in [STIPHOUT_RECORD, dict(STIPHOUT_RECORD, cN=0)])
+    response = client.post("/models/stiphout/predict/stream", content=body,
+                           headers={"Content-Type": "application/x-ndjson"})
+    results = [json.loads(line) for line in response.text.splitlines()]
+    expected = stiphout.predict([dict(STIPHOUT_RECORD), dict(STIPHOUT_RECORD, cN=0)])
+    assert [result["probability"] for result in results] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("method, path", [
+    ("post", "/models/unknown/predict"),
+    ("post", "/models/unknown/predict/stream"),
+    ("get", "/models/unknown/input_parameters"),
+    ("get", "/models/unknown/input_schema"),
+])
+def test_unknown_model_is_not_found(client, method, path):
+    response = getattr(client, method)(path, **({"json": WILLEMSEN_RECORD} if method == "post" else {}))
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Unknown model: unknown"}
@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+import pytest
+
+from conftest import WILLEMSEN_RECORD
+from ndjson_stream import encode_results, iter_batches, iter_records, ndjson_line_error, request_body
+
+pytest.importorskip("httpx")
+import main  # noqa: E402
+
+
+async def _chunks(data, size):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+def _records(data, size):
+    return asyncio.run(_collect(iter_records(_chunks(data, size))))
+
+
+BODY = (b'{"a": 1}\n\n[{"a": 2}, {"a": 3}]\r\n  \n{"a": "' + b"x" * 300 + b'"}\n{"a": 5}')
+EXPECTED = [{"a": 1}, {"a": 2}, {"a": 3}, {"a": "x" * 300}, {"a": 5}]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, len(BODY)])
+def test_records_do_not_depend_on_the_chunks(size):
+    assert _records(BODY, size) == EXPECTED
+
+
+def test_invalid_line_gets_a_placeholder():
+    records = _records(b'{"a": 1}\n{"a": \n{"a": 2}\n', 5)
+    assert records[0] == {"a": 1} and records[2] == {"a": 2}
+    assert isinstance(records[1], ndjson_line_error)
+    assert records[1].message.startswith("Validation error: Invalid JSON")
+
+
+def test_batches():
+    async def records():
+        for index in range(5):
+            yield index
+
+    assert asyncio.run(_collect(iter_batches(records(), 2))) == [[0, 1], [2, 3], [4]]
+
+
+def test_encode_results():
+    lines = encode_results([0.5, {"error": "Validation error: Missing BMI in item 8"}], 7).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"index": 7, "probability": 0.5}, {"index": 8, "error": "Validation error: Missing BMI in item 8"}]
+
+
+class _request:
+    """
+    Request whose body arrives in the given chunks, followed by a disconnect of the client.
+    """
+
+    def __init__(self, chunks, disconnect_after_body=True):
+        self.messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks[:-1]]
+        self.messages.append({"type": "http.request", "body": chunks[-1], "more_body": False})
+        self.disconnect_after_body = disconnect_after_body
+
+    async def receive(self):
+        if self.messages:
+            return self.messages.pop(0)
+        return {"type": "http.disconnect"}
+
+    async def is_disconnected(self):
+        return not self.messages and self.disconnect_after_body
+
+
+def _lines(records):
+    return [json.dumps(record).encode() + b"\n" for record in records]
+
+
+def _stream(model_obj, request, batch_size):
+    response = main.stream_predictions(model_obj, request, batch_size)
+    body = asyncio.run(_collect(response.body_iterator))
+    return [json.loads(line) for chunk in body for line in chunk.splitlines()]
+
+
+def test_stream_scores_every_batch(willemsen):
+    records = [dict(WILLEMSEN_RECORD) for _ in range(5)]
+    results = _stream(willemsen, _request(_lines(records), disconnect_after_body=False), 2)
+    assert [result["index"] for result in results] == list(range(5))
+
+
+def test_stream_stops_scoring_when_the_client_has_gone(willemsen, monkeypatch):
+    scored = []
+    predict_records = willemsen.predict_records
+
+    def counting(records, positions=None):
+        scored.append(len(records))
+        return predict_records(records, positions)
+
+    monkeypatch.setattr(willemsen, "predict_records", counting)
+    records = [dict(WILLEMSEN_RECORD) for _ in range(6)]
+    results = _stream(willemsen, _request([b"".join(_lines(records))]), 2)
+    assert results == [] and scored == []
+
+
+def test_stream_stops_when_the_client_goes_while_sending(willemsen):
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    request = _request([b""])
+    request.receive = receive
+    assert _stream(willemsen, request, 2) == []
+
+
+def test_request_body_knows_when_the_body_is_complete():
+    request = _request([b"a", b"b"])
+    body = request_body(request)
+
+    async def read():
+        chunks = []
+        async for chunk in body:
+            chunks.append((chunk, body.received))
+        return chunks
+
+    assert asyncio.run(read()) == [(b"a", False), (b"b", True)]
+    assert asyncio.run(body.disconnected())
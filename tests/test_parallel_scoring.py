@@ -0,0 +1,90 @@
+import copy
+
+import pytest
+
+from conftest import SERVICE_DIR, STIPHOUT_DIR, STIPHOUT_RECORD, WILLEMSEN_RECORD
+from parallel_scoring import _pack_records, parallel_scorer
+
+WILLEMSEN_SPEC = f"{SERVICE_DIR}/willemsen_tubefeed.py"
+STIPHOUT_SPEC = f"{STIPHOUT_DIR}/stiphout_pCR_Clinical.py"
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    scorer = parallel_scorer(processes=2, threshold=4)
+    yield scorer
+    scorer.shutdown()
+
+
+def _cohort(**changes):
+    records = [dict(WILLEMSEN_RECORD, BMI=10 + index) for index in range(8)]
+    for index, change in changes.items():
+        records[int(index[1:])].update(change)
+    return records
+
+
+@pytest.mark.parametrize("records", [
+    _cohort(),
+    _cohort(r1={"WeightLoss": True}),
+    _cohort(r0={"BMI": False}, r3={"BMI": 20}),
+    _cohort(r2={"BMI": "20"}),
+    _cohort(r5={"BMI": 60}, r6={"PS": 9}),
+    _cohort(r7={"RTdose_subman": None}),
+    _cohort(r4={"Tclassification": "x"}),
+    _cohort(r1={"BMI": float("nan")}),
+])
+def test_parallel_matches_serial(scorer, willemsen, records):
+    expected = willemsen.predict(copy.deepcopy(records))
+    result = scorer.predict(willemsen, WILLEMSEN_SPEC, copy.deepcopy(records))
+    if isinstance(expected, dict):
+        assert result == expected
+    else:
+        assert result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("value", [True, False, "2", None])
+def test_strict_model_rejects_non_numbers_in_parallel(scorer, stiphout, value):
+    # numpy packs [1, True] into an int column, so the check has to happen before packing
+    records = [dict(STIPHOUT_RECORD) for _ in range(8)]
+    records[1]["cN"] = value
+    expected = stiphout.predict(copy.deepcopy(records))
+    assert expected == {"error": "Type error: Invalid cN type in item 1, expected a number"}
+    assert scorer.predict(stiphout, STIPHOUT_SPEC, records) == expected
+
+
+def test_missing_feature_is_scored_serially(scorer, willemsen):
+    records = _cohort()
+    del records[3]["BMI"]
+    assert scorer.predict(willemsen, WILLEMSEN_SPEC, records) == {"error": "Validation error: Missing BMI in item 3"}
+
+
+def test_pack_records_only_packs_numbers():
+    assert _pack_records([{"a": 1, "b": 2.5}, {"a": 2, "b": 3}], ["a", "b"])["b"].tolist() == [2.5, 3.0]
+    assert _pack_records([{"a": 1}, {"a": True}], ["a"]) is None
+    assert _pack_records([{"a": 1}, {"a": "1"}], ["a"]) is None
+    with pytest.raises(KeyError):
+        _pack_records([{"a": 1}, {"b": 1}], ["a"])
+
+
+def test_pack_records_leaves_out_other_fields():
+    batch = _pack_records([{"a": 1, "id": "p0"}, {"a": 2, "id": "p1"}], ["a"])
+    assert list(batch.keys()) == ["a"]
+
+
+def test_other_fields_are_scored_in_parallel(scorer, willemsen, monkeypatch):
+    records = [dict(record, patient_id=f"p{index}", note=None) for index, record in enumerate(_cohort())]
+    expected = willemsen.predict(copy.deepcopy(records))
+
+    def serial(records):
+        raise AssertionError("scored serially")
+
+    monkeypatch.setattr(willemsen, "predict", serial)
+    assert scorer.predict(willemsen, WILLEMSEN_SPEC, records) == pytest.approx(expected)
+
+
+def test_serial_fallback_is_logged(scorer, willemsen, caplog):
+    records = _cohort(r2={"BMI": "20"})
+    with caplog.at_level("INFO", logger="parallel_scoring"):
+        scorer.predict(willemsen, WILLEMSEN_SPEC, records)
+    assert "Scoring 8 records in this process instead of in parallel" in caplog.text
+    assert "values other than numbers" in caplog.text
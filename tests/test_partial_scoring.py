@@ -0,0 +1,83 @@
+import pytest
+
+from conftest import NTCP_PARAMETERS, STIPHOUT_RECORD, WILLEMSEN_RECORD
+from model_execution import logistic_regression
+from model_execution_default import model_execution_default
+from ndjson_stream import ndjson_line_error, predict_batch
+
+WILLEMSEN_INVALID = [
+    {"BMI": 60}, {"BMI": "x"}, {"BMI": None}, {"WeightLoss": 40}, {"TF": 3}, {"PS": "2"},
+    {"Tclassification": 9}, {"RTdose_subman": -1},
+]
+STIPHOUT_INVALID = [{"cT": 9}, {"cN": True}, {"tLength": "15"}, {"cN": None}]
+
+
+def _cohort(record, invalid, position, size=4):
+    records = [dict(record) for _ in range(size)]
+    records[position].update(invalid)
+    return records
+
+
+def _list_error(model_obj, records):
+    return model_obj.predict([dict(record) for record in records])
+
+
+@pytest.mark.parametrize("invalid", WILLEMSEN_INVALID)
+@pytest.mark.parametrize("position", [0, 2])
+def test_willemsen_partial_errors_name_the_record(willemsen, invalid, position):
+    records = _cohort(WILLEMSEN_RECORD, invalid, position)
+    results = willemsen.predict_records([dict(record) for record in records])
+    assert results[position] == _list_error(willemsen, records)
+    assert f"in item {position}" in results[position]["error"]
+
+
+@pytest.mark.parametrize("invalid", STIPHOUT_INVALID)
+def test_stiphout_partial_errors_name_the_record(stiphout, invalid):
+    records = _cohort(STIPHOUT_RECORD, invalid, 1)
+    results = stiphout.predict_records([dict(record) for record in records])
+    assert results[1] == _list_error(stiphout, records)
+    assert "in item 1" in results[1]["error"]
+
+
+def test_stiphout_partial_error_for_a_missing_feature(stiphout):
+    records = [dict(STIPHOUT_RECORD), {"cT": 4, "cN": 1}]
+    assert stiphout.predict_records(records)[1] == {"error": "Validation error: Missing tLength in item 1"}
+
+
+def test_parameter_file_model_partial_errors_name_the_record():
+    model_obj = model_execution_default(model_path=NTCP_PARAMETERS)
+    record = model_obj.get_feature_schema().example_record()
+    name = next(iter(record))
+    records = [dict(record), dict(record, **{name: "x"})]
+    results = model_obj.predict_records([dict(item) for item in records])
+    assert results[1] == _list_error(model_obj, records)
+    assert "in item 1" in results[1]["error"]
+
+
+class _unnamed_model(logistic_regression):
+    def __init__(self):
+        self._model_parameters = {"intercept": 0.0, "covariate_weights": {"x": 1.0}}
+
+    def _preprocess(self, data):
+        if not isinstance(data["x"], (int, float)):
+            raise ValueError(f"Invalid x value: {data['x']}")
+        return data
+
+
+def test_position_is_appended_to_the_errors_of_other_models():
+    results = _unnamed_model().predict_records([{"x": 1}, {"x": "a"}], positions=[7, 8])
+    assert results[1] == {"error": "Validation error: Invalid x value: a (item 8)"}
+
+
+def test_chunked_errors_name_the_record_in_the_whole_list(willemsen):
+    records = [dict(WILLEMSEN_RECORD) for _ in range(5)]
+    records[3]["BMI"] = 60
+    results = [result for chunk in willemsen.iter_predictions(records, 2, partial=True) for result in chunk]
+    assert results[3] == {"error": "Validation error: Invalid BMI value in item 3: 60"}
+
+
+def test_stream_batch_errors_name_the_record_in_the_stream(willemsen):
+    batch = [dict(WILLEMSEN_RECORD), ndjson_line_error("Invalid JSON"), dict(WILLEMSEN_RECORD, BMI=60)]
+    results = predict_batch(willemsen, batch, start_index=10)
+    assert results[1] == {"error": "Invalid JSON"}
+    assert results[2] == {"error": "Validation error: Invalid BMI value in item 12: 60"}
@@ -0,0 +1,185 @@
+import logging
+
+import pytest
+
+import prediction_cache as cache_module
+from model_execution import generalized_linear_model
+from prediction_cache import prediction_cache, redis_cache_backend
+
+NAMESPACE = ("model", "fingerprint")
+
+redis = pytest.importorskip("redis")
+
+
+class _recording_pipeline:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def set(self, key, value, **options):
+        self.calls.append((key, value, options))
+
+    def execute(self):
+        pass
+
+
+class _recording_client:
+    def __init__(self):
+        self.calls = []
+
+    def pipeline(self, transaction=True):
+        return _recording_pipeline(self.calls)
+
+
+def test_unreachable_redis_falls_back_to_local_cache(caplog):
+    # nothing listens on port 1, so every Redis command fails to connect
+    backend = redis_cache_backend("redis://127.0.0.1:1/0", timeout=0.1)
+    cache = prediction_cache(max_entries=10, backend=backend)
+    with caplog.at_level(logging.WARNING, logger=cache_module.__name__):
+        assert cache.get_many(NAMESPACE, [(1.0,)]) == [None]
+        cache.set_many(NAMESPACE, [(1.0,)], [0.25])
+    assert cache.get_many(NAMESPACE, [(1.0,)]) == [0.25]
+    assert "Shared prediction cache lookup failed" in caplog.text
+
+
+def test_redis_is_not_retried_right_after_an_error(monkeypatch):
+    backend = redis_cache_backend("redis://127.0.0.1:1/0", timeout=0.1)
+    calls = []
+
+    def failing_mget(keys):
+        calls.append(keys)
+        raise redis.ConnectionError("connection refused")
+
+    monkeypatch.setattr(backend._client, "mget", failing_mget)
+    assert backend.get_many(NAMESPACE, [(1.0,), (2.0,)]) == [None, None]
+    assert backend.get_many(NAMESPACE, [(1.0,)]) == [None]
+    assert len(calls) == 1
+
+
+def test_predictions_survive_a_failing_backend(monkeypatch, willemsen, willemsen_record):
+    backend = redis_cache_backend("redis://127.0.0.1:1/0", timeout=0.1)
+    monkeypatch.setattr(generalized_linear_model, "prediction_cache", prediction_cache(backend=backend))
+    expected = willemsen.predict_records([dict(willemsen_record)])
+    assert willemsen.predict(dict(willemsen_record)) == pytest.approx(expected[0])
+    assert generalized_linear_model.prediction_cache.stats()["hits"] == 1
+
+
+@pytest.mark.parametrize("ttl, expected", [(0.5, 500), (1.0001, 1001), (30, 30000), (None, None)])
+def test_ttl_is_sent_in_milliseconds(ttl, expected):
+    backend = redis_cache_backend("redis://127.0.0.1:1/0", ttl=ttl)
+    backend._client = _recording_client()
+    backend.set_many(NAMESPACE, [(1.0,)], [0.5])
+    assert backend._client.calls[0][2] == {"px": expected}
+
+
+@pytest.mark.parametrize("ttl", [0, -1, "0"])
+def test_non_positive_ttl_is_rejected(monkeypatch, ttl):
+    monkeypatch.setenv("PREDICTION_CACHE_SIZE", "10")
+    monkeypatch.setenv("PREDICTION_CACHE_TTL", str(ttl))
+    with pytest.raises(ValueError, match="positive number of seconds"):
+        prediction_cache.from_environment()
+    with pytest.raises(ValueError):
+        redis_cache_backend("redis://127.0.0.1:1/0", ttl=float(ttl))
+
+
+def test_local_entries_expire():
+    cache = prediction_cache(max_entries=10, ttl=1e-9)
+    cache.set_many(NAMESPACE, [(1.0,)], [0.25])
+    assert cache.get_many(NAMESPACE, [(1.0,)]) == [None]
+
+
+class _memory_pipeline(_recording_pipeline):
+    def __init__(self, client):
+        super().__init__(client.calls)
+        self.client = client
+
+    def set(self, key, value, **options):
+        super().set(key, value, **options)
+        self.client.values[key] = value.encode()
+
+
+class _memory_client(_recording_client):
+    """
+    Stands in for a Redis server shared by several service processes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.values = {}
+
+    def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return _memory_pipeline(self)
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = prediction_cache(max_entries=2)
+    cache.set_many(NAMESPACE, [(1.0,), (2.0,)], [0.1, 0.2])
+    assert cache.get_many(NAMESPACE, [(1.0,)]) == [0.1]
+    cache.set_many(NAMESPACE, [(3.0,)], [0.3])
+    assert cache.get_many(NAMESPACE, [(1.0,), (2.0,), (3.0,)]) == [0.1, None, 0.3]
+    assert cache.get_many(("model", "other"), [(1.0,)]) == [None]
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (2, 3, 2)
+
+
+def test_only_uncached_records_are_scored(monkeypatch, willemsen, willemsen_record):
+    monkeypatch.setattr(generalized_linear_model, "prediction_cache", prediction_cache(max_entries=100))
+    records = [dict(willemsen_record, BMI=20 + index) for index in range(4)]
+    expected = willemsen.predict([dict(record) for record in records])
+    scored = []
+    score_batch = willemsen._calculate_probability_batch
+
+    def counting_score_batch(data):
+        scored.append(len(data))
+        return score_batch(data)
+
+    monkeypatch.setattr(willemsen, "_calculate_probability_batch", counting_score_batch)
+    more = records + [dict(willemsen_record, BMI=30)]
+    assert willemsen.predict([dict(record) for record in more])[:4] == expected
+    assert scored == [1]
+
+
+def test_replaced_parameters_do_not_use_old_outputs(monkeypatch):
+    from model_execution import logistic_regression
+    monkeypatch.setattr(generalized_linear_model, "prediction_cache", prediction_cache(max_entries=100))
+    parameters = {"model_name": "m", "model_uri": "m", "intercept": 0.0, "covariate_weights": {"a": 1.0}}
+    model_obj = logistic_regression(model_parameters=parameters)
+    assert model_obj.predict({"a": 0}) == pytest.approx(0.5)
+    model_obj._model_parameters = dict(parameters, intercept=1.0)
+    assert model_obj.predict({"a": 0}) == pytest.approx(0.7310585786300049)
+
+
+def test_outputs_are_shared_through_the_backend():
+    client = _memory_client()
+    caches = []
+    for _ in range(2):  # e.g. two replicas of the service
+        backend = redis_cache_backend("redis://127.0.0.1:1/0", ttl=60)
+        backend._client = client
+        caches.append(prediction_cache(max_entries=10, backend=backend))
+    caches[0].set_many(NAMESPACE, [(1.0, 2.5)], [0.125])
+    assert client.calls == [("faivor:prediction:model:fingerprint:1.0,2.5", "0.125", {"px": 60000})]
+    assert caches[1].get_many(NAMESPACE, [(1.0, 2.5), (2.0, 2.5)]) == [0.125, None]
+    # the shared hit is kept locally, so the next lookup does not ask the backend again
+    client.values.clear()
+    assert caches[1].get_many(NAMESPACE, [(1.0, 2.5)]) == [0.125]
+    stats = caches[1].stats()
+    assert (stats["shared"], stats["hits"], stats["shared_hits"], stats["misses"]) == (True, 1, 1, 1)
+
+
+def test_cache_endpoint(monkeypatch, willemsen_record):
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    import main
+    client = TestClient(main.app)
+    monkeypatch.setattr(generalized_linear_model, "prediction_cache", None)
+    assert client.get("/cache").json() == {"enabled": False}
+
+    monkeypatch.setattr(generalized_linear_model, "prediction_cache", prediction_cache(max_entries=10, ttl=5))
+    client.post("/predict", json=willemsen_record)
+    client.post("/predict", json=willemsen_record)
+    stats = client.get("/cache").json()
+    assert stats["enabled"] and stats["ttl"] == 5
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
@@ -0,0 +1,148 @@
+import threading
+import time
+
+import pytest
+
+from conftest import WILLEMSEN_RECORD
+from prediction_jobs import JOB_COMPLETED, JOB_FAILED, job_manager, job_queue_full
+
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+
+WILLEMSEN_SPEC = "willemsen_tubefeed:willemsen_tubefeed"
+
+
+def _records(count, invalid=()):
+    return [dict(WILLEMSEN_RECORD, BMI=60 if index in invalid else 15 + index % 20) for index in range(count)]
+
+
+def _wait(job):
+    deadline = time.monotonic() + 60
+    while not job.finished:
+        assert time.monotonic() < deadline, "job did not finish"
+        time.sleep(0.01)
+    return job
+
+
+@pytest.fixture(scope="module")
+def process_jobs():
+    manager = job_manager(max_workers=1, chunk_size=4, processes=1)
+    yield manager
+    manager.shutdown()
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+def test_job_scores_a_list_in_chunks(willemsen):
+    manager = job_manager(max_workers=1, chunk_size=4)
+    job = _wait(manager.submit(willemsen, _records(10)))
+    assert job.status == JOB_COMPLETED
+    assert job.processed == 10
+    assert job.results == pytest.approx(willemsen.predict(_records(10)))
+
+
+def test_job_scores_in_worker_processes(willemsen, process_jobs):
+    job = _wait(process_jobs.submit(willemsen, _records(10), model_spec=WILLEMSEN_SPEC))
+    assert job.status == JOB_COMPLETED
+    assert job.results == pytest.approx(willemsen.predict(_records(10)))
+
+    job = _wait(process_jobs.submit(willemsen, dict(WILLEMSEN_RECORD), model_spec=WILLEMSEN_SPEC))
+    assert job.results == [pytest.approx(willemsen.predict(dict(WILLEMSEN_RECORD)))]
+
+
+def test_worker_processes_score_partial_jobs_by_position(willemsen, process_jobs):
+    records = _records(10, invalid={1, 6})
+    job = _wait(process_jobs.submit(willemsen, records, partial=True, model_spec=WILLEMSEN_SPEC))
+    assert job.status == JOB_COMPLETED
+    assert job.results == willemsen.predict_records(_records(10, invalid={1, 6}))
+    assert job.results[6] == {"error": "Validation error: Invalid BMI value in item 6: 60"}
+
+
+def test_worker_processes_report_the_error_of_the_whole_list(willemsen, process_jobs):
+    records = _records(10, invalid={6})
+    job = _wait(process_jobs.submit(willemsen, records, model_spec=WILLEMSEN_SPEC))
+    assert job.status == JOB_FAILED
+    assert job.error == willemsen.predict(_records(10, invalid={6}))["error"]
+    assert job.results == []
+
+
+def test_finished_jobs_expire(willemsen):
+    manager = job_manager(max_workers=1, finished_ttl=0.05)
+    job = _wait(manager.submit(willemsen, dict(WILLEMSEN_RECORD)))
+    assert manager.get(job.job_id) is job
+    time.sleep(0.1)
+    assert manager.get(job.job_id) is None
+    assert manager.get() is None
+
+
+def test_finished_jobs_are_capped(willemsen):
+    manager = job_manager(max_workers=1, max_finished=2)
+    finished = [_wait(manager.submit(willemsen, dict(WILLEMSEN_RECORD))) for _ in range(3)]
+    assert manager.get(finished[0].job_id) is None
+    assert [manager.get(job.job_id) for job in finished[1:]] == finished[1:]
+
+
+class _blocked_model:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def predict(self, input_object):
+        self.release.wait(10)
+        return 0.5
+
+
+def test_unfinished_jobs_are_limited():
+    manager = job_manager(max_workers=1, max_pending=2)
+    model_obj = _blocked_model()
+    running = manager.submit(model_obj, dict(WILLEMSEN_RECORD))
+    manager.submit(model_obj, dict(WILLEMSEN_RECORD))
+    with pytest.raises(job_queue_full):
+        manager.submit(model_obj, dict(WILLEMSEN_RECORD))
+    model_obj.release.set()
+    assert _wait(running).results == [0.5]
+    manager.shutdown()
+
+
+def test_submit_status_result(client, willemsen):
+    response = client.post("/predict", params={"async": "true"}, json=_records(5))
+    assert response.status_code == 202
+    job = response.json()
+    assert job["result_url"] == f"/result/{job['job_id']}"
+
+    deadline = time.monotonic() + 60
+    status = client.get(job["status_url"]).json()
+    while status["status"] != JOB_COMPLETED:
+        assert status["status"] != JOB_FAILED and time.monotonic() < deadline
+        time.sleep(0.05)
+        status = client.get(job["status_url"]).json()
+    assert status["job_id"] == job["job_id"]
+    assert status["message"] == "completed"
+
+    result = client.get(job["result_url"], params={"offset": 1, "limit": 2}).json()
+    assert result["offset"] == 1
+    assert result["results"] == pytest.approx(willemsen.predict(_records(5))[1:3])
+
+
+def test_result_of_a_failed_job_is_a_conflict(client):
+    job = client.post("/predict", params={"async": "true"}, json=_records(3, invalid={2})).json()
+    deadline = time.monotonic() + 60
+    status = client.get(job["status_url"]).json()
+    while status["status"] != JOB_FAILED:
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+        status = client.get(job["status_url"]).json()
+    assert status["message"] == "failed: Validation error: Invalid BMI value in item 2: 60"
+    assert client.get(job["result_url"]).status_code == 409
+
+
+@pytest.mark.parametrize("path", ["/status/unknown", "/result/unknown"])
+def test_unknown_job_is_not_found(client, path):
+    response = client.get(path)
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Job not found"}
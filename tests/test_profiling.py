@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+import pytest
+
+import profiling
+
+httpx = pytest.importorskip("httpx")
+from fastapi import FastAPI  # noqa: E402
+from fastapi.concurrency import run_in_threadpool  # noqa: E402
+
+
+def _profiled_handler_work(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _other_request_work(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _app(profiler):
+    app = FastAPI()
+    app.add_middleware(profiling.profiling_middleware, profiler=profiler)
+
+    @app.post("/predict")
+    async def predict():
+        await run_in_threadpool(profiling.tracked(_profiled_handler_work), 0.2)
+        return {"done": True}
+
+    @app.post("/other")
+    async def other():
+        # CPU work on the event loop thread, as a concurrent request may do
+        for _ in range(20):
+            _other_request_work(0.01)
+            await asyncio.sleep(0)
+        return {"done": True}
+
+    return app
+
+
+def test_profile_holds_the_frames_of_its_own_request():
+    profiler = profiling.profiler(interval=0.001)
+    transport = httpx.ASGITransport(app=_app(profiler))
+
+    async def requests():
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                client.post("/predict", headers={"X-Profile": "1"}),
+                client.post("/other"),
+            )
+
+    profiled, other = asyncio.run(requests())
+    assert other.headers.get("x-profile-id") is None
+    profile = profiler.store.get(profiled.headers["x-profile-id"])
+    assert profile.duration is not None and profile.samples > 0
+    folded = profile.folded()
+    assert "_profiled_handler_work" in folded
+    assert "_other_request_work" not in folded
+
+
+def test_rate_limited_requests_are_not_profiled():
+    profiler = profiling.profiler(max_per_minute=1)
+    transport = httpx.ASGITransport(app=_app(profiler))
+
+    async def requests():
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [await client.post("/other", headers={"X-Profile": "1"}) for _ in range(2)]
+
+    first, second = asyncio.run(requests())
+    assert profiler.store.get(first.headers["x-profile-id"]) is not None
+    assert second.headers["x-profile-id"] == "rate-limited"
+    assert len(profiler.store.list()) == 1
@@ -0,0 +1,60 @@
+import copy
+
+import numpy as np
+import pytest
+
+from conftest import WILLEMSEN_RECORD
+from record_batch import record_batch
+
+RECORDS = [dict(WILLEMSEN_RECORD, BMI=15.5 + index, TF=index % 2) for index in range(7)]
+
+
+def test_records_are_packed_into_columns():
+    batch = record_batch.from_records(RECORDS, ["BMI", "TF"], numeric=True)
+    assert len(batch) == 7 and list(batch) == ["BMI", "TF"] and "PS" not in batch
+    assert batch["BMI"].dtype == np.float64 and batch["TF"].dtype == np.float64
+    assert batch.nbytes == 2 * 7 * 8
+    assert record_batch.from_records(RECORDS, ["TF"])["TF"].dtype.kind == "i"
+
+
+def test_mixed_values_keep_their_python_values():
+    batch = record_batch({"TF": [1, "a", None]})
+    assert batch["TF"].dtype == object
+    assert batch["TF"].tolist() == [1, "a", None]
+
+
+def test_invalid_records_cannot_be_packed():
+    with pytest.raises(KeyError):
+        record_batch.from_records([{"BMI": 20}, {}], ["BMI"], numeric=True)
+    with pytest.raises(ValueError):
+        record_batch.from_records([{"BMI": "a"}], ["BMI"], numeric=True)
+    with pytest.raises(ValueError, match="All input columns must have the same length"):
+        record_batch({"BMI": [1, 2], "TF": [1]})
+
+
+def test_rows_are_selected_and_converted_back():
+    batch = record_batch.from_records(RECORDS, list(WILLEMSEN_RECORD))
+    assert batch.take(slice(2, 4)).to_records() == RECORDS[2:4]
+    assert batch.take(batch["TF"] == 1).to_records() == RECORDS[1::2]
+    matrix = batch.to_matrix(["TF", "BMI"])
+    assert matrix.dtype == np.float64 and matrix.flags.c_contiguous
+    assert matrix.tolist() == [[record["TF"], record["BMI"]] for record in RECORDS]
+
+
+def test_columns_score_like_records(willemsen):
+    batch = record_batch.from_records(RECORDS, list(WILLEMSEN_RECORD))
+    expected = willemsen.predict(copy.deepcopy(RECORDS))
+    assert willemsen.predict_columns(batch).tolist() == pytest.approx(expected, rel=1e-12)
+    chunks = list(willemsen.iter_predictions(copy.deepcopy(RECORDS), 3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert sum(chunks, []) == pytest.approx(expected, rel=1e-12)
+
+
+def test_invalid_column_gives_the_error_of_the_records(willemsen):
+    # integer BMI values, so the column keeps the value as the client sent it
+    records = [dict(WILLEMSEN_RECORD, BMI=20 + index) for index in range(3)] + [dict(WILLEMSEN_RECORD, BMI=60)]
+    batch = record_batch.from_records(records, list(WILLEMSEN_RECORD))
+    assert willemsen.predict_columns(batch) == willemsen.predict(copy.deepcopy(records))
+    assert willemsen.predict_columns(batch) == {"error": "Validation error: Invalid BMI value in item 3: 60"}
+    with pytest.raises(ValueError, match="Invalid BMI value in item 3: 60"):
+        list(willemsen.iter_predictions(copy.deepcopy(records), 2))
@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+
+from conftest import WILLEMSEN_RECORD
+from request_coalescing import request_coalescer
+
+INVALID = [{"BMI": 60}, {"BMI": "x"}, {"TF": 3}, {"WeightLoss": 40}, {"Tclassification": "x"}]
+
+
+def _coalesced_predictions(model_obj, records):
+    calls = []
+
+    async def run(func, *args):
+        calls.append(len(args[0]) if isinstance(args[0], list) else 1)
+        return func(*args)
+
+    async def predict_all():
+        coalescer = request_coalescer(run, max_delay=0.05, max_batch_size=64)
+        return await asyncio.gather(*(coalescer.predict(model_obj, record) for record in records))
+
+    return asyncio.run(predict_all()), calls
+
+
+def test_coalesced_results_match_single_predictions(willemsen):
+    records = [dict(WILLEMSEN_RECORD, BMI=18 + index) for index in range(3)]
+    records += [dict(WILLEMSEN_RECORD, **invalid) for invalid in INVALID]
+    expected = [willemsen.predict(dict(record)) for record in records]
+
+    results, calls = _coalesced_predictions(willemsen, [dict(record) for record in records])
+    assert calls == [len(records)]
+    assert results[:3] == pytest.approx(expected[:3])
+    assert results[3:] == expected[3:]
+    assert results[3] == {"error": "Validation error: Invalid BMI value in item: 60 (Allowed range: 5.0-40.0)"}
+
+
+def test_coalesced_missing_feature_matches_single_prediction(stiphout):
+    records = [{"cT": 4, "cN": 1, "tLength": 15}, {"cT": 4, "cN": 1}, {"cT": 4, "cN": True, "tLength": 15}]
+    expected = [stiphout.predict(dict(record)) for record in records]
+    results, _ = _coalesced_predictions(stiphout, records)
+    assert results == expected
+    assert results[1] == {"error": "Validation error: Missing tLength"}
+
+
+class _gated_run:
+    """
+    Runs the scoring functions like main.run_model, holding every call until its gate is opened.
+    """
+
+    def __init__(self):
+        self.batches = []
+        self.gates = []
+
+    async def __call__(self, func, records):
+        self.batches.append(len(records) if isinstance(records, list) else 1)
+        gate = asyncio.Event()
+        self.gates.append(gate)
+        await gate.wait()
+        return func(records)
+
+    async def open_all(self):
+        while not all(gate.is_set() for gate in self.gates):
+            for gate in self.gates:
+                gate.set()
+            await asyncio.sleep(0)
+
+
+async def _until(condition, timeout=1.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "timed out"
+        await asyncio.sleep(0.001)
+
+
+def _records(count):
+    return [dict(WILLEMSEN_RECORD, BMI=18 + index) for index in range(count)]
+
+
+def test_lone_record_does_not_wait(willemsen):
+    async def predict_one():
+        run = _gated_run()
+        coalescer = request_coalescer(run, max_delay=10, max_batch_size=64)
+        task = asyncio.ensure_future(coalescer.predict(willemsen, _records(1)[0]))
+        await _until(lambda: run.batches)
+        await run.open_all()
+        return await asyncio.wait_for(task, 1), run.batches
+
+    result, batches = asyncio.run(predict_one())
+    assert batches == [1]
+    assert result == pytest.approx(willemsen.predict(_records(1)[0]))
+
+
+def test_records_wait_for_the_batch_being_scored(willemsen):
+    async def predict_during_scoring():
+        run = _gated_run()
+        coalescer = request_coalescer(run, max_delay=10, max_batch_size=64)
+        first = asyncio.ensure_future(coalescer.predict(willemsen, _records(1)[0]))
+        await _until(lambda: run.batches)
+        waiting = [asyncio.ensure_future(coalescer.predict(willemsen, record)) for record in _records(3)]
+        await asyncio.sleep(0.01)
+        assert run.batches == [1]  # collected, not scored while the first batch runs
+        # the collected records are scored as soon as the first batch is done, not after max_delay
+        run.gates[0].set()
+        await _until(lambda: len(run.batches) == 2)
+        await run.open_all()
+        return await asyncio.wait_for(asyncio.gather(first, *waiting), 1), run.batches
+
+    results, batches = asyncio.run(predict_during_scoring())
+    assert batches == [1, 3]
+    assert results[1:] == pytest.approx(willemsen.predict(_records(3)))
+
+
+def test_full_batches_are_scored_right_away(willemsen):
+    async def predict_many():
+        run = _gated_run()
+        coalescer = request_coalescer(run, max_delay=10, max_batch_size=2)
+        first = asyncio.ensure_future(coalescer.predict(willemsen, _records(1)[0]))
+        await _until(lambda: run.batches)
+        waiting = [asyncio.ensure_future(coalescer.predict(willemsen, record)) for record in _records(5)]
+        await _until(lambda: len(run.batches) == 3)
+        assert run.batches == [1, 2, 2]  # the fifth record waits for a batch to finish
+        await run.open_all()
+        await _until(lambda: len(run.batches) == 4)
+        await run.open_all()
+        return await asyncio.wait_for(asyncio.gather(first, *waiting), 1), run.batches
+
+    results, batches = asyncio.run(predict_many())
+    assert batches == [1, 2, 2, 1]
+    assert results[1:] == pytest.approx(willemsen.predict(_records(5)))
+
+
+def test_records_wait_at_most_max_delay(willemsen):
+    async def predict_while_blocked():
+        run = _gated_run()
+        coalescer = request_coalescer(run, max_delay=0.05, max_batch_size=64)
+        first = asyncio.ensure_future(coalescer.predict(willemsen, _records(1)[0]))
+        await _until(lambda: run.batches)
+        waiting = [asyncio.ensure_future(coalescer.predict(willemsen, record)) for record in _records(2)]
+        # scored after max_delay, although the first batch is still running
+        await _until(lambda: len(run.batches) == 2)
+        assert not run.gates[0].is_set()
+        await run.open_all()
+        return await asyncio.wait_for(asyncio.gather(first, *waiting), 1), run.batches
+
+    results, batches = asyncio.run(predict_while_blocked())
+    assert batches == [1, 2]
+    assert results[1:] == pytest.approx(willemsen.predict(_records(2)))
+
+
+def test_scoring_errors_reach_every_caller(willemsen):
+    async def run(func, records):
+        raise RuntimeError("worker died")
+
+    async def predict_all():
+        coalescer = request_coalescer(run, max_delay=0.05, max_batch_size=64)
+        return await asyncio.gather(*(coalescer.predict(willemsen, record) for record in _records(3)),
+                                    return_exceptions=True)
+
+    results = asyncio.run(predict_all())
+    assert [str(result) for result in results] == ["worker died"] * 3
@@ -0,0 +1,86 @@
+import copy
+import json
+
+import pytest
+
+from conftest import STIPHOUT_RECORD, WILLEMSEN_RECORD
+from request_models import get_request_model
+
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+
+
+def _with(**changes):
+    return dict(WILLEMSEN_RECORD, **changes)
+
+
+BODIES = [
+    WILLEMSEN_RECORD,
+    _with(BMI=60),
+    _with(BMI=5.0),
+    _with(WeightLoss=True),
+    _with(TF="1"),
+    _with(BMI=None),
+    {key: value for key, value in WILLEMSEN_RECORD.items() if key != "BMI"},
+    [WILLEMSEN_RECORD, _with(BMI=25, PS=2)],
+    [WILLEMSEN_RECORD, _with(BMI=60)],
+    [_with(WeightLoss=40), _with(BMI=60)],
+    [WILLEMSEN_RECORD, _with(Systherapy=True)],
+    [WILLEMSEN_RECORD, _with(RTdose_subman="x")],
+    [WILLEMSEN_RECORD, 3],
+    [],
+]
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.mark.parametrize("body", BODIES)
+def test_typed_and_untyped_bodies_give_the_same_answer(client, willemsen, body):
+    expected = willemsen.predict(copy.deepcopy(body))
+    response = client.post("/predict", content=json.dumps(body), headers={"Content-Type": "application/json"})
+    assert response.status_code == 200
+    if isinstance(expected, dict):
+        assert response.json() == expected
+    else:
+        assert response.json() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("body", [WILLEMSEN_RECORD, [WILLEMSEN_RECORD, _with(BMI=25, PS=2)]])
+def test_valid_bodies_are_validated_by_the_request_model(client, monkeypatch, body):
+    model_obj = main.get_model()
+    validated = []
+    predict_validated = model_obj.predict_validated
+
+    def spy(input_object):
+        validated.append(input_object)
+        return predict_validated(input_object)
+
+    monkeypatch.setattr(model_obj, "predict_validated", spy)
+    response = client.post("/predict", json=body)
+    assert response.status_code == 200
+    assert len(validated) == 1
+    assert isinstance(validated[0], list) == isinstance(body, list)
+
+
+@pytest.mark.parametrize("body", [
+    body for body in BODIES if isinstance(body, list) and all(isinstance(record, dict) for record in body)])
+def test_partial_lists_give_the_same_answer(client, willemsen, body):
+    expected = willemsen.predict_records(copy.deepcopy(body))
+    response = client.post("/predict", params={"partial": "true"}, json=body)
+    assert response.json() == [
+        result if isinstance(result, dict) else pytest.approx(result) for result in expected]
+
+
+def test_request_model_validates_records_and_lists(stiphout):
+    request_model = get_request_model(stiphout)
+    assert request_model.validate_request_json(json.dumps(STIPHOUT_RECORD)) == STIPHOUT_RECORD
+    assert request_model.validate_request_json(json.dumps([STIPHOUT_RECORD] * 2)) == [STIPHOUT_RECORD] * 2
+    assert request_model.validate_request_json(json.dumps([STIPHOUT_RECORD, dict(STIPHOUT_RECORD, cT=5)])) is None
+    assert request_model.validate_request_json(json.dumps(dict(STIPHOUT_RECORD, cN=True))) is None
+    assert request_model.validate_request_json(b"[1, 2") is None
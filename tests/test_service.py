@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from conftest import WILLEMSEN_RECORD
+
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+def _ndjson(records):
+    return "".join(json.dumps(record) + "\n" for record in records)
+
+
+@pytest.mark.parametrize("batch_size", [0, -1, main.MAX_STREAM_BATCH_SIZE + 1])
+def test_stream_batch_size_is_bounded(client, batch_size):
+    response = client.post("/predict/stream", params={"batch_size": batch_size},
+                           content=_ndjson([WILLEMSEN_RECORD]), headers={"Content-Type": "application/x-ndjson"})
+    assert response.status_code == 422
+
+
+def test_stream_scores_every_record(client, willemsen):
+    records = [dict(WILLEMSEN_RECORD, BMI=10 + index) for index in range(5)] + [dict(WILLEMSEN_RECORD, BMI=60)]
+    response = client.post("/predict/stream", params={"batch_size": 2}, content=_ndjson(records),
+                           headers={"Content-Type": "application/x-ndjson"})
+    assert response.status_code == 200
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [result["index"] for result in results] == list(range(6))
+    for record, result in zip(records[:5], results):
+        assert result["probability"] == pytest.approx(willemsen.predict(dict(record)))
+    assert results[5]["error"] == "Validation error: Invalid BMI value in item 5: 60"
+
+
+@pytest.mark.parametrize("batch_size", [0, main.MAX_STREAM_BATCH_SIZE + 1])
+def test_validate_batch_size_is_bounded(client, batch_size):
+    response = client.post("/validate", params={"outcome": "TF", "batch_size": batch_size}, json=[WILLEMSEN_RECORD])
+    assert response.status_code == 422
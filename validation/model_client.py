@@ -0,0 +1,403 @@
+"""
+Python client for the prediction service (main.py).
+
+Usage:
+    from model_client import model_client
+
+    with model_client("http://localhost:8000") as client:
+        client.wait_until_ready()
+        probabilities = client.predict_many(cohort)  # a pandas DataFrame or a list of dictionaries
+
+Large inputs are split into batches that are sent concurrently over pooled keep-alive
+connections, as Arrow IPC streams when pyarrow is installed (JSON otherwise), and the results are
+put back together in input order. Failed requests (connection errors, 429, 502, 503 and 504
+responses) are retried with exponential backoff.
+
+Requires requests (and pandas for DataFrame input, pyarrow for Arrow batches). This module does
+not import the service itself: notebooks in this directory import it directly, and it can be
+copied next to any other notebook or script on its own.
+"""
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib json module is used without it
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:  # Arrow batches are optional, JSON batches work without pyarrow
+    pa = None
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# bounds of the automatic batch size: smaller batches pay relatively more per-request overhead,
+# larger ones hold more memory on both sides and leave connections idle at the end of a run
+MIN_BATCH_SIZE = 1000
+MAX_BATCH_SIZE = 50000
+# responses worth retrying: rate limiting, and a service (or proxy) that is starting or overloaded
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+def _dumps(value):
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _is_frame(data):
+    return hasattr(data, "iloc") and hasattr(data, "columns")
+
+
+def _to_records(data):
+    """
+    Convert a DataFrame (or a list of dictionaries) to a list of dictionaries with Python values.
+    """
+    if _is_frame(data):
+        return data.to_dict(orient="records")
+    return list(data)
+
+
+def _unsupported_body(response):
+    """
+    Check whether a 400 or 422 response is about the format of the request body as a whole
+    (its content type, or a body that is not JSON), rather than about its contents.
+    """
+    try:
+        detail = response.json().get("detail")
+    except (ValueError, AttributeError):
+        return False
+    if isinstance(detail, str):
+        detail = detail.lower()
+        return any(phrase in detail for phrase in ("content type", "content-type", "media type", "not valid json"))
+    if isinstance(detail, list):
+        # FastAPI validation errors of a body that is not a JSON object or array
+        return bool(detail) and all(
+            isinstance(error, dict) and list(error.get("loc", []))[:1] == ["body"] and len(error.get("loc", [])) <= 2
+            and error.get("type") in ("json_invalid", "dict_type", "list_type", "model_attributes_type")
+            for error in detail
+        )
+    return False
+
+
+class model_client:
+    """
+    Client for the prediction service.
+
+    Parameters:
+    - base_url: address of the service, e.g. "http://localhost:8000"
+    - model: name of a model served under /models/{name}; the default model when None
+    - batch_size: records per request; by default chosen per call, so every connection gets a few
+      batches of between MIN_BATCH_SIZE and MAX_BATCH_SIZE records
+    - max_workers: number of requests sent concurrently (and connections kept open)
+    - retries: number of times a failed request is sent again
+    - backoff: factor of the exponential backoff; the first retry is sent right away, retry n
+      after backoff * 2 ** (n - 1) seconds (or after the Retry-After time of the service)
+    - timeout: seconds to wait for the service to answer a request
+    - transport: "arrow", "json", or "auto" (Arrow when pyarrow is installed and the service
+      accepts it)
+    """
+
+    def __init__(self, base_url, model=None, batch_size=None, max_workers=4, retries=3, backoff=0.5,
+                 timeout=300, transport="auto"):
+        if transport not in ("auto", "arrow", "json"):
+            raise ValueError(f"Unsupported transport: {transport}")
+        if transport == "arrow" and pa is None:
+            raise ImportError("pyarrow is required for the arrow transport")
+        self.base_url = base_url.rstrip("/")
+        self.prefix = f"/models/{quote(model, safe='')}" if model else ""
+        self.batch_size = batch_size
+        self.max_workers = max(1, max_workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.transport = transport
+        # Arrow is used until the service turns it down (e.g. it has no pyarrow)
+        self._arrow = pa is not None and transport != "json"
+        # whether the OpenAPI document of the service was checked for Arrow request bodies
+        self._arrow_checked = transport != "auto"
+        # one session (with its own connection pool) per thread, as sessions are not thread-safe
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Close the connections and stop the threads sending the batches.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            retry = Retry(
+                total=self.retries, backoff_factor=self.backoff, status_forcelist=RETRY_STATUSES,
+                allowed_methods=None,  # predictions have no side effects, so POST requests are retried too
+                raise_on_status=False,
+            )
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(max_retries=retry))
+            session.mount("https://", HTTPAdapter(max_retries=retry))
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _arrow_body(self, frame):
+        """
+        Encode a DataFrame as an Arrow IPC stream, or return None when Arrow cannot represent a
+        column (e.g. numbers mixed with strings).
+        """
+        try:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def _use_arrow(self, data):
+        """
+        Check whether data is sent as an Arrow stream. With the "auto" transport, the OpenAPI
+        document of the service is checked once: services that predate Arrow input only list JSON
+        request bodies for /predict (and may fail with a 500 on an Arrow body).
+        """
+        if not self._arrow or not _is_frame(data):
+            return False
+        if not self._arrow_checked:
+            path = "/models/{name}/predict" if self.prefix else "/predict"
+            try:
+                document = self._request("GET", "/openapi.json").json()
+                content = document["paths"][path]["post"]["requestBody"]["content"]
+            except (requests.exceptions.RequestException, ValueError, KeyError, TypeError):
+                content = None  # no document to go by: a refusal of the first Arrow body turns Arrow off
+            if content is not None and ARROW_STREAM_MEDIA_TYPE not in content:
+                self._arrow = False
+            self._arrow_checked = True
+        return self._arrow
+
+    def _arrow_refused(self, response):
+        """
+        Check whether the service turned down an Arrow request body: services without pyarrow
+        answer 415, services that read every body as JSON answer 400 or 422 about the body as a
+        whole. JSON is used from then on. Other errors, such as a 503 while the service is busy,
+        are not a refusal; they are retried as any other request.
+        """
+        refused = response.status_code == 415 or (
+            response.status_code in (400, 422) and _unsupported_body(response))
+        if refused:
+            self._arrow = False
+        return refused
+
+    def _map(self, function, items):
+        items = list(items)
+        if len(items) <= 1 or self.max_workers == 1:
+            return [function(item) for item in items]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers)
+        return list(self._executor.map(function, items))
+
+    def _request(self, method, path, **kwargs):
+        response = self._session().request(method, self.base_url + path, timeout=self.timeout, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def _post_json(self, path, value, params=None):
+        return self._request("POST", path, params=params, data=_dumps(value),
+                             headers={"Content-Type": "application/json"})
+
+    def wait_until_ready(self, timeout=60, interval=0.2):
+        """
+        Wait until the service has loaded and warmed up its models (see /readyz).
+
+        Services without /readyz count as ready as soon as they answer.
+
+        Returns:
+        - readiness: the answer of /readyz, or None for services without it
+
+        Raises:
+        - TimeoutError if the service is not ready within timeout seconds
+        - RuntimeError if the warm-up of the service failed
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                # without the retries of the session, which would wait on every 503 while starting
+                response = requests.get(self.base_url + "/readyz", timeout=interval * 5)
+                if response.status_code == 200:
+                    return response.json()
+                if response.status_code == 404:
+                    return None
+                if response.status_code == 503 and response.json().get("status") == "failed":
+                    raise RuntimeError(response.json().get("detail", "The warm-up of the service failed"))
+            except requests.exceptions.RequestException:
+                pass  # not listening yet
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"The service at {self.base_url} was not ready within {timeout} seconds")
+            time.sleep(interval)
+
+    def input_parameters(self):
+        """
+        Get the input parameters of the model.
+        """
+        return self._request("GET", f"{self.prefix}/input_parameters").json()
+
+    def predict(self, data):
+        """
+        Calculate the probability for one input dictionary (or a list of them) in a single request.
+
+        Returns:
+        - probability: the probability, a list of probabilities, or {"error": message}
+        """
+        return self._post_json(f"{self.prefix}/predict", data).json()
+
+    def batch_size_for(self, rows):
+        """
+        Get the number of records per request for an input of the given number of rows.
+        """
+        if self.batch_size:
+            return self.batch_size
+        return min(MAX_BATCH_SIZE, max(MIN_BATCH_SIZE, math.ceil(rows / (4 * self.max_workers))))
+
+    def _predict_json(self, records):
+        return self._post_json(f"{self.prefix}/predict", records, params={"partial": "true"}).json()
+
+    def _predict_arrow(self, frame):
+        body = self._arrow_body(frame)
+        if body is None:
+            return None
+        response = self._session().post(
+            self.base_url + f"{self.prefix}/predict", data=body, timeout=self.timeout,
+            headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE, "Accept": ARROW_STREAM_MEDIA_TYPE},
+        )
+        if self._arrow_refused(response):
+            return None
+        response.raise_for_status()
+        if response.headers.get("content-type", "").startswith("application/json"):
+            return None  # a row is not valid: the batch is sent again as JSON, for an error per row
+        return pa.ipc.open_stream(response.content).read_all().column("probability").to_pylist()
+
+    def _predict_batch(self, batch):
+        if self._use_arrow(batch):
+            probabilities = self._predict_arrow(batch)
+            if probabilities is not None:
+                return probabilities
+        return self._predict_json(_to_records(batch))
+
+    def predict_many(self, data):
+        """
+        Calculate the probabilities for many records, in concurrent batches.
+
+        Every record is scored independently, so an invalid record gets its own error and does
+        not affect the others.
+
+        Parameters:
+        - data: a pandas DataFrame with one column per input parameter, or a list of dictionaries
+
+        Returns:
+        - results: a list aligned with the input, holding either the probability or {"error": message}
+
+        Raises:
+        - RuntimeError if the service answers a batch with a single error instead of one result
+          per record (services that predate partial results)
+        """
+        rows = len(data)
+        batch_size = self.batch_size_for(rows)
+        if _is_frame(data):
+            batches = (data.iloc[start:start + batch_size] for start in range(0, rows, batch_size))
+        else:
+            records = list(data)
+            batches = (records[start:start + batch_size] for start in range(0, rows, batch_size))
+        results = []
+        for batch_results in self._map(self._predict_batch, batches):
+            if not isinstance(batch_results, list):
+                # services without partial results answer {"error": ...} for the whole batch
+                raise RuntimeError(f"The service did not score a batch: {batch_results}")
+            results.extend(batch_results)
+        return results
+
+    def predict_stream(self, records, batch_size=None):
+        """
+        Score records through the streaming endpoint (/predict/stream), without holding the input
+        or the results in memory. Streamed requests cannot be retried, as the input is consumed
+        while it is sent.
+
+        Parameters:
+        - records: an iterable of input dictionaries, e.g. a generator reading a large file
+        - batch_size: number of records the service scores together
+
+        Returns:
+        - results: an iterator of {"index": i, "probability": p} or {"index": i, "error": message}, in input order
+        """
+        params = {"batch_size": batch_size} if batch_size else None
+        body = (_dumps(record) + b"\n" for record in records)
+        # a session without retries, as a retry would send the consumed input again
+        with requests.Session() as session:
+            response = session.post(
+                self.base_url + f"{self.prefix}/predict/stream", data=body, params=params, stream=True,
+                headers={"Content-Type": NDJSON_MEDIA_TYPE}, timeout=self.timeout,
+            )
+            response.raise_for_status()
+            with response:
+                for line in response.iter_lines():
+                    if line:
+                        yield _loads(line)
+
+    def validate(self, data, outcome, bootstrap=0, confidence=0.95, seed=None):
+        """
+        Let the service calculate the performance of the model on a cohort (see /validate).
+
+        Parameters:
+        - data: a pandas DataFrame (or a list of dictionaries) holding the input parameters and the outcome
+        - outcome: name of the outcome column
+        - bootstrap: number of bootstrap resamples for confidence intervals, 0 for none
+        - confidence: confidence level of the intervals
+        - seed: seed of the resampling, for reproducible intervals
+
+        Returns:
+        - summary: the metrics calculated by the service
+        """
+        params = {"outcome": outcome, "partial": "true", "bootstrap": bootstrap, "confidence": confidence}
+        if seed is not None:
+            params["seed"] = seed
+        path = f"{self.prefix}/validate"
+        body = self._arrow_body(data) if self._use_arrow(data) else None
+        if body is not None:
+            response = self._session().post(
+                self.base_url + path, params=params, data=body, timeout=self.timeout,
+                headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE},
+            )
+            if not self._arrow_refused(response):
+                response.raise_for_status()
+                return response.json()
+        return self._post_json(path, _to_records(data), params=params).json()
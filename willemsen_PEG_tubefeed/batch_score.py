@@ -0,0 +1,216 @@
+"""
+Score a cohort file offline, without building an image or running the HTTP service.
+
+Usage:
+    python batch_score.py MODEL INPUT OUTPUT [--chunk-size N] [--workers N] [--rename OLD=NEW ...] [--keep-columns]
+
+MODEL is a model specification as accepted by model_registry.load_model_spec, e.g.
+"willemsen_tubefeed", "../stiphout_pCR-Clinical/stiphout_pCR_Clinical.py" or
+"../ntcp_model/ntcp_model_dysphalgia.json". INPUT and OUTPUT are CSV, XLSX or Parquet files.
+The output holds a "probability" and an "error" column per input row, in input order.
+
+Requires pandas (and pyarrow for Parquet, openpyxl for XLSX).
+"""
+import argparse
+import itertools
+import multiprocessing
+import os
+
+import pandas as pd
+
+from model_registry import load_model_spec
+
+# model object of a worker process, loaded once by _init_worker
+_worker_model = None
+
+
+def _init_worker(model_spec):
+    global _worker_model
+    _worker_model = load_model_spec(model_spec)
+
+
+def score_chunk(model_obj, chunk):
+    """
+    Score one chunk of a cohort.
+
+    The chunk is scored column-wise first; when it contains invalid rows, every row is scored on
+    its own so the valid rows still get a probability.
+
+    Parameters:
+    - model_obj: the model object
+    - chunk: pandas DataFrame with one column per input parameter
+
+    Returns:
+    - results: pandas DataFrame with "probability" and "error" columns, indexed like the chunk
+    """
+    columns = {name: chunk[name].to_numpy() for name in chunk.columns}
+    probabilities = model_obj.predict_columns(columns)
+    if not isinstance(probabilities, dict):
+        return pd.DataFrame({
+            "probability": probabilities,
+            "error": pd.array([None] * len(chunk), dtype="string"),
+        }, index=chunk.index)
+
+    records = chunk.astype(object).where(chunk.notna(), None).to_dict(orient="records")
+    results = model_obj.predict_records(records, chunk.index)
+    return pd.DataFrame({
+        "probability": pd.array([None if isinstance(result, dict) else result for result in results], dtype="Float64"),
+        "error": pd.array([result["error"] if isinstance(result, dict) else None for result in results], dtype="string"),
+    }, index=chunk.index)
+
+
+def _score_chunk_in_worker(chunk):
+    return score_chunk(_worker_model, chunk)
+
+
+def _input_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".csv", ".txt"):
+        return "csv"
+    if extension in (".xlsx", ".xls"):
+        return "excel"
+    if extension in (".parquet", ".pq"):
+        return "parquet"
+    raise ValueError(f"Unsupported file type: {path}")
+
+
+def read_chunks(path, chunk_size):
+    """
+    Read a CSV, XLSX or Parquet file as a sequence of DataFrames of at most chunk_size rows.
+    """
+    file_format = _input_format(path)
+    if file_format == "csv":
+        yield from pd.read_csv(path, chunksize=chunk_size)
+    elif file_format == "parquet":
+        import pyarrow.parquet
+
+        start = 0
+        for batch in pyarrow.parquet.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+    else:
+        # Excel files cannot be read incrementally
+        data = pd.read_excel(path)
+        for start in range(0, len(data), chunk_size):
+            yield data.iloc[start:start + chunk_size]
+
+
+class chunk_writer:
+    """
+    Append DataFrames to a CSV or Parquet output file.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._format = _input_format(path)
+        if self._format == "excel":
+            raise ValueError("Excel output is not supported, use CSV or Parquet")
+        self._parquet_writer = None
+        self._rows = 0
+
+    def write(self, chunk):
+        if self._format == "csv":
+            chunk.to_csv(self._path, mode="w" if self._rows == 0 else "a", header=self._rows == 0, index=False)
+        else:
+            import pyarrow
+            import pyarrow.parquet
+
+            table = pyarrow.Table.from_pandas(chunk, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pyarrow.parquet.ParquetWriter(self._path, table.schema)
+            self._parquet_writer.write_table(table.cast(self._parquet_writer.schema))
+        self._rows += len(chunk)
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        return self._rows
+
+
+def prepare_chunks(chunks, renames, input_parameters):
+    """
+    Rename columns and select the model input parameters of every chunk.
+
+    Yields:
+    - (chunk, inputs): the full chunk and the DataFrame with only the model inputs
+    """
+    for chunk in chunks:
+        if renames:
+            chunk = chunk.rename(columns=renames)
+        inputs = chunk[[name for name in input_parameters if name in chunk.columns]] if input_parameters else chunk
+        yield chunk, inputs
+
+
+def missing_columns(model_obj, columns):
+    """
+    Get the required model input parameters that are not among the columns of the input.
+
+    Parameters:
+    - model_obj: the model object
+    - columns: the column names of the input, after renaming
+
+    Returns:
+    - missing: the names of the missing input parameters, in model order
+    """
+    input_parameters = model_obj.get_input_parameters() or []
+    schema = model_obj.get_feature_schema()
+    required = {feature.name for feature in schema if feature.required} if schema is not None else set(input_parameters)
+    return [name for name in input_parameters if name in required and name not in columns]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV/XLSX/Parquet cohort file with a model, in-process.")
+    parser.add_argument("model", help="module[:class], path/to/module.py[:class] or path/to/parameters.json")
+    parser.add_argument("input", help="input file (.csv, .xlsx or .parquet)")
+    parser.add_argument("output", help="output file (.csv or .parquet)")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="number of rows scored together")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument("--rename", action="append", default=[], metavar="OLD=NEW",
+                        help="rename an input column before scoring, e.g. SizeZ=tLength")
+    parser.add_argument("--keep-columns", action="store_true", help="copy the input columns to the output")
+    args = parser.parse_args(argv)
+
+    renames = dict(rename.split("=", 1) for rename in args.rename)
+    model_obj = load_model_spec(args.model)
+    input_parameters = model_obj.get_input_parameters()
+
+    chunks = prepare_chunks(read_chunks(args.input, args.chunk_size), renames, input_parameters)
+    # the columns are checked once, on the first chunk, before anything is scored or written
+    first = next(chunks, None)
+    if first is not None:
+        missing = missing_columns(model_obj, first[0].columns)
+        if missing:
+            raise SystemExit(f"{args.input} lacks the input columns {', '.join(missing)} of the model "
+                             f"(rename columns with --rename OLD=NEW)")
+        chunks = itertools.chain([first], chunks)
+    writer = chunk_writer(args.output)
+
+    def write(chunk, results):
+        if args.keep_columns:
+            results = pd.concat([chunk, results], axis=1)
+        writer.write(results)
+
+    try:
+        if args.workers > 1:
+            pending = []
+            with multiprocessing.Pool(args.workers, initializer=_init_worker, initargs=(args.model,)) as pool:
+                for chunk, inputs in chunks:
+                    pending.append((chunk, pool.apply_async(_score_chunk_in_worker, (inputs,))))
+                    # keep a bounded number of chunks in flight, and write them in input order
+                    while len(pending) > 2 * args.workers or (pending and pending[0][1].ready()):
+                        chunk, result = pending.pop(0)
+                        write(chunk, result.get())
+                for chunk, result in pending:
+                    write(chunk, result.get())
+        else:
+            for chunk, inputs in chunks:
+                write(chunk, score_chunk(model_obj, inputs))
+    finally:
+        rows = writer.close()
+    print(f"Scored {rows} rows into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
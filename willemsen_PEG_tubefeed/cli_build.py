@@ -1,43 +1,60 @@
-from io import BytesIO
-import docker
-from docker import APIClient
 import os
+import shutil
+import sys
+import tempfile
+
+def build_container(dockerfile, image_name, context_dir, show_logs=False):
+    # imported here, so the build context can be staged (and tested) without docker
+    import docker
 
-def build_container(dockerfile, image_name, show_logs=False):    
     # write Dockerfile
-    with open('Dockerfile', 'w') as f:
+    with open(os.path.join(context_dir, 'Dockerfile'), 'w') as f:
         f.write(dockerfile)
     client = docker.from_env()
     # f = BytesIO(dockerfile.encode())
     # print(client.images.build(fileobj=f, rm=True, tag=image_name, path=os.path.abspath(os.path.curdir), custom_context=True))
-    image, build_log = client.images.build(path=os.path.abspath(os.path.curdir), rm=True, tag=image_name, nocache=True)
-    # delete Dockerfile
-    os.remove('Dockerfile')
+    image, build_log = client.images.build(path=context_dir, rm=True, tag=image_name, nocache=True)
     if show_logs:
         for line in build_log:
             if 'stream' in line:
                 print(line['stream'])
     return image
 
-#get input arguments
-import sys
-python_file = sys.argv[1]
-image_name = sys.argv[2]
-class_name = image_name
+# framework modules shipped next to main.py in every model image
+support_modules = [
+    "model_execution.py",
+    "model_registry.py",
+    "feature_schema.py",
+    "ndjson_stream.py",
+    "columnar.py",
+    "prediction_jobs.py",
+    "model_execution_default.py",
+    "prediction_cache.py",
+    "metrics.py",
+    "profiling.py",
+    "json_codec.py",
+    "request_models.py",
+    "record_batch.py",
+    "parallel_scoring.py",
+    "local_batch.py",
+    "model_validation.py",
+    "request_coalescing.py",
+    "model_warm_up.py",
+]
+# the service (main.py, its modules and requirements.txt) is taken from the directory of this script
+framework_dir = os.path.dirname(os.path.abspath(__file__))
 
-# if arguments have 3 elements, the third element is the class name
-if len(sys.argv) == 4:
-    class_name = sys.argv[3]
 
-module_name = python_file.replace('.py', '')
-# python:3.8
-dockerfile = f"""
+def render_dockerfile(python_file, module_name, class_name):
+    copy_support_modules = "\n".join(f"COPY {support_module} /app/{support_module}" for support_module in support_modules)
+    # python:3.8
+    return f"""
 FROM jvsoest/base_fairmodels
 LABEL org.opencontainers.image.source=https://github.com/maastrichtu-cds/faivor_models
 WORKDIR /app
 COPY {python_file} /app/{python_file}
 COPY requirements.txt /app/
-COPY model_execution.py /app/model_execution.py
+{copy_support_modules}
 COPY {module_name}.json /app/{module_name}.json
 ENV MODULE_NAME={module_name}
 ENV CLASS_NAME={class_name}
@@ -48,4 +65,34 @@ CMD ["python", "./main.py"]
 
 """
 
-image = build_container(dockerfile, image_name)
\ No newline at end of file
+
+def stage_context(python_file, module_name, context_dir):
+    """
+    Copy everything the Dockerfile copies into the build context directory.
+
+    The model file and its .json are taken from the current directory, the service from
+    framework_dir, so models in other folders get the same service, e.g.
+      cd stiphout_pCR-Clinical
+      python ../willemsen_PEG_tubefeed/cli_build.py stiphout_pCR_Clinical.py <image> stiphout_pCR_Clinical
+    """
+    for file_name in [python_file, f"{module_name}.json"]:
+        shutil.copy(file_name, context_dir)
+    for file_name in ["main.py", "requirements.txt"] + support_modules:
+        shutil.copy(os.path.join(framework_dir, file_name), context_dir)
+
+
+if __name__ == "__main__":
+    #get input arguments
+    python_file = sys.argv[1]
+    image_name = sys.argv[2]
+    class_name = image_name
+
+    # if arguments have 3 elements, the third element is the class name
+    if len(sys.argv) == 4:
+        class_name = sys.argv[3]
+
+    module_name = python_file.replace('.py', '')
+
+    with tempfile.TemporaryDirectory() as context_dir:
+        stage_context(python_file, module_name, context_dir)
+        image = build_container(render_dockerfile(python_file, module_name, class_name), image_name, context_dir)
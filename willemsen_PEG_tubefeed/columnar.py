@@ -0,0 +1,81 @@
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # columnar input is optional, JSON input works without pyarrow
+    pa = None
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPES = ("application/vnd.apache.parquet", "application/x-parquet")
+COLUMNAR_MEDIA_TYPES = (ARROW_STREAM_MEDIA_TYPE,) + PARQUET_MEDIA_TYPES
+
+
+def _media_type(content_type):
+    return (content_type or "").split(";")[0].strip().lower()
+
+
+def is_columnar(content_type):
+    """
+    Check whether a Content-Type header announces an Arrow IPC stream or a Parquet file.
+    """
+    return _media_type(content_type) in COLUMNAR_MEDIA_TYPES
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow is required for Arrow and Parquet input")
+
+
+def read_table(body, content_type):
+    """
+    Read an Arrow IPC stream or a Parquet file from a request body.
+
+    Parameters:
+    - body: the raw request body
+    - content_type: the Content-Type header of the request
+
+    Returns:
+    - table: a pyarrow Table
+    """
+    _require_pyarrow()
+    buffer = pa.py_buffer(body)
+    if _media_type(content_type) == ARROW_STREAM_MEDIA_TYPE:
+        return pa.ipc.open_stream(buffer).read_all()
+    return pa.parquet.read_table(pa.BufferReader(buffer))
+
+
+def table_to_columns(table):
+    """
+    Convert the columns of a pyarrow Table to numpy arrays, without copying where Arrow allows it.
+
+    Missing values become NaN (numerical columns) or None, and are rejected by the validation.
+
+    Returns:
+    - columns: a dictionary mapping column name to a numpy array
+    """
+    return {
+        name: table.column(name).to_numpy(zero_copy_only=False)
+        for name in table.column_names
+    }
+
+
+def write_probabilities(probabilities, columns=None):
+    """
+    Encode probabilities as an Arrow IPC stream with a "probability" column.
+
+    Parameters:
+    - probabilities: the probabilities, one per record
+    - columns: optional dictionary of input columns (e.g. a record_batch) written before the
+      probabilities
+
+    Returns:
+    - body: bytes of the Arrow IPC stream
+    """
+    _require_pyarrow()
+    arrays = {name: pa.array(column) for name, column in (columns or {}).items()}
+    arrays["probability"] = pa.array(probabilities, type=pa.float64())
+    table = pa.table(arrays)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,562 @@
+import operator
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from record_batch import _as_array, record_batch
+
+_DICT_TYPE = frozenset([dict])
+# exact types accepted by the column checks; bool is left out on purpose
+_NUMBER_TYPES = frozenset([int, float])
+# the same without strict types, where isinstance(True, int) lets booleans pass as numbers
+_LENIENT_NUMBER_TYPES = frozenset([int, float, bool])
+
+
+class feature_value_error(ValueError):
+    """
+    ValueError about one input feature.
+
+    Attributes:
+    - feature: name of the feature
+    - reason: "missing", "category" or "range"
+    """
+
+    def __init__(self, message: str, feature: str, reason: str):
+        super().__init__(message)
+        self.feature = feature
+        self.reason = reason
+
+
+class feature_type_error(TypeError):
+    """
+    TypeError about one input feature, raised when a numerical feature is not a number.
+
+    Attributes:
+    - feature: name of the feature
+    - reason: always "type"
+    """
+
+    def __init__(self, message: str, feature: str, reason: str = "type"):
+        super().__init__(message)
+        self.feature = feature
+        self.reason = reason
+
+
+def _metadata_value(entry: Dict[str, Any], key: str) -> Any:
+    """
+    Return the "@value" (or "@id") of a JSON-LD property, or None when it is absent or empty.
+    """
+    value = entry.get(key)
+    if isinstance(value, dict):
+        value = value.get("@value", value.get("@id"))
+    if value == "":
+        return None
+    return value
+
+
+def _scalar(value: Any) -> Any:
+    """
+    Convert a numpy scalar to the equivalent python value, for error messages and transforms.
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _parse_bound(entry: Dict[str, Any], key: str, feature: str) -> Optional[float]:
+    value = _metadata_value(entry, key)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid {key} value for feature '{feature}': {e}")
+
+
+def _parse_category(raw_value: Any) -> Any:
+    """
+    Convert category identifiers stored as strings to numbers when applicable.
+    """
+    if isinstance(raw_value, str):
+        try:
+            return int(raw_value)
+        except ValueError:
+            try:
+                return float(raw_value)
+            except ValueError:
+                pass
+    return raw_value
+
+
+class feature_spec:
+    """
+    Compiled description of a single model input.
+
+    Attributes:
+    - name: feature name, as used in the input records
+    - type: "numerical" or "categorical"
+    - minimum, maximum: allowed range for numerical features (None when not given)
+    - categories: frozenset of allowed values for categorical features (None when not given)
+    - required: whether the feature has to be present in every record
+    - transform: optional callable applied to a valid value before scoring
+    """
+
+    __slots__ = ("name", "type", "minimum", "maximum", "categories", "required", "transform")
+
+    def __init__(self, name: str, type: str = "numerical", minimum: Optional[float] = None,
+                 maximum: Optional[float] = None, categories: Optional[frozenset] = None,
+                 required: bool = True, transform: Optional[Callable[[Any], Any]] = None):
+        self.name = name
+        self.type = type
+        self.minimum = minimum
+        self.maximum = maximum
+        self.categories = categories
+        self.required = required
+        self.transform = transform
+
+    def __repr__(self):
+        return (f"feature_spec(name={self.name!r}, type={self.type!r}, minimum={self.minimum!r}, "
+                f"maximum={self.maximum!r}, categories={self.categories!r}, required={self.required!r})")
+
+
+class feature_schema:
+    """
+    Input features of a model, compiled once from the FAIR metadata and indexed by name.
+    """
+
+    def __init__(self, features: List[feature_spec], inclusive_bounds: bool = True, strict_types: bool = True,
+                 range_in_messages: bool = True):
+        self._features = {feature.name: feature for feature in features}
+        self.inclusive_bounds = inclusive_bounds
+        self.strict_types = strict_types
+        self.range_in_messages = range_in_messages
+        self._number_types = _NUMBER_TYPES if strict_types else _LENIENT_NUMBER_TYPES
+        # flattened per-feature checks, so validating a record does no attribute lookups
+        self._checks = tuple(
+            (feature.name, feature.categories, feature.type == "categorical", feature.minimum, feature.maximum,
+             feature.required, feature.transform)
+            for feature in features
+        )
+        self._within_bound = operator.le if inclusive_bounds else operator.lt
+        # transformed value of every category, so a whole column can be converted with dict lookups
+        self._category_codes = {}
+        for feature in features:
+            if feature.categories is not None and feature.transform is not None:
+                codes = {}
+                for category in feature.categories:
+                    try:
+                        codes[category] = feature.transform(category)
+                    except (TypeError, ValueError):
+                        pass  # left to the per-record checks, which raise the transform error
+                self._category_codes[feature.name] = codes
+
+    @classmethod
+    def from_metadata(cls, metadata: Dict[str, Any], transforms: Optional[Dict[str, Callable[[Any], Any]]] = None,
+                      optional_features: Optional[List[str]] = None, inclusive_bounds: bool = True,
+                      order: Optional[List[str]] = None, strict_types: bool = True,
+                      range_in_messages: bool = True) -> "feature_schema":
+        """
+        Compile the "Input data" section of FAIR (JSON-LD) model metadata.
+
+        Parameters:
+        - metadata: the model metadata, as fetched from fairmodels.org
+        - transforms: optional mapping of feature name to a callable converting a valid value for the model
+        - optional_features: names of features that may be left out of a record
+        - inclusive_bounds: whether the minimum and maximum themselves are allowed values
+        - order: names of the features in the order they are checked; the features not listed
+          follow in the order of the metadata
+        - strict_types: whether booleans are rejected as numbers and records must be dictionaries;
+          otherwise numbers are checked with isinstance(value, (int, float)), so True and False pass
+        - range_in_messages: whether the error for an out-of-range value gives the allowed range
+
+        Returns:
+        - schema: the compiled feature schema
+        """
+        transforms = transforms or {}
+        optional_features = set(optional_features or [])
+
+        features = []
+        for entry in metadata.get("Input data", []):
+            if not isinstance(entry, dict):
+                continue
+            name = _metadata_value(entry, "Description")
+            if name is None:
+                continue
+
+            categories = [
+                _parse_category(_metadata_value(category, "Identification for category used in model"))
+                for category in entry.get("Categories", [])
+                if isinstance(category, dict)
+            ]
+            categories = frozenset(value for value in categories if value is not None) or None
+
+            input_type = _metadata_value(entry, "Type of input")
+            if input_type is None:
+                input_type = "categorical" if categories else "numerical"
+
+            features.append(feature_spec(
+                name=name,
+                type=input_type,
+                minimum=_parse_bound(entry, "Minimum - for numerical", name),
+                maximum=_parse_bound(entry, "Maximum - for numerical", name),
+                categories=categories,
+                required=name not in optional_features,
+                transform=transforms.get(name),
+            ))
+        if order:
+            position = {name: index for index, name in enumerate(order)}
+            features.sort(key=lambda feature: position.get(feature.name, len(position)))
+        return cls(features, inclusive_bounds, strict_types, range_in_messages)
+
+    def __getitem__(self, name: str) -> feature_spec:
+        try:
+            return self._features[name]
+        except KeyError:
+            raise ValueError(f"No metadata found for feature '{name}'")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._features
+
+    def __iter__(self) -> Iterator[feature_spec]:
+        return iter(self._features.values())
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    def get(self, name: str) -> Optional[feature_spec]:
+        return self._features.get(name)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._features)
+
+    def example_record(self) -> Dict[str, Any]:
+        """
+        Build a synthetic record that is valid for this schema, e.g. to warm up a model.
+
+        Numerical features get the middle of their range (or a value next to their only bound,
+        or 0), categorical features their smallest category. Optional features are left out.
+
+        Returns:
+        - record: dictionary with a value for every required feature
+        """
+        record = {}
+        for feature in self:
+            if not feature.required:
+                continue
+            if feature.type == "categorical":
+                categories = sorted(feature.categories or (0,), key=lambda category: (isinstance(category, str), category))
+                record[feature.name] = categories[0]
+            elif feature.minimum is not None and feature.maximum is not None:
+                record[feature.name] = (feature.minimum + feature.maximum) / 2
+            elif feature.minimum is not None:
+                record[feature.name] = feature.minimum + 1.0
+            elif feature.maximum is not None:
+                record[feature.name] = feature.maximum - 1.0
+            else:
+                record[feature.name] = 0.0
+        return record
+
+    def _is_number(self, value: Any) -> bool:
+        if self.strict_types and isinstance(value, bool):  # isinstance(True, int) == True
+            return False
+        return isinstance(value, (int, float))
+
+    def _range_error(self, name: str, location: str, value: Any, minimum: Optional[float],
+                     maximum: Optional[float]) -> feature_value_error:
+        message = f"Invalid {name} value{location}: {value}"
+        if self.range_in_messages:
+            message += f" (Allowed range: {minimum}-{maximum})"
+        return feature_value_error(message, name, "range")
+
+    def _check_feature(self, check: tuple, record: Any, location: str):
+        """
+        Check one feature of a record and apply its transform in place.
+        """
+        name, categories, categorical, minimum, maximum, required, transform = check
+        if name not in record:
+            if required:
+                raise feature_value_error(f"Missing {name}{location}", name, "missing")
+            return
+
+        value = record[name]
+        if categorical:
+            if categories is not None:
+                try:
+                    allowed = value in categories
+                except TypeError:  # unhashable values are never a category
+                    allowed = False
+                if not allowed:
+                    raise feature_value_error(f"Invalid {name} value{location}: {value}", name, "category")
+        else:
+            if not self._is_number(value):
+                raise feature_type_error(f"Invalid {name} type{location}, expected a number", name)
+            if (minimum is not None and not self._within_bound(minimum, value)) or \
+                    (maximum is not None and not self._within_bound(value, maximum)):
+                raise self._range_error(name, location, value, minimum, maximum)
+
+        if transform is not None:
+            record[name] = transform(value)
+
+    def validate_record(self, record: Any, index: Optional[int] = None) -> Any:
+        """
+        Validate all features of a single record in one pass and apply the transforms in place.
+
+        Parameters:
+        - record: dictionary containing the input data of one patient
+        - index: position of the record in the request, used in error messages
+
+        Returns:
+        - record: the same dictionary, with transformed values
+
+        Raises:
+        - feature_value_error (a ValueError) if a feature is missing, out of range or not one of the allowed categories
+        - feature_type_error (a TypeError) if a numerical feature is not a number
+        - TypeError if the record is not a dict
+        """
+        location = f" in item {index}" if index is not None else ""
+        if self.strict_types and not isinstance(record, dict):
+            if index is not None:
+                raise TypeError(f"Invalid input at item {index}: expected a dict")
+            raise TypeError("Input data must be a dict or list of dicts")
+
+        check_feature = self._check_feature
+        for check in self._checks:
+            check_feature(check, record, location)
+        return record
+
+    def _validate_columns(self, data: List[Any]) -> bool:
+        """
+        Validate a list of records column by column, applying the transforms in place.
+
+        Each feature is checked for the whole batch at once with set, min and max operations.
+        Records are only modified when the whole batch is valid.
+
+        Returns:
+        - valid: False when some record fails a check; the records are then left untouched
+        """
+        if not data:
+            return True
+        if not _DICT_TYPE.issuperset(map(type, data)):
+            return False
+
+        within_bound = self._within_bound
+        converted = []
+        for name, categories, categorical, minimum, maximum, required, transform in self._checks:
+            try:
+                column = [record[name] for record in data]
+            except KeyError:
+                return False
+
+            if categorical:
+                if categories is not None:
+                    try:
+                        if not categories.issuperset(column):
+                            return False
+                    except TypeError:
+                        return False
+                if transform is not None:
+                    codes = self._category_codes.get(name)
+                    try:
+                        if codes is not None:
+                            converted.append((name, [codes[value] for value in column]))
+                        else:
+                            converted.append((name, [transform(value) for value in column]))
+                    except (KeyError, TypeError, ValueError):
+                        return False
+            else:
+                value_types = set(map(type, column))
+                if not self._number_types.issuperset(value_types):
+                    return False
+                # NaN never compares as in range, but would slip through min() and max();
+                # a NaN anywhere in the column makes the sum NaN
+                if float in value_types:
+                    total = sum(column)
+                    if total != total:
+                        return False
+                if (minimum is not None and not within_bound(minimum, min(column))) or \
+                        (maximum is not None and not within_bound(max(column), maximum)):
+                    return False
+                if transform is not None:
+                    try:
+                        converted.append((name, [transform(value) for value in column]))
+                    except (TypeError, ValueError):
+                        return False
+
+        for name, column in converted:
+            for record, value in zip(data, column):
+                record[name] = value
+        return True
+
+    def validate(self, data: Any) -> Any:
+        """
+        Validate a record or a list of records, applying the transforms in place.
+
+        A list is first checked column by column. If any record is invalid, the features are
+        checked one by one, each in every record, which raises the error for the first record
+        that is invalid in the first feature that is invalid in some record.
+
+        Parameters:
+        - data: a dictionary, or list with multiple dictionaries, containing the input data
+
+        Returns:
+        - data: the same object, with transformed values
+        """
+        if isinstance(data, list):
+            if self._validate_columns(data):
+                return data
+            check_feature = self._check_feature
+            for check in self._checks:
+                for index, record in enumerate(data):
+                    if self.strict_types and not isinstance(record, dict):
+                        raise TypeError(f"Invalid input at item {index}: expected a dict")
+                    check_feature(check, record, f" in item {index}")
+            return data
+        return self.validate_record(data)
+
+    def apply_transforms(self, data: Any) -> Any:
+        """
+        Apply the transforms to a record or a list of records that were already validated
+        against this schema (e.g. by its typed request model), in place.
+
+        Parameters:
+        - data: a dictionary, or list with multiple dictionaries, containing valid input data
+
+        Returns:
+        - data: the same object, with transformed values
+        """
+        records = data if isinstance(data, list) else [data]
+        for name, _, _, _, _, _, transform in self._checks:
+            if transform is None:
+                continue
+            codes = self._category_codes.get(name, {})
+            for record in records:
+                if name in record:
+                    value = record[name]
+                    record[name] = codes[value] if value in codes else transform(value)
+        return data
+
+    def validate_each(self, data: List[Any], positions: Optional[Sequence[int]] = None):
+        """
+        Validate every record of a list independently, applying the transforms in place.
+
+        Parameters:
+        - data: a list of dictionaries containing the input data
+        - positions: position of every record in the request, used in error messages; by default
+          the position in the list
+
+        Returns:
+        - validated: the records, with None in place of every invalid record
+        - errors: a dictionary mapping the index of every invalid record to its exception
+        """
+        if self._validate_columns(data):
+            return data, {}
+
+        if positions is None:
+            positions = range(len(data))
+        validated = []
+        errors = {}
+        validate_record = self.validate_record
+        for index, (record, position) in enumerate(zip(data, positions)):
+            try:
+                validated.append(validate_record(record, position))
+            except Exception as e:
+                validated.append(None)
+                errors[index] = e
+        return validated, errors
+
+    def _numeric_column(self, name: str, column: np.ndarray) -> np.ndarray:
+        """
+        Return a numerical column as float64 array, raising a TypeError for the first non-number.
+        """
+        if column.dtype.kind in ("iuf" if self.strict_types else "biuf"):
+            return column.astype(np.float64, copy=False)
+        for index, value in enumerate(column):
+            if not self._is_number(_scalar(value)):
+                raise feature_type_error(f"Invalid {name} type in item {index}, expected a number", name)
+        return column.astype(np.float64)
+
+    def _category_mask(self, column: np.ndarray, categories: frozenset) -> np.ndarray:
+        """
+        Return a boolean array telling which values of a column are allowed categories.
+        """
+        if column.dtype.kind in "iufb":
+            numeric_categories = [category for category in categories
+                                  if isinstance(category, (int, float)) and not isinstance(category, bool)]
+            return np.isin(column, numeric_categories)
+
+        def allowed(value):
+            try:
+                return _scalar(value) in categories
+            except TypeError:  # unhashable values are never a category
+                return False
+
+        return np.fromiter((allowed(value) for value in column), dtype=bool, count=len(column))
+
+    def _transform_column(self, name: str, column: np.ndarray, transform: Callable[[Any], Any]) -> np.ndarray:
+        """
+        Apply the transform of a categorical feature to a whole column through the precomputed category codes.
+        """
+        codes = self._category_codes.get(name, {})
+        numeric = column.dtype.kind in "iufb"
+        transformed = np.zeros(len(column), dtype=np.result_type(*codes.values()) if codes else np.float64)
+        assigned = np.zeros(len(column), dtype=bool)
+        for category, code in codes.items():
+            if numeric and not isinstance(category, (int, float)):
+                continue
+            matches = column == category
+            transformed[matches] = code
+            assigned |= matches
+
+        # values without a precomputed code raise the error of the transform itself
+        for index in np.flatnonzero(~assigned):
+            transformed[index] = transform(_scalar(column[index]))
+        return transformed
+
+    def validate_columns(self, columns: Dict[str, Any]) -> record_batch:
+        """
+        Validate input given as one array per feature, with vectorized range and membership checks.
+
+        Parameters:
+        - columns: a dictionary (or record_batch) mapping feature name to a sequence or numpy array of values
+
+        Returns:
+        - batch: a new record_batch with the same columns, transformed where needed
+
+        Raises:
+        - feature_value_error (a ValueError) if a feature is missing, out of range or not one of the allowed categories
+        - feature_type_error (a TypeError) if a numerical feature contains something else than numbers
+        """
+        validated = {name: _as_array(column) for name, column in columns.items()}
+        if len({len(column) for column in validated.values()}) > 1:
+            raise ValueError("All input columns must have the same length")
+
+        for name, categories, categorical, minimum, maximum, required, transform in self._checks:
+            if name not in validated:
+                if required:
+                    raise feature_value_error(f"Missing {name}", name, "missing")
+                continue
+
+            column = validated[name]
+            if categorical:
+                if categories is not None:
+                    invalid = ~self._category_mask(column, categories)
+                    if invalid.any():
+                        index = int(np.argmax(invalid))
+                        raise feature_value_error(
+                            f"Invalid {name} value in item {index}: {_scalar(column[index])}", name, "category")
+                if transform is not None:
+                    validated[name] = self._transform_column(name, column, transform)
+            else:
+                numeric = self._numeric_column(name, column)
+                # comparisons with NaN are False, so NaN values are reported as out of range
+                valid = np.ones(len(numeric), dtype=bool)
+                if minimum is not None:
+                    valid &= (numeric >= minimum) if self.inclusive_bounds else (numeric > minimum)
+                if maximum is not None:
+                    valid &= (numeric <= maximum) if self.inclusive_bounds else (numeric < maximum)
+                if not valid.all():
+                    index = int(np.argmin(valid))
+                    raise self._range_error(name, f" in item {index}", _scalar(column[index]), minimum, maximum)
+                validated[name] = numeric
+                if transform is not None:
+                    validated[name] = np.array([transform(_scalar(value)) for value in column])
+        return record_batch(validated)
@@ -0,0 +1,51 @@
+import json
+
+import numpy as np
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib json module is used without it
+    orjson = None
+
+
+def loads(data):
+    """
+    Parse a JSON document from bytes or str.
+
+    Raises:
+    - ValueError if the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value):
+    """
+    Encode a value as JSON bytes; numpy arrays and scalars are encoded as lists and numbers.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, default=_default, separators=(",", ":")).encode()
+
+
+class json_response(Response):
+    """
+    JSON response encoded with dumps.
+
+    Returning it from an endpoint skips FastAPI's jsonable_encoder, which walks every element of
+    the result again before encoding it, and dominates the time of batch predictions.
+    """
+    media_type = "application/json"
+
+    def render(self, content):
+        return dumps(content)
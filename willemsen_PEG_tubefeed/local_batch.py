@@ -0,0 +1,98 @@
+import os
+
+import numpy as np
+
+from columnar import table_to_columns
+from record_batch import record_batch
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:  # Arrow files are optional, .npy files work without pyarrow
+    pa = None
+
+ARROW_EXTENSIONS = (".arrow", ".arrows", ".feather", ".ipc")
+NUMPY_EXTENSIONS = (".npy",)
+
+
+def resolve_path(data_dir, path):
+    """
+    Resolve a path sent by a client against the local data directory.
+
+    Parameters:
+    - data_dir: the directory shared with the clients
+    - path: a path relative to data_dir
+
+    Returns:
+    - path: the absolute path, with symbolic links resolved
+
+    Raises:
+    - ValueError if the path points outside data_dir
+    """
+    base = os.path.realpath(data_dir)
+    resolved = os.path.realpath(os.path.join(base, path))
+    if os.path.commonpath([base, resolved]) != base:
+        raise ValueError(f"Path is outside the local data directory: {path}")
+    return resolved
+
+
+def _extension(path):
+    return os.path.splitext(path)[1].lower()
+
+
+def read_columns(path):
+    """
+    Memory-map a columnar input file.
+
+    Supported are Arrow IPC files and streams (.arrow, .arrows, .feather, .ipc) and .npy files
+    holding a structured array with one field per input parameter. The columns are views of the
+    mapped file, so the file is read by the page cache as the columns are used, without copying
+    it into the process (Arrow columns with missing values, and tables of several record
+    batches, are the exception).
+
+    Returns:
+    - batch: a record_batch of the input columns
+
+    Raises:
+    - ValueError if the file type is not supported, or the file is not valid
+    - ImportError for Arrow files when pyarrow is not installed
+    """
+    extension = _extension(path)
+    if extension in NUMPY_EXTENSIONS:
+        array = np.load(path, mmap_mode="r", allow_pickle=False)
+        if array.dtype.names is None:
+            raise ValueError("A .npy input must hold a structured array with one field per input parameter")
+        return record_batch({name: array[name] for name in array.dtype.names})
+    if extension in ARROW_EXTENSIONS:
+        if pa is None:
+            raise ImportError("pyarrow is required for Arrow input")
+        source = pa.memory_map(path, "r")
+        try:
+            table = pa.ipc.open_file(source).read_all()
+        except pa.ArrowInvalid:  # not the file format, try the stream format
+            source.seek(0)
+            table = pa.ipc.open_stream(source).read_all()
+        return record_batch(table_to_columns(table))
+    raise ValueError(f"Unsupported input file type: {extension or path}")
+
+
+def write_probabilities(path, probabilities):
+    """
+    Write probabilities to a memory-mapped .npy file holding a float64 array.
+
+    The file is written next to its destination first and then renamed, so readers never see a
+    partially written file.
+    """
+    if _extension(path) not in NUMPY_EXTENSIONS:
+        raise ValueError(f"Unsupported output file type: {_extension(path) or path}, use .npy")
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        output = np.lib.format.open_memmap(temporary_path, mode="w+", dtype=np.float64, shape=(len(probabilities),))
+        output[:] = probabilities
+        output.flush()
+        del output
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
@@ -1,19 +1,25 @@
 # local build
-# fm-build willemsen_tubefeed.py willemsen_tubefeed
+# python cli_build.py willemsen_tubefeed.py willemsen_tubefeed
 
 # Run model
 docker run -d --rm --name tubefeed -p 8000:8000 ghcr.io/maastrichtu-cds/faivor_models/willemsen_tubefeed:latest
 
-wait 20
+# wait until the model is loaded and warmed up (at most 60 seconds)
+for attempt in $(seq 1 300); do
+    curl -sf http://localhost:8000/readyz > /dev/null && break
+    sleep 0.2
+done
 
-curl -X POST -H "Content-type: application/json" -d @input.json http://localhost:8000/predict
+curl -X POST -H "Content-type: application/json" -d @input.json "http://localhost:8000/predict?async=true"
 
-wait 5
+# wait until the job has completed (status 3) or failed (status 2)
+for attempt in $(seq 1 300); do
+    curl -s http://localhost:8000/status | grep -q '"status":[23]' && break
+    sleep 0.2
+done
 
 curl http://localhost:8000/status
 
-wait 5
-
 curl http://localhost:8000/result
 
 docker stop tubefeed
\ No newline at end of file
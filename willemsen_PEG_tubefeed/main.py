@@ -1,55 +1,549 @@
+import asyncio
 import os
-from typing import List, Union
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import Optional
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from starlette.requests import ClientDisconnect
 
-app = FastAPI()
+import json_codec
+import local_batch
+import metrics
+import profiling
+
+from columnar import ARROW_STREAM_MEDIA_TYPE, PARQUET_MEDIA_TYPES, is_columnar, read_table, table_to_columns, \
+    write_probabilities
+from model_execution import generalized_linear_model
+from model_registry import model_registry, multi_model_registry
+from model_warm_up import warm_up
+from model_validation import pop_outcomes, validate_columns, validate_records, validation_accumulator
+from parallel_scoring import parallel_scorer
+from prediction_cache import prediction_cache
+from record_batch import record_batch
+from request_coalescing import request_coalescer
+from prediction_jobs import JOB_COMPLETED, job_manager, job_queue_full
+from request_models import get_request_model
+from ndjson_stream import NDJSON_MEDIA_TYPE, encode_results, iter_batches, iter_records, ndjson_line_error, \
+    ndjson_streaming_response, predict_batch, request_body
+
+registry = model_registry.from_environment()
+# further models served under /models/{name}/..., loaded on first use
+models = multi_model_registry.from_environment()
+# cache of predictions shared by all models, enabled by PREDICTION_CACHE_SIZE
+generalized_linear_model.prediction_cache = prediction_cache.from_environment()
+# number of records validated and scored together by the streaming endpoint
+STREAM_BATCH_SIZE = int(os.environ.get("STREAM_BATCH_SIZE", "1000"))
+# upper limit of the batch_size of a request, so a client cannot make the service hold its whole input
+MAX_STREAM_BATCH_SIZE = max(STREAM_BATCH_SIZE, int(os.environ.get("MAX_STREAM_BATCH_SIZE", "100000")))
+# worker pool for asynchronous predictions (POST /predict?async=true), scored in JOB_PROCESSES processes
+jobs = job_manager(
+    max_workers=int(os.environ.get("JOB_WORKERS", "2")),
+    max_pending=int(os.environ.get("JOB_MAX_PENDING", "16")),
+    max_finished=int(os.environ.get("JOB_MAX_FINISHED", "32")),
+    chunk_size=int(os.environ.get("JOB_CHUNK_SIZE", "10000")),
+    processes=int(os.environ.get("JOB_PROCESSES", "2")),
+    finished_ttl=float(os.environ.get("JOB_TTL_SECONDS", "3600")),
+)
+# worker processes scoring batches of at least SCORING_PROCESS_THRESHOLD rows, enabled by SCORING_PROCESSES
+scorer = parallel_scorer.from_environment()
+# upper limit of the bootstrap resamples of /validate
+MAX_BOOTSTRAP_RESAMPLES = int(os.environ.get("MAX_BOOTSTRAP_RESAMPLES", "100000"))
+# directory shared with clients on the same node (e.g. a mounted volume), enables /predict/local
+LOCAL_DATA_DIR = os.environ.get("LOCAL_DATA_DIR")
+# models served under /models/{name} that are warmed up before /readyz reports ready ("all" for every one)
+WARM_UP_MODELS = os.environ.get("WARM_UP_MODELS", "")
+# outcome of the warm-up at startup, reported by /readyz
+readiness = {"status": "starting", "models": {}}
+
+
+def warm_up_models():
+    """
+    Load and warm up the default model and the models listed in WARM_UP_MODELS, then mark the
+    service ready (or failed, with the error as detail).
+    """
+    targets = []
+    if registry.configured or not len(models):
+        targets.append(("/predict", registry.get))
+    if WARM_UP_MODELS.strip().lower() == "all":
+        names = models.names()
+    else:
+        names = [name.strip() for name in WARM_UP_MODELS.split(",") if name.strip()]
+    for name in names:
+        targets.append((f"/models/{name}/predict", lambda name=name: models.get(name)))
+    try:
+        for path, get in targets:
+            readiness["models"][path] = warm_up(get())
+    except Exception as e:
+        readiness["detail"] = f"Warm-up of {path} failed: {e}"
+        readiness["status"] = "failed"
+        return
+    readiness["status"] = "ready"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # load and warm up the models in the background, so the first request does not pay for it and
+    # /healthz answers while they load
+    warm_up_task = asyncio.ensure_future(run_in_threadpool(warm_up_models))
+    yield
+    if not warm_up_task.done():
+        warm_up_task.cancel()
+    jobs.shutdown()
+    scorer.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
+if metrics.enabled:
+    app.add_middleware(metrics.metrics_middleware)
+# profiles requests sending an X-Profile header (or sampled by PROFILE_SAMPLE_RATE), when PROFILING_ENABLED is set
+profiler = profiling.profiler.from_environment() if profiling.enabled else None
+if profiler is not None:
+    app.add_middleware(profiling.profiling_middleware, profiler=profiler)
+
+async def run_model(func, *args, **kwargs):
+    """
+    Run model code in the thread pool, so it does not block the event loop (and is included in
+    the profile of the request, if it is being profiled).
+    """
+    return await run_in_threadpool(profiling.tracked(func), *args, **kwargs)
+
+# scores concurrent single-record predictions together, enabled by COALESCE_MAX_DELAY_MS
+coalescer = request_coalescer.from_environment(run_model)
 
 def get_model():
     """
-    Get the model object based on the environment variables.
+    Get the model object shared by all requests in this process.
 
     Returns:
     - instance: the model object
     """
-    module_name = os.environ.get("MODULE_NAME")
-    class_name = os.environ.get("CLASS_NAME")
+    if not registry.configured and len(models):
+        raise HTTPException(status_code=404, detail="No default model, use /models/{name}/predict")
+    return registry.get()
 
-    # import the module
-    module = __import__(module_name)
-    class_ = getattr(module, class_name)
-    instance = class_()
-    return instance
+async def get_named_model(name):
+    """
+    Get a model served under /models/{name}, loading it outside the event loop on first use.
+
+    Returns:
+    - instance: the model object
+    """
+    if name not in models:
+        raise HTTPException(status_code=404, detail=f"Unknown model: {name}")
+    if models.loaded(name):
+        return models.get(name)
+    return await run_model(models.get, name)
+
+@app.get("/healthz")
+async def healthz():
+    """
+    Liveness probe: the server is up and its event loop is answering requests.
+    """
+    return {"status": "ok"}
+
+@app.get("/readyz")
+async def readyz():
+    """
+    Readiness probe: the default model (and the models listed in WARM_UP_MODELS) are loaded,
+    their feature schemas compiled and a synthetic in-range record has been scored.
+
+    Returns:
+    - readiness: status "ready" with the warm-up of every model; status code 503 while the status
+      is "starting", or when it is "failed"
+    """
+    return JSONResponse(status_code=200 if readiness["status"] == "ready" else 503, content=readiness)
 
 @app.get("/")
 def read_root():
     """
     Get the available models and their endpoints.
+
+    Models served under /models/{name} that have not been used yet are listed without loading
+    them, so their model_uri and model_name are only included once they are loaded.
     """
-    model_metadata = get_model().get_model_metadata()
-    return {
-        "models": [
-                {
-                    "model_uri": model_metadata["model_uri"],
-                    "model_name": model_metadata["model_name"],
-                    "path": "/predict",
-                    "path_parameters": "/input_parameters",
-                }
-            ]
-    }
+    available_models = []
+    if registry.configured or not len(models):
+        model_metadata = get_model().get_model_metadata()
+        available_models.append({
+            "model_uri": model_metadata["model_uri"],
+            "model_name": model_metadata["model_name"],
+            "path": "/predict",
+            "path_parameters": "/input_parameters",
+        })
+    for name in models.names():
+        model_info = {"name": name, "loaded": models.loaded(name)}
+        if model_info["loaded"]:
+            model_metadata = models.get(name).get_model_metadata()
+            model_info["model_uri"] = model_metadata["model_uri"]
+            model_info["model_name"] = model_metadata["model_name"]
+        model_info["path"] = f"/models/{name}/predict"
+        model_info["path_parameters"] = f"/models/{name}/input_parameters"
+        available_models.append(model_info)
+    return {"models": available_models}
+
+# request body of /predict, documented by hand as the body is parsed according to its content type
+PREDICT_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {
+            "schema": {
+                "anyOf": [
+                    {"type": "object"},
+                    {"type": "array", "items": {"type": "object"}},
+                ]
+            }
+        },
+        ARROW_STREAM_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+        **{media_type: {"schema": {"type": "string", "format": "binary"}} for media_type in PARQUET_MEDIA_TYPES},
+    },
+}
 
-@app.post("/predict")
-def predict(data: Union[dict, List[dict]]):
+
+@app.post("/predict", openapi_extra={"requestBody": PREDICT_REQUEST_BODY})
+async def predict(request: Request, partial: bool = False,
+                  asynchronous: bool = Query(False, alias="async"), echo: bool = False):
     """
     Calculate the probability for the current model.
 
+    The request body is either JSON (a dictionary, or a list of dictionaries, containing the input
+    data) or a table with one column per input parameter, sent as an Arrow IPC stream or a Parquet
+    file. Tables are scored column-wise and answered with an Arrow IPC stream holding a single
+    "probability" column (or {"probability": [...]} when the client only accepts JSON).
+
     Parameters:
-    - data: a dictionary (or list of dictionaries) containing the input data
+    - partial: for a JSON list, score every valid record and report an error per invalid record,
+      instead of failing the whole list
+    - async: queue the prediction as a job and return its id right away; poll /status/{job_id} and
+      fetch the results from /result/{job_id}
+    - echo: for table input, return the input columns next to the probability (a list of records
+      with a "probability" key when the client only accepts JSON)
 
     Returns:
     - probability: the probability which the model calculates
     """
-    model_obj = get_model()
-    return model_obj.predict(data)
+    with metrics.stage_timer(None, "get_model"):
+        model_obj = get_model()
+    return await predict_request(model_obj, request, partial, asynchronous, echo, registry.spec)
+
+@app.post("/models/{name}/predict", openapi_extra={"requestBody": PREDICT_REQUEST_BODY})
+async def predict_named_model(name: str, request: Request, partial: bool = False,
+                              asynchronous: bool = Query(False, alias="async"), echo: bool = False):
+    """
+    Calculate the probability for the model served under a name, see /predict.
+    """
+    with metrics.stage_timer(None, "get_model"):
+        model_obj = await get_named_model(name)
+    return await predict_request(model_obj, request, partial, asynchronous, echo, models.spec(name))
+
+async def predict_request(model_obj, request, partial, asynchronous, echo=False, model_spec=None):
+    """
+    Score the body of a prediction request with a model, according to its content type.
+
+    Parameters:
+    - model_spec: the specification of the model, used to build it in the parallel_scorer workers
+    """
+    content_type = request.headers.get("content-type")
+    if is_columnar(content_type):
+        return await predict_columnar(model_obj, request, content_type, echo, model_spec)
+
+    body = await request.body()
+    # profiled requests are scored on their own, so their profile only holds their own work
+    coalesce = coalescer.enabled and not asynchronous and profiling.current_profile.get() is None
+    request_model = get_request_model(model_obj)
+    start = body.lstrip()[:1]
+    if request_model is not None and not asynchronous and (start == b"[" or (start == b"{" and not coalesce)):
+        # a record or list of records is decoded and validated in one pass; invalid input takes the
+        # regular path below, which reports the error
+        with metrics.stage_timer(model_obj, "parse"):
+            validated = request_model.validate_request_json(body)
+        if isinstance(validated, list):
+            metrics.observe_records(model_obj, len(validated))
+            if scorer.accepts(len(validated)):
+                return json_codec.json_response(await run_model(scorer.predict, model_obj, model_spec, validated))
+            return json_codec.json_response(await run_model(model_obj.predict_validated, validated))
+        if validated is not None:
+            metrics.observe_records(model_obj, 1)
+            return json_codec.json_response(await run_model(model_obj.predict_validated, validated))
+
+    try:
+        with metrics.stage_timer(model_obj, "parse"):
+            data = json_codec.loads(body)
+    except ValueError:
+        return JSONResponse(status_code=422, content={"detail": "Request body is not valid JSON"})
+    if not isinstance(data, (dict, list)):
+        return JSONResponse(status_code=422, content={"detail": "Request body must be a JSON object or array"})
+    metrics.observe_records(model_obj, len(data) if isinstance(data, list) else 1)
+
+    if asynchronous:
+        try:
+            job = jobs.submit(model_obj, data, partial, model_spec)
+        except job_queue_full as e:
+            return JSONResponse(status_code=503, content={"detail": str(e)})
+        return JSONResponse(status_code=202, content={
+            **job.describe(),
+            "status_url": f"/status/{job.job_id}",
+            "result_url": f"/result/{job.job_id}",
+        })
+
+    if coalesce and isinstance(data, dict):
+        # validated and scored together with the records of concurrent requests
+        return json_codec.json_response(await coalescer.predict(model_obj, data))
+    if partial and isinstance(data, list):
+        return json_codec.json_response(await run_model(model_obj.predict_records, data))
+    if isinstance(data, list) and scorer.accepts(len(data)):
+        return json_codec.json_response(await run_model(scorer.predict, model_obj, model_spec, data))
+    return json_codec.json_response(await run_model(model_obj.predict, data))
+
+async def predict_columnar(model_obj, request, content_type, echo=False, model_spec=None):
+    """
+    Score an Arrow IPC stream or Parquet request body without building a dictionary per record.
+
+    The input is held as a record_batch; dictionaries are only built for echo output in JSON.
+    """
+    body = await request.body()
+    try:
+        with metrics.stage_timer(model_obj, "parse"):
+            columns = record_batch(table_to_columns(read_table(body, content_type)))
+    except ImportError as e:
+        return JSONResponse(status_code=415, content={"detail": str(e)})
+    except Exception as e:
+        return {"error": f"Validation error: Could not read {content_type} input: {str(e)}"}
+    del body
+    metrics.observe_records(model_obj, len(columns))
+
+    if scorer.accepts(len(columns)):
+        probabilities = await run_model(scorer.predict_columns, model_obj, model_spec, columns)
+    else:
+        probabilities = await run_model(model_obj.predict_columns, columns)
+    if isinstance(probabilities, dict):
+        return probabilities
+
+    accept = request.headers.get("accept", "")
+    if "application/json" in accept and ARROW_STREAM_MEDIA_TYPE not in accept:
+        if echo:
+            records = columns.to_records()
+            for record, probability in zip(records, probabilities):
+                record["probability"] = probability
+            return json_codec.json_response(records)
+        return json_codec.json_response({"probability": probabilities})
+    body = write_probabilities(probabilities, columns if echo else None)
+    return Response(body, media_type=ARROW_STREAM_MEDIA_TYPE)
+
+@app.post("/predict/stream")
+async def predict_stream(request: Request, batch_size: int = Query(STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE)):
+    """
+    Calculate the probabilities for newline-delimited JSON input, streaming the results back.
+
+    Every line of the request body holds one input dictionary (or a JSON array of them). Records
+    are validated and scored in micro-batches of batch_size while the body is being received.
+
+    Parameters:
+    - batch_size: number of records scored together, at most MAX_STREAM_BATCH_SIZE
+
+    Returns:
+    - results: newline-delimited JSON, one {"index": i, "probability": p} or {"index": i, "error": message}
+      object per input record, in input order
+    """
+    return stream_predictions(get_model(), request, batch_size)
+
+@app.post("/models/{name}/predict/stream")
+async def predict_stream_named_model(name: str, request: Request,
+                                     batch_size: int = Query(STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE)):
+    """
+    Calculate the probabilities for newline-delimited JSON input with the model served under a name,
+    see /predict/stream.
+    """
+    return stream_predictions(await get_named_model(name), request, batch_size)
+
+def stream_predictions(model_obj, request, batch_size):
+    batch_size = max(1, batch_size)
+
+    async def stream_results():
+        body = request_body(request)
+        start_index = 0
+        try:
+            async for batch in iter_batches(iter_records(body), batch_size):
+                # no more scoring for a client that has gone away
+                if await body.disconnected():
+                    return
+                results = await run_model(predict_batch, model_obj, batch, start_index)
+                yield encode_results(results, start_index)
+                start_index += len(batch)
+        except ClientDisconnect:
+            return  # the client went away while sending the body
+
+    return ndjson_streaming_response(stream_results())
+
+@app.post("/validate")
+async def validate(request: Request, outcome: str, partial: bool = False,
+                   batch_size: int = Query(STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE),
+                   bootstrap: int = Query(0, ge=0, le=MAX_BOOTSTRAP_RESAMPLES),
+                   confidence: float = Query(0.95, gt=0, lt=1), seed: Optional[int] = None):
+    """
+    Score a validation cohort and compute the performance of the model on it, returning only the
+    summary (the predictions are not sent back).
+
+    The request body holds the input parameters plus an outcome (0 or 1) per record: a JSON list
+    of dictionaries, newline-delimited JSON (Content-Type: application/x-ndjson, scored while it
+    is being received), or an Arrow IPC stream or Parquet file with an outcome column.
+
+    Parameters:
+    - outcome: name of the outcome in the records, e.g. pCR
+    - partial: for JSON input, leave invalid records out (they are counted as excluded) instead
+      of failing
+    - batch_size: number of records scored together, at most MAX_STREAM_BATCH_SIZE
+    - bootstrap: number of bootstrap resamples for percentile confidence intervals of the
+      metrics (0 for none); the resamples run in the SCORING_PROCESSES worker processes
+    - confidence: confidence level of the intervals
+    - seed: seed of the resamples, to reproduce the intervals (a random seed is drawn and
+      returned when not given)
+
+    Returns:
+    - summary: records, events and excluded records, AUC, Brier score, calibration intercept
+      (calibration-in-the-large) and slope, and observed/expected ratio; with bootstrap, also
+      the [low, up] interval per metric
+    """
+    with metrics.stage_timer(None, "get_model"):
+        model_obj = get_model()
+    summary_options = {"resamples": bootstrap, "confidence": confidence, "seed": seed, "map_function": scorer.map}
+    return await validate_request(model_obj, request, outcome, partial, batch_size, registry.spec, summary_options)
+
+@app.post("/models/{name}/validate")
+async def validate_named_model(name: str, request: Request, outcome: str, partial: bool = False,
+                               batch_size: int = Query(STREAM_BATCH_SIZE, ge=1, le=MAX_STREAM_BATCH_SIZE),
+                               bootstrap: int = Query(0, ge=0, le=MAX_BOOTSTRAP_RESAMPLES),
+                               confidence: float = Query(0.95, gt=0, lt=1), seed: Optional[int] = None):
+    """
+    Compute the performance of the model served under a name on a validation cohort, see /validate.
+    """
+    with metrics.stage_timer(None, "get_model"):
+        model_obj = await get_named_model(name)
+    summary_options = {"resamples": bootstrap, "confidence": confidence, "seed": seed, "map_function": scorer.map}
+    return await validate_request(model_obj, request, outcome, partial, batch_size, models.spec(name), summary_options)
+
+async def validate_request(model_obj, request, outcome, partial, batch_size, model_spec=None, summary_options=None):
+    """
+    Compute the performance of a model on the cohort in the body of a /validate request,
+    according to its content type.
+    """
+    batch_size = max(1, batch_size)
+    summary_options = summary_options or {}
+    content_type = request.headers.get("content-type")
+    if is_columnar(content_type):
+        body = await request.body()
+        try:
+            with metrics.stage_timer(model_obj, "parse"):
+                columns = record_batch(table_to_columns(read_table(body, content_type)))
+        except ImportError as e:
+            return JSONResponse(status_code=415, content={"detail": str(e)})
+        except Exception as e:
+            return {"error": f"Validation error: Could not read {content_type} input: {str(e)}"}
+        del body
+        metrics.observe_records(model_obj, len(columns))
+
+        def predict_columns(inputs):
+            if scorer.accepts(len(columns)):
+                return scorer.predict_columns(model_obj, model_spec, record_batch(inputs))
+            return model_obj.predict_columns(inputs)
+
+        return await run_model(validate_columns, model_obj, columns, outcome, predict_columns, **summary_options)
+
+    if (content_type or "").split(";")[0].strip().lower() == NDJSON_MEDIA_TYPE:
+        return await validate_stream(model_obj, request, outcome, partial, batch_size, summary_options)
+
+    try:
+        with metrics.stage_timer(model_obj, "parse"):
+            data = json_codec.loads(await request.body())
+    except ValueError:
+        return JSONResponse(status_code=422, content={"detail": "Request body is not valid JSON"})
+    if not isinstance(data, list):
+        return JSONResponse(status_code=422, content={"detail": "Request body must be a JSON array"})
+    metrics.observe_records(model_obj, len(data))
+    return await run_model(validate_records, model_obj, data, outcome, batch_size, partial, **summary_options)
+
+async def validate_stream(model_obj, request, outcome, partial, batch_size, summary_options):
+    """
+    Compute the performance of a model on a newline-delimited JSON cohort, batch by batch while
+    the body is being received.
+    """
+    accumulator = validation_accumulator()
+    start_index = 0
+    async for batch in iter_batches(iter_records(request.stream()), batch_size):
+        for index, record in enumerate(batch, start_index):
+            if isinstance(record, ndjson_line_error):
+                return {"error": f"{record.message} (item {index})"}
+        try:
+            outcomes = pop_outcomes(batch, outcome, start_index)
+        except ValueError as e:
+            return {"error": f"Validation error: {str(e)}"}
+        results = await run_model(predict_batch, model_obj, batch, start_index)
+        if not partial:
+            for result in results:
+                if isinstance(result, dict):
+                    return result
+        try:
+            accumulator.add(results, outcomes)
+        except ValueError as e:
+            return {"error": f"Validation error: {str(e)}"}
+        start_index += len(batch)
+    metrics.observe_records(model_obj, start_index)
+    return await run_model(accumulator.summary, **summary_options)
+
+def get_job(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found" if job_id else "No jobs submitted")
+    return job
+
+@app.get("/status")
+@app.get("/status/{job_id}")
+def get_status(job_id: Optional[str] = None):
+    """
+    Get the status of an asynchronous prediction (the most recent one when no job id is given).
+
+    Returns:
+    - status: job id, status code (0 queued, 1 running, 2 failed, 3 completed), message and progress
+    """
+    return get_job(job_id).describe()
+
+@app.get("/result")
+@app.get("/result/{job_id}")
+def get_result(job_id: Optional[str] = None, offset: int = 0, limit: Optional[int] = None):
+    """
+    Get the results of a completed asynchronous prediction (the most recent one when no job id is given).
+
+    Parameters:
+    - offset: index of the first result to return
+    - limit: maximum number of results to return (all remaining results by default)
+
+    Returns:
+    - results: the job status plus the requested page of results, aligned with the input records
+    """
+    job = get_job(job_id)
+    if job.status != JOB_COMPLETED:
+        return JSONResponse(status_code=409, content=job.describe())
+    offset = max(0, offset)
+    end = len(job.results) if limit is None else offset + max(0, limit)
+    return {
+        **job.describe(),
+        "offset": offset,
+        "results": job.results[offset:end],
+    }
+
+@app.get("/cache")
+def get_cache_stats():
+    """
+    Get the size and the hit/miss counters of the prediction cache.
+
+    Returns:
+    - stats: the cache statistics, or {"enabled": false} when PREDICTION_CACHE_SIZE is not set
+    """
+    cache = generalized_linear_model.prediction_cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
 
 @app.get("/input_parameters")
 def get_input_parameters():
@@ -62,6 +556,209 @@ def get_input_parameters():
     model_obj = get_model()
     return model_obj.get_input_parameters()
 
+@app.get("/input_schema")
+def get_input_schema():
+    """
+    Get the JSON schema of the /predict request body, generated from the model metadata.
+
+    Returns:
+    - schema: JSON schema of one input record or a list of them, with types, ranges and categories
+    """
+    request_model = get_request_model(get_model())
+    if request_model is None:
+        raise HTTPException(status_code=404, detail="The model has no input metadata")
+    return request_model.json_schema()
+
+@app.get("/models/{name}/input_schema")
+async def get_named_model_input_schema(name: str):
+    """
+    Get the JSON schema of the /models/{name}/predict request body, generated from the model metadata.
+    """
+    request_model = get_request_model(await get_named_model(name))
+    if request_model is None:
+        raise HTTPException(status_code=404, detail="The model has no input metadata")
+    return request_model.json_schema()
+
+@app.get("/models/{name}/input_parameters")
+async def get_named_model_input_parameters(name: str):
+    """
+    Get the input parameters of the model served under a name.
+
+    Returns:
+    - input_parameters: a list of input parameters
+    """
+    model_obj = await get_named_model(name)
+    return model_obj.get_input_parameters()
+
+def openapi():
+    """
+    Generate the OpenAPI document, documenting the JSON body of /predict with the request schema
+    of the model.
+    """
+    if app.openapi_schema:
+        return app.openapi_schema
+    document = get_openapi(title=app.title, version=app.version, routes=app.routes)
+    request_model = get_request_model(get_model()) if registry.configured else None
+    if request_model is not None:
+        request_schema = request_model.json_schema(ref_template="#/components/schemas/{model}")
+        document.setdefault("components", {}).setdefault("schemas", {}).update(request_schema.pop("$defs", {}))
+        document["paths"]["/predict"]["post"]["requestBody"]["content"]["application/json"]["schema"] = request_schema
+    app.openapi_schema = document
+    return document
+
+app.openapi = openapi
+
+def predict_local_file(model_obj, model_spec, input_path, output_path):
+    """
+    Score a memory-mapped input file and write the probabilities to a memory-mapped output file.
+    """
+    try:
+        with metrics.stage_timer(model_obj, "parse"):
+            columns = local_batch.read_columns(input_path)
+    except ImportError:
+        raise
+    except Exception as e:
+        return {"error": f"Validation error: Could not read input file: {str(e)}"}
+    metrics.observe_records(model_obj, len(columns))
+
+    if scorer.accepts(len(columns)):
+        probabilities = scorer.predict_columns(model_obj, model_spec, columns)
+    else:
+        probabilities = model_obj.predict_columns(columns)
+    if isinstance(probabilities, dict):
+        return probabilities
+    try:
+        local_batch.write_probabilities(output_path, probabilities)
+    except OSError as e:
+        return {"error": f"Could not write output file: {str(e)}"}
+    return {"rows": len(probabilities)}
+
+async def predict_local(model_obj, request, model_spec):
+    """
+    Score the file named in the body of a /predict/local request.
+    """
+    try:
+        paths = json_codec.loads(await request.body())
+    except ValueError:
+        paths = None
+    if not isinstance(paths, dict) or not isinstance(paths.get("input"), str) \
+            or not isinstance(paths.get("output"), str):
+        return JSONResponse(status_code=422, content={"detail": 'Request body must be {"input": path, "output": path}'})
+    try:
+        input_path = local_batch.resolve_path(LOCAL_DATA_DIR, paths["input"])
+        output_path = local_batch.resolve_path(LOCAL_DATA_DIR, paths["output"])
+    except ValueError as e:
+        return JSONResponse(status_code=403, content={"detail": str(e)})
+    if not output_path.endswith(".npy"):
+        return JSONResponse(status_code=422, content={"detail": "The output file must be a .npy file"})
+
+    try:
+        result = await run_model(predict_local_file, model_obj, model_spec, input_path, output_path)
+    except ImportError as e:
+        return JSONResponse(status_code=415, content={"detail": str(e)})
+    if "error" in result:
+        return result
+    return {"input": paths["input"], "output": paths["output"], **result}
+
+if LOCAL_DATA_DIR:
+    @app.post("/predict/local")
+    async def predict_local_default(request: Request):
+        """
+        Score a columnar file placed in LOCAL_DATA_DIR, for clients on the same node.
+
+        Only the paths are sent: {"input": "cohort.arrow", "output": "cohort_probabilities.npy"},
+        relative to LOCAL_DATA_DIR. The input is an Arrow IPC file or stream, or a .npy file
+        holding a structured array with one field per input parameter; it is memory-mapped and
+        scored without copying it into the request. The probabilities are written to the output
+        file as a float64 .npy array (read it with numpy.load(path, mmap_mode="r")).
+
+        Returns:
+        - result: the input and output paths and the number of rows scored, or {"error": message}
+        """
+        with metrics.stage_timer(None, "get_model"):
+            model_obj = get_model()
+        return await predict_local(model_obj, request, registry.spec)
+
+    @app.post("/models/{name}/predict/local")
+    async def predict_local_named_model(name: str, request: Request):
+        """
+        Score a columnar file placed in LOCAL_DATA_DIR with the model served under a name, see /predict/local.
+        """
+        with metrics.stage_timer(None, "get_model"):
+            model_obj = await get_named_model(name)
+        return await predict_local(model_obj, request, models.spec(name))
+
+if metrics.enabled:
+    @app.get("/metrics")
+    def get_metrics():
+        """
+        Get the request, stage and validation metrics in the Prometheus text format.
+        """
+        return PlainTextResponse(metrics.registry.render(), media_type=metrics.PROMETHEUS_MEDIA_TYPE)
+
+if profiler is not None:
+    @app.get("/profiles")
+    def list_profiles():
+        """
+        Get the stored request profiles, most recent first, and the current sampling settings.
+        """
+        return {"sample_rate": profiler.sample_rate, "profiles": profiler.store.list()}
+
+    @app.get("/profiles/{profile_id}")
+    def get_profile(profile_id: str):
+        """
+        Get a request profile as folded stacks, to be rendered with flamegraph.pl or speedscope.
+        """
+        profile = profiler.store.get(profile_id)
+        if profile is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return PlainTextResponse(profile.folded(), media_type=profiling.FOLDED_MEDIA_TYPE)
+
+    @app.post("/profiles/sampling")
+    def set_profile_sampling(sample_rate: float):
+        """
+        Set the fraction of prediction requests that are profiled without an X-Profile header.
+        """
+        if not 0 <= sample_rate <= 1:
+            raise HTTPException(status_code=422, detail="sample_rate must be between 0 and 1")
+        profiler.sample_rate = sample_rate
+        return {"sample_rate": profiler.sample_rate}
+
+if os.environ.get("ALLOW_MODEL_RELOAD", "").lower() in ("1", "true", "yes"):
+    @app.post("/reload")
+    def reload_model():
+        """
+        Reload the model module from disk and swap in the new model instance.
+
+        Returns:
+        - model: the name and uri of the reloaded model
+        """
+        model_metadata = registry.reload().get_model_metadata()
+        scorer.reset(registry.spec)
+        jobs.reset()
+        return {
+            "model_uri": model_metadata["model_uri"],
+            "model_name": model_metadata["model_name"],
+        }
+
+    @app.post("/models/{name}/reload")
+    def reload_named_model(name: str):
+        """
+        Reload the model served under a name from disk and swap in the new model instance.
+
+        Returns:
+        - model: the name and uri of the reloaded model
+        """
+        if name not in models:
+            raise HTTPException(status_code=404, detail=f"Unknown model: {name}")
+        model_metadata = models.reload(name).get_model_metadata()
+        scorer.reset(models.spec(name))
+        jobs.reset()
+        return {
+            "model_uri": model_metadata["model_uri"],
+            "model_name": model_metadata["model_name"],
+        }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
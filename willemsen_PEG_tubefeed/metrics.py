@@ -0,0 +1,258 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+
+# collect metrics and serve /metrics; when off, every helper below returns right away
+enabled = os.environ.get("METRICS_ENABLED", "").lower() in ("1", "true", "yes")
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+SECONDS_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+RECORDS_BUCKETS = (1, 10, 100, 1000, 10000, 100000, 1000000)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+BYTES_BUCKETS = (256, 1024, 16384, 262144, 1048576, 16777216, 268435456)
+
+_NULL_TIMER = nullcontext()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(labelnames, labels, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labels)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class counter:
+    """
+    Monotonic counter with a fixed set of label names.
+    """
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+class histogram:
+    """
+    Histogram with fixed bucket upper bounds and a fixed set of label names.
+    """
+
+    def __init__(self, name, documentation, labelnames=(), buckets=SECONDS_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._states.get(labels)
+            if state is None:
+                # counts per bucket (the last one is +Inf), sum
+                state = self._states[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            states = [(labels, list(state[0]), state[1]) for labels, state in self._states.items()]
+        for labels, counts, total in states:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                bucket_labels = _format_labels(self.labelnames, labels, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class metrics_registry:
+    """
+    Collection of metrics, rendered together in the Prometheus text format.
+    """
+
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name, documentation, labelnames=()):
+        metric = counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, documentation, labelnames=(), buckets=SECONDS_BUCKETS):
+        metric = histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = metrics_registry()
+REQUEST_SECONDS = registry.histogram(
+    "faivor_request_duration_seconds", "Time from receiving a request until its response is sent.",
+    ("endpoint", "status"))
+REQUEST_BYTES = registry.histogram(
+    "faivor_request_body_bytes", "Size of the request bodies.", ("endpoint",), BYTES_BUCKETS)
+REQUEST_RECORDS = registry.histogram(
+    "faivor_request_records", "Number of input records per prediction request.", ("model",), RECORDS_BUCKETS)
+COALESCED_RECORDS = registry.histogram(
+    "faivor_coalesced_batch_records", "Number of single-record requests scored together by the request coalescer.",
+    ("model",), BATCH_BUCKETS)
+STAGE_SECONDS = registry.histogram(
+    "faivor_stage_duration_seconds", "Time spent per stage of a prediction (parse, get_model, preprocess, score).",
+    ("model", "stage"))
+SCORED_RECORDS = registry.counter(
+    "faivor_scored_records_total", "Number of records scored; divide its rate by the rate of the "
+    "score stage duration sum for the scoring throughput.", ("model",))
+PREDICTION_ERRORS = registry.counter(
+    "faivor_prediction_errors_total", "Number of records rejected, by feature and error type.",
+    ("model", "feature", "error_type"))
+
+
+def model_label(model_obj):
+    """
+    Get the label identifying a model in the metrics: its model name, or its class name.
+    """
+    if model_obj is None:
+        return ""
+    label = model_obj.__dict__.get("_metrics_label")
+    if label is None:
+        try:
+            label = model_obj.get_model_metadata().get("model_name")
+        except Exception:
+            label = None
+        label = label or type(model_obj).__name__
+        model_obj._metrics_label = label
+    return label
+
+
+class _stage_timer:
+    __slots__ = ("labels", "start")
+
+    def __init__(self, labels):
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        STAGE_SECONDS.observe(self.labels, time.perf_counter() - self.start)
+        return False
+
+
+def stage_timer(model_obj, stage):
+    """
+    Context manager timing one stage of a prediction; a shared no-op when metrics are off.
+
+    Parameters:
+    - model_obj: the model object, or None for stages before the model is known
+    - stage: name of the stage, e.g. "preprocess" or "score"
+    """
+    if not enabled:
+        return _NULL_TIMER
+    return _stage_timer((model_label(model_obj), stage))
+
+
+def count_scored(model_obj, records):
+    if enabled and records:
+        SCORED_RECORDS.inc((model_label(model_obj),), records)
+
+
+def count_errors(model_obj, errors):
+    """
+    Count rejected records by feature and error type.
+
+    Parameters:
+    - model_obj: the model object
+    - errors: iterable of the exceptions raised for the rejected records
+    """
+    if not enabled:
+        return
+    label = model_label(model_obj)
+    for e in errors:
+        # feature_value_error / feature_type_error tell which feature failed and how
+        feature = getattr(e, "feature", "")
+        error_type = getattr(e, "reason", None) or type(e).__name__
+        PREDICTION_ERRORS.inc((label, feature, error_type))
+
+
+def observe_records(model_obj, records):
+    if enabled:
+        REQUEST_RECORDS.observe((model_label(model_obj),), records)
+
+
+def observe_coalesced(model_obj, records):
+    if enabled:
+        COALESCED_RECORDS.observe((model_label(model_obj),), records)
+
+
+class metrics_middleware:
+    """
+    ASGI middleware recording the duration, status and body size of every request.
+
+    Requests are labelled with the name of the endpoint function that handled them, so the
+    number of label values stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        body_bytes = 0
+        status = [500]
+
+        async def counting_receive():
+            nonlocal body_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                body_bytes += len(message.get("body", b""))
+            return message
+
+        async def status_send(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, counting_receive, status_send)
+        finally:
+            endpoint = scope.get("endpoint")
+            endpoint = getattr(endpoint, "__name__", "unknown")
+            REQUEST_SECONDS.observe((endpoint, str(status[0])), time.perf_counter() - start)
+            if body_bytes:
+                REQUEST_BYTES.observe((endpoint,), body_bytes)
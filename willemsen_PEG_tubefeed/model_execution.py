@@ -1,8 +1,56 @@
+import hashlib
 import json
-from math import exp
+from math import exp, sqrt
+
+import numpy as np
+
+import metrics
+from feature_schema import feature_schema
+from record_batch import record_batch
 
 
 class model_execution:
+    # FAIR (JSON-LD) metadata describing the model inputs; subclasses set this to enable the feature schema
+    fair_metadata = None
+    # callables converting validated input values for the model, keyed by feature name
+    feature_transforms = {}
+    # whether the metadata minimum/maximum are themselves allowed values
+    feature_bounds_inclusive = True
+    # order in which the features are checked (and their errors reported), metadata order when None
+    feature_order = None
+    # whether booleans are rejected as numbers (see feature_schema.from_metadata)
+    feature_strict_types = True
+    # whether the error for an out-of-range value gives the allowed range
+    feature_range_in_messages = True
+    # whether _preprocess does nothing but validate and transform the input according to the
+    # feature schema, so input validated elsewhere against the schema only needs its transforms
+    schema_preprocessing = False
+
+    def get_feature_schema(self):
+        """
+        Get the feature schema compiled from the FAIR metadata of this model.
+
+        The schema of a model class is compiled on first use and cached on the class, so the
+        metadata is parsed once per model class instead of on every prediction. Models built
+        from data files instead set their own schema on the instance.
+
+        Returns:
+        - schema: the compiled feature_schema, or None when the model has no metadata
+        """
+        schema = self.__dict__.get("_feature_schema")
+        if schema is not None:
+            return schema
+        cls = type(self)
+        schema = cls.__dict__.get("_feature_schema")
+        if schema is None and cls.fair_metadata is not None:
+            schema = feature_schema.from_metadata(cls.fair_metadata, cls.feature_transforms,
+                                                  inclusive_bounds=cls.feature_bounds_inclusive,
+                                                  order=cls.feature_order,
+                                                  strict_types=cls.feature_strict_types,
+                                                  range_in_messages=cls.feature_range_in_messages)
+            cls._feature_schema = schema
+        return schema
+
     def get_model_metadata(self):
         return {
             "model_name": None,
@@ -42,6 +90,28 @@ class model_execution:
 
         return None
 
+    def _calculate_probability_batch(self, data):
+        """
+        Calculate the probabilities for a list of patients.
+
+        Parameters:
+        - data: a list of dictionaries containing the input data
+
+        Returns:
+        - probabilities: a list with one probability per input dictionary
+        """
+
+        return [self._calculate_probability_single(item) for item in data]
+
+    def _calculate_probability(self, input_object):
+        """
+        Calculate the probability for a preprocessed dictionary, or the probabilities for a list of them.
+        """
+        if isinstance(input_object, dict):
+            return self._calculate_probability_single(input_object)
+        elif isinstance(input_object, list):
+            return self._calculate_probability_batch(input_object)
+
     def predict(self, input_object):
         """
         Calculate the probability of 2-year survival for a patient with given covariates.
@@ -49,35 +119,361 @@ class model_execution:
         Parameters:
         - input_object: a dictionary or list containing the input data
         """
+        return self._predict(input_object, self._preprocess)
 
+    def predict_validated(self, input_object):
+        """
+        Calculate the probability for input that was already validated against the feature schema
+        (by the typed request model, see request_models), applying only the transforms.
+
+        Parameters:
+        - input_object: a dictionary or list containing valid input data
+        """
+        if not self.schema_preprocessing:
+            return self.predict(input_object)
+        return self._predict(input_object, self.get_feature_schema().apply_transforms)
+
+    def _predict(self, input_object, preprocess):
         # Preprocess the input data
         try:
-            input_object = self._preprocess(input_object)
+            with metrics.stage_timer(self, "preprocess"):
+                input_object = preprocess(input_object)
             # Calculate the probability
-            if isinstance(input_object, dict):
-                return self._calculate_probability_single(input_object)
-            elif isinstance(input_object, list):
-                return [self._calculate_probability_single(item) for item in input_object]
+            with metrics.stage_timer(self, "score"):
+                probability = self._calculate_probability(input_object)
+            metrics.count_scored(self, len(input_object) if isinstance(input_object, list) else 1)
+            return probability
+
+        except Exception as e:
+            metrics.count_errors(self, (e,))
+            return {"error": error_message(e)}
+
+    def _preprocess_record(self, record, index):
+        """
+        Preprocess one record of a list, naming its position in the request in any error.
+
+        Models whose validation can name the record themselves override this; by default the
+        position is appended to the message of the error raised by _preprocess.
+
+        Parameters:
+        - record: a dictionary containing the input data of one record
+        - index: position of the record in the request
+
+        Returns:
+        - preprocessed_data: the preprocessed record
+        """
+        try:
+            return self._preprocess(record)
+        except Exception as e:
+            e.args = (f"{e} (item {index})",)
+            raise
+
+    def _preprocess_each(self, data, positions=None):
+        """
+        Preprocess every record of a list independently.
+
+        Parameters:
+        - data: a list of dictionaries containing the input data
+        - positions: position of every record in the request, used in error messages; by default
+          the position in the list
+
+        Returns:
+        - preprocessed_data: a list with the preprocessed record, or None for records that failed
+        - errors: a dictionary mapping the index of every failed record to its exception
+        """
+        if positions is None:
+            positions = range(len(data))
+        preprocessed_data = []
+        errors = {}
+        for index, (item, position) in enumerate(zip(data, positions)):
+            try:
+                preprocessed_data.append(self._preprocess_record(item, position))
+            except Exception as e:
+                preprocessed_data.append(None)
+                errors[index] = e
+        return preprocessed_data, errors
+
+    def predict_records(self, input_object, positions=None):
+        """
+        Calculate the probability for every record of a list independently.
 
+        Invalid records do not affect the others: the valid records are scored together and
+        every invalid record gets its own error, which names the record as on the path that
+        validates the whole list.
 
-        except ValueError as e:  # Handle specific errors
+        Parameters:
+        - input_object: a list of dictionaries containing the input data
+        - positions: position of every record in the request, used in error messages; by default
+          the position in the list
 
-            return {"error": f"Validation error: {str(e)}"}
+        Returns:
+        - results: a list aligned with the input, holding either the probability or {"error": message}
+        """
+        if not isinstance(input_object, list):
+            raise TypeError("Input data must be a list of dicts")
 
+        with metrics.stage_timer(self, "preprocess"):
+            preprocessed_data, errors = self._preprocess_each(input_object, positions)
+        return self._score_each(input_object, preprocessed_data, errors)
+
+    def predict_each(self, records):
+        """
+        Calculate the probability for single records of separate requests together.
 
-        except TypeError as e:
+        Every record is preprocessed on its own, as by predict, so an invalid record gets the same
+        error as when it is scored on its own; the valid records are scored together.
 
-            return {"error": f"Type error: {str(e)}"}
+        Parameters:
+        - records: a list of dictionaries, each containing the input data of one request
+
+        Returns:
+        - results: a list aligned with the records, holding either the probability or {"error": message}
+        """
+        preprocessed_data = []
+        errors = {}
+        with metrics.stage_timer(self, "preprocess"):
+            for index, record in enumerate(records):
+                try:
+                    preprocessed_data.append(self._preprocess(record))
+                except Exception as e:
+                    preprocessed_data.append(None)
+                    errors[index] = e
+        return self._score_each(records, preprocessed_data, errors)
+
+    def _score_each(self, input_object, preprocessed_data, errors):
+        """
+        Score the preprocessed records of predict_records or predict_each, keeping every error apart.
+        """
+        metrics.count_errors(self, errors.values())
+        results = [None] * len(input_object)
+        for index, e in errors.items():
+            results[index] = {"error": error_message(e)}
+
+        valid_indices = [index for index in range(len(input_object)) if index not in errors]
+        valid_data = [preprocessed_data[index] for index in valid_indices]
+        try:
+            with metrics.stage_timer(self, "score"):
+                probabilities = self._calculate_probability(valid_data)
+            metrics.count_scored(self, len(valid_data))
+        except Exception:
+            # find the records that cannot be scored
+            probabilities = []
+            for index, item in zip(valid_indices, valid_data):
+                try:
+                    probabilities.append(self._calculate_probability_single(item))
+                except Exception as e:
+                    probabilities.append({"error": error_message(e)})
+
+        for index, probability in zip(valid_indices, probabilities):
+            results[index] = probability
+        return results
+
+
+    def iter_predictions(self, input_object, chunk_size, partial=False):
+        """
+        Calculate the probabilities for a list in chunks, yielding the results of every chunk.
 
+        Parameters:
+        - input_object: a list of dictionaries containing the input data
+        - chunk_size: number of records scored together
+        - partial: score every record independently (see predict_records); otherwise the whole
+          list is validated first and any invalid record raises
+
+        Yields:
+        - results: list with the results of the next chunk of records, in input order
+        """
+        if not isinstance(input_object, list):
+            raise TypeError("Input data must be a list of dicts")
+
+        if partial:
+            for start in range(0, len(input_object), chunk_size):
+                yield self.predict_records(input_object[start:start + chunk_size],
+                                           range(start, min(start + chunk_size, len(input_object))))
+            return
+
+        input_object = self._preprocess(input_object)
+        batch = self._pack_batch(input_object)
+        if batch is None:
+            for start in range(0, len(input_object), chunk_size):
+                yield self._calculate_probability_batch(input_object[start:start + chunk_size])
+            return
+
+        # the model inputs are in the batch now, so the records can be freed while scoring
+        input_object = None
+        for start in range(0, len(batch), chunk_size):
+            yield self._calculate_probability_columns(batch.take(slice(start, start + chunk_size))).tolist()
+
+    def _pack_batch(self, records):
+        """
+        Pack preprocessed records into a record_batch holding only the model inputs.
+
+        Returns:
+        - batch: the record_batch, or None when the model scores dictionaries only
+        """
+        return None
+
+    def _preprocess_columns(self, columns):
+        """
+        Convert input given as one array per feature into the correct format for the model.
+
+        The default goes through the records and _preprocess; models whose preprocessing is fully
+        described by the feature schema override this with a vectorized version.
+
+        Parameters:
+        - columns: a dictionary mapping feature name to an array of values
+
+        Returns:
+        - preprocessed_columns: a record_batch of the preprocessed values
+        """
+        names = list(columns.keys())
+        records = [dict(zip(names, (_python_value(value) for value in row))) for row in zip(*columns.values())]
+        records = self._preprocess(records)
+        return record_batch.from_records(records, names)
+
+    def _calculate_probability_columns(self, columns):
+        """
+        Calculate the probabilities for input given as one array per feature.
 
-        except Exception as e:  # Catch all unexpected errors
+        Parameters:
+        - columns: a record_batch (or dictionary) mapping feature name to a numpy array of preprocessed values
 
-            return {"error": f"Unexpected error: {str(e)}"}
+        Returns:
+        - probabilities: float64 numpy array with one probability per row
+        """
+        names = list(columns.keys())
+        records = [dict(zip(names, row)) for row in zip(*columns.values())]
+        return np.asarray(self._calculate_probability_batch(records), dtype=np.float64)
 
+    def predict_columns(self, columns):
+        """
+        Calculate the probabilities for input given as one array per feature (e.g. an Arrow table).
 
+        Parameters:
+        - columns: a record_batch, or a dictionary mapping feature name to an array of values
 
+        Returns:
+        - probabilities: float64 numpy array with one probability per row, or {"error": message}
+        """
+        try:
+            with metrics.stage_timer(self, "preprocess"):
+                columns = self._preprocess_columns(columns)
+            with metrics.stage_timer(self, "score"):
+                probabilities = self._calculate_probability_columns(columns)
+            metrics.count_scored(self, len(probabilities))
+            return probabilities
+        except Exception as e:
+            metrics.count_errors(self, (e,))
+            return {"error": error_message(e)}
+
+
+def _python_value(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def error_message(e):
+    """
+    Format an exception raised while preprocessing or scoring as an error message for the client.
+    """
+    if isinstance(e, ValueError):  # Handle specific errors
+        return f"Validation error: {str(e)}"
+    if isinstance(e, TypeError):
+        return f"Type error: {str(e)}"
+    return f"Unexpected error: {str(e)}"  # Catch all unexpected errors
+
+
+def _sigmoid(linear_predictor):
+    """
+    Numerically stable logistic function for numpy arrays (does not overflow for large |x|).
+    """
+    exp_neg_abs = np.exp(-np.abs(linear_predictor))
+    return np.where(linear_predictor >= 0, 1 / (1 + exp_neg_abs), exp_neg_abs / (1 + exp_neg_abs))
+
+
+# coefficients of the rational approximations of erf and erfc of the Cephes library (ndtr.c),
+# accurate to about 1e-16
+_ERF_T = (9.60497373987051638749E0, 9.00260197203842689217E1, 2.23200534594684319226E3,
+          7.00332514112805075473E3, 5.55923013010394962768E4)
+_ERF_U = (1.0, 3.35617141647503099647E1, 5.21357949780152679795E2, 4.59432382970980127987E3,
+          2.26290000613890934246E4, 4.92673942608635921086E4)
+_ERFC_P = (2.46196981473530512524E-10, 5.64189564831068821977E-1, 7.46321056442269912687E0,
+           4.86371970985681366614E1, 1.96520832956077098242E2, 5.26445194995477358631E2,
+           9.34528527171957607540E2, 1.02755188689515710272E3, 5.57535335369399327526E2)
+_ERFC_Q = (1.0, 1.32281951154744992508E1, 8.67072140885989742329E1, 3.54937778887819891062E2,
+           9.75708501743205489753E2, 1.82390916687909736289E3, 2.24633760818710981792E3,
+           1.65666309194161350182E3, 5.57535340817727675546E2)
+_ERFC_R = (5.64189583547755073984E-1, 1.27536670759978104416E0, 5.01905042251180477414E0,
+           6.16021097993053585195E0, 7.40974269950448939160E0, 2.97886665372100240670E0)
+_ERFC_S = (1.0, 2.26052863220117276590E0, 9.39603524938001434673E0, 1.20489539808096656605E1,
+           1.70814450747565897222E1, 9.60896809063285878198E0, 3.36907645100081516050E0)
+
+
+def _polynomial(x, coefficients):
+    result = np.full_like(x, coefficients[0])
+    for coefficient in coefficients[1:]:
+        result *= x
+        result += coefficient
+    return result
+
+
+def _erf_small(x):
+    """
+    erf for numpy arrays with |x| <= 1.
+    """
+    x_squared = x * x
+    return x * _polynomial(x_squared, _ERF_T) / _polynomial(x_squared, _ERF_U)
+
+
+def _inverse_probit(linear_predictor):
+    """
+    Standard normal cumulative distribution function for numpy arrays: the ndtr algorithm of
+    Cephes (also behind scipy.special.ndtr), which keeps its precision in the tails.
+    """
+    x = np.asarray(linear_predictor, dtype=np.float64) / sqrt(2)
+    z = np.abs(x)
+    # |x| < 1: 0.5 + 0.5 * erf(x)
+    central = _erf_small(np.clip(x, -1, 1))
+    central *= 0.5
+    central += 0.5
+    # |x| >= 1: the probability in the tail beyond |x|, 0.5 * erfc(|x|)
+    clipped = np.clip(z, 1, 8)
+    tail = _polynomial(clipped, _ERFC_P)
+    tail /= _polynomial(clipped, _ERFC_Q)
+    with np.errstate(under="ignore"):
+        tail *= 0.5 * np.exp(-clipped * clipped)
+    far = np.flatnonzero(z >= 8)
+    if len(far):
+        # beyond |x| = 38 the tail underflows to 0, while the polynomials may overflow
+        far_z = np.minimum(z[far], 38)
+        tail[far] = np.where(z[far] < 38, 0.5 * np.exp(-far_z * far_z) * _polynomial(far_z, _ERFC_R)
+                             / _polynomial(far_z, _ERFC_S), 0.0)
+    return np.where(z < 1, central, np.where(x > 0, 1 - tail, tail))
+
+
+def _inverse_cloglog(linear_predictor):
+    return -np.expm1(-np.exp(linear_predictor))
+
+
+# inverse link functions of the generalized linear models, by link name
+INVERSE_LINK_FUNCTIONS = {
+    "identity": np.asarray,
+    "logit": _sigmoid,
+    "log": np.exp,
+    "probit": _inverse_probit,
+    "cloglog": _inverse_cloglog,
+}
+
+
+class generalized_linear_model(model_execution):
+    """
+    Model computing an outcome from a linear predictor (intercept plus weighted covariates) and a link function.
+
+    The model parameters hold "intercept" and "covariate_weights", and optionally a "link_function"
+    overriding the link of the class (see INVERSE_LINK_FUNCTIONS).
+    """
+    link = "identity"
+    # optional prediction_cache shared by all instances, consulted by predict() and predict_records()
+    prediction_cache = None
 
-class logistic_regression(model_execution):
     def __init__(self, model_parameters=None, model_path=None):
         self._model_parameters = None
         if model_path is not None:
@@ -103,6 +499,177 @@ class logistic_regression(model_execution):
         """
         return list(self._model_parameters['covariate_weights'].keys())
 
+    def _get_coefficients(self):
+        """
+        Get the covariate names, the weight vector and the intercept of the model.
+
+        The weight vector is built once and reused until the model parameters are replaced.
+
+        Returns:
+        - covariates: list of covariate names, in the order of the weight vector
+        - weights: float64 numpy array with the covariate weights
+        - intercept: the intercept as float
+        """
+        cached = getattr(self, "_coefficients", None)
+        if cached is None or cached[0] is not self._model_parameters:
+            covariate_weights = self._model_parameters['covariate_weights']
+            covariates = list(covariate_weights.keys())
+            weights = np.array([float(weight) for weight in covariate_weights.values()], dtype=np.float64)
+            cached = (self._model_parameters, covariates, weights, float(self._model_parameters['intercept']))
+            self._coefficients = cached
+        return cached[1:]
+
+    def _get_cache_namespace(self):
+        """
+        Get the key identifying this model and its parameters in the prediction cache.
+
+        The fingerprint covers all model parameters and the link function, and is recomputed when
+        the model parameters are replaced, so cached outputs of other parameters are never used.
+
+        Returns:
+        - namespace: tuple of the model uri and the parameter fingerprint
+        """
+        cached = getattr(self, "_cache_namespace", None)
+        if cached is None or cached[0] is not self._model_parameters:
+            parameters = json.dumps([self._model_parameters, self.link], sort_keys=True, default=str)
+            fingerprint = hashlib.sha256(parameters.encode()).hexdigest()[:16]
+            cached = (self._model_parameters, (str(self._model_parameters.get('model_uri')), fingerprint))
+            self._cache_namespace = cached
+        return cached[1]
+
+    def _calculate_probability_cached(self, data, single=False):
+        """
+        Calculate the probabilities for a list of preprocessed records, reusing cached outputs.
+
+        Records are looked up by their covariate vector, in covariate_weights order; only the
+        records missing from the cache are scored.
+
+        Parameters:
+        - data: a list of dictionaries containing the preprocessed input data
+        - single: score missing records one by one, as for a single input dictionary
+
+        Returns:
+        - probabilities: a list with one probability per input dictionary
+        """
+        covariates = self._get_coefficients()[0]
+        namespace = self._get_cache_namespace()
+        keys = [tuple(float(item[covariate]) for covariate in covariates) for item in data]
+        probabilities = self.prediction_cache.get_many(namespace, keys)
+        missing = [index for index, probability in enumerate(probabilities) if probability is None]
+        if missing:
+            missing_data = [data[index] for index in missing]
+            if single:
+                scores = [self._calculate_probability_single(item) for item in missing_data]
+            else:
+                scores = self._calculate_probability_batch(missing_data)
+            for index, probability in zip(missing, scores):
+                probabilities[index] = probability
+            self.prediction_cache.set_many(namespace, [keys[index] for index in missing], scores)
+        return probabilities
+
+    def _calculate_probability(self, input_object):
+        """
+        Calculate the probability for a preprocessed dictionary, or the probabilities for a list of them.
+
+        With a prediction cache, records that were scored before with the same parameters are
+        answered from the cache.
+        """
+        if self.prediction_cache is None:
+            return super()._calculate_probability(input_object)
+        if isinstance(input_object, dict):
+            return self._calculate_probability_cached([input_object], single=True)[0]
+        elif isinstance(input_object, list):
+            return self._calculate_probability_cached(input_object)
+
+    def _pack_batch(self, records):
+        return record_batch.from_records(records, self._get_coefficients()[0], numeric=True)
+
+    def _to_matrix(self, data, covariates):
+        """
+        Pack a list of input dictionaries into a contiguous float64 matrix, one column per covariate.
+
+        Parameters:
+        - data: a list of dictionaries containing the input data
+        - covariates: the covariate names, in column order
+
+        Returns:
+        - matrix: numpy array with shape (len(data), len(covariates))
+        """
+        return np.fromiter(
+            (float(item[covariate]) for item in data for covariate in covariates),
+            dtype=np.float64,
+            count=len(data) * len(covariates),
+        ).reshape(len(data), len(covariates))
+
+    def _inverse_link(self, linear_predictor):
+        """
+        Map linear predictors to the outcome scale with the inverse of the model's link function.
+        """
+        link = self._model_parameters.get('link_function', self.link)
+        try:
+            inverse_link = INVERSE_LINK_FUNCTIONS[link]
+        except KeyError:
+            raise ValueError(f"Unsupported link function '{link}'")
+        return inverse_link(linear_predictor)
+
+    def _calculate_probability_single(self, input_object):
+        """
+        Calculate the probability for a single patient.
+
+        Parameters:
+        - input_object: a dictionary containing the input data
+        """
+        return float(self._calculate_probability_array([input_object])[0])
+
+    def _calculate_probability_array(self, data):
+        """
+        Calculate the probabilities for a list of patients in one vectorized pass.
+
+        Parameters:
+        - data: a list of dictionaries containing the input data
+
+        Returns:
+        - probabilities: float64 numpy array with one probability per input dictionary
+        """
+        covariates, weights, intercept = self._get_coefficients()
+        linear_predictor = self._to_matrix(data, covariates) @ weights + intercept
+        return self._inverse_link(linear_predictor)
+
+    def _calculate_probability_columns(self, columns):
+        """
+        Calculate the probabilities for input given as one array per covariate.
+
+        The covariates are stacked into the same matrix as _to_matrix builds from dictionaries,
+        so both give identical probabilities.
+
+        Parameters:
+        - columns: a record_batch (or dictionary) mapping covariate name to a numpy array of preprocessed values
+
+        Returns:
+        - probabilities: float64 numpy array with one probability per row
+        """
+        if not isinstance(columns, record_batch):
+            columns = record_batch(columns)
+        covariates, weights, intercept = self._get_coefficients()
+        linear_predictor = columns.to_matrix(covariates) @ weights + intercept
+        return self._inverse_link(linear_predictor)
+
+    def _calculate_probability_batch(self, data):
+        """
+        Calculate the probabilities for a list of patients.
+
+        Parameters:
+        - data: a list of dictionaries containing the input data
+
+        Returns:
+        - probabilities: a list with one probability per input dictionary
+        """
+        return self._calculate_probability_array(data).tolist()
+
+
+class logistic_regression(generalized_linear_model):
+    link = "logit"
+
     def _calculate_probability_single(self, input_object):
         """
         Calculate probability for logistic regression.
@@ -118,4 +685,8 @@ class logistic_regression(model_execution):
 
         # Calculate the probability
         probability = 1 / (1 + exp(-(linear_predictor)))
-        return probability
\ No newline at end of file
+        return probability
+
+
+class linear_regression(generalized_linear_model):
+    link = "identity"
@@ -0,0 +1,90 @@
+import json
+import os
+
+import numpy as np
+
+from feature_schema import feature_schema, feature_spec
+from model_execution import generalized_linear_model
+
+# link function of the generalized linear model, by "model_type" of the parameter file
+MODEL_TYPE_LINKS = {
+    "linear_regression": "identity",
+    "logistic_regression": "logit",
+    "poisson_regression": "log",
+    "probit_regression": "probit",
+}
+
+
+def _load_json(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+class model_execution_default(generalized_linear_model):
+    """
+    Generic model built from data files instead of a Python subclass per model.
+
+    The parameter file (like ntcp_model_dysphalgia.json) holds model_type, model_name, model_uri,
+    intercept and covariate_weights; the optional FAIR metadata file (like fetched_metadata.json)
+    describes the inputs and is compiled into the feature schema used to validate every request.
+
+    Parameters:
+    - model_parameters / model_path: the parameters, or the path of the parameter file
+      (default: $MODEL_PARAMETERS, or model_parameters.json)
+    - metadata / metadata_path: the FAIR metadata, or the path of the metadata file
+      (default: $MODEL_METADATA; without metadata every covariate is only checked to be a number)
+
+    The link function follows the model_type of the parameter file, unless the parameters set a
+    "link_function" or a subclass fixes the link.
+    """
+    link = None
+    schema_preprocessing = True
+
+    def __init__(self, model_parameters=None, model_path=None, metadata=None, metadata_path=None):
+        if model_parameters is None and model_path is None:
+            model_path = os.environ.get("MODEL_PARAMETERS", "model_parameters.json")
+        super().__init__(model_parameters=model_parameters, model_path=model_path)
+
+        if self.link is None and 'link_function' not in self._model_parameters:
+            model_type = self._model_parameters.get('model_type', 'logistic_regression')
+            if model_type not in MODEL_TYPE_LINKS:
+                raise ValueError(f"Unsupported model_type '{model_type}'")
+            self.link = MODEL_TYPE_LINKS[model_type]
+        # fail at load time instead of on the first request
+        self._inverse_link(np.zeros(1))
+
+        if metadata is None:
+            metadata_path = metadata_path or os.environ.get("MODEL_METADATA")
+            if metadata_path:
+                metadata = _load_json(metadata_path)
+        if metadata is not None:
+            self._feature_schema = feature_schema.from_metadata(metadata)
+        else:
+            self._feature_schema = feature_schema(
+                [feature_spec(name) for name in self._model_parameters['covariate_weights']])
+
+    def _preprocess(self, data):
+        """
+        Validate the input data against the FAIR metadata, or against the covariates of the model.
+
+        Parameters:
+        - input_object: a dictionary, or list with multiple dictionaries, containing the input data
+
+        Returns:
+        - preprocessed_data: a dictionary, or list with multiple dictionaries, containing the preprocessed data
+        """
+        return self.get_feature_schema().validate(data)
+
+    def _preprocess_each(self, data, positions=None):
+        return self.get_feature_schema().validate_each(data, positions)
+
+    def _preprocess_columns(self, columns):
+        return self.get_feature_schema().validate_columns(columns)
+
+
+class model_execution_linear_regression(model_execution_default):
+    link = "identity"
+
+
+class model_execution_logistic_regression(model_execution_default):
+    link = "logit"
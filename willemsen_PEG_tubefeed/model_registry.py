@@ -0,0 +1,248 @@
+import importlib
+import os
+import sys
+import threading
+
+
+def load_model(module_name, class_name, reload_module=False):
+    """
+    Import a model module and build an instance of the requested class.
+
+    Parameters:
+    - module_name: name of the python module containing the model class
+    - class_name: name of the model class inside the module
+    - reload_module: re-import the module from disk before building the instance
+
+    Returns:
+    - instance: the model object
+    """
+    if not module_name or not class_name:
+        raise ValueError("MODULE_NAME and CLASS_NAME must be set to load a model")
+
+    module = importlib.import_module(module_name)
+    if reload_module:
+        module = importlib.reload(module)
+    class_ = getattr(module, class_name)
+    instance = class_()
+    # compile the feature schema up front, so it is ready before the first request
+    instance.get_feature_schema()
+    return instance
+
+
+def load_model_parameters(model_path, metadata_path=None):
+    """
+    Build a model from a JSON parameter file, like ntcp_model_dysphalgia.json.
+
+    Parameters:
+    - model_path: path of the JSON file with model_type, intercept and covariate_weights
+    - metadata_path: optional path of the FAIR metadata used to validate the input
+
+    Returns:
+    - instance: the model object
+    """
+    from model_execution_default import model_execution_default
+
+    return model_execution_default(model_path=model_path, metadata_path=metadata_path)
+
+
+def load_model_spec(spec, reload_module=False):
+    """
+    Build a model from a textual model specification.
+
+    Parameters:
+    - spec: one of
+      - "module:class" or "module" (the class has the same name as the module, as in cli_build.py)
+      - "path/to/module.py:class" or "path/to/module.py"
+      - "path/to/parameters.json[:path/to/metadata.json]", a parameter file for the generic model
+        engine, optionally with the FAIR metadata of the model
+    - reload_module: re-import the model module from disk before building the instance
+
+    Returns:
+    - instance: the model object
+    """
+    model_path, _, metadata_path = spec.partition(".json:")
+    if spec.endswith(".json"):
+        if metadata_path:
+            return load_model_parameters(model_path + ".json", metadata_path)
+        return load_model_parameters(spec)
+
+    module_name, _, class_name = spec.partition(":")
+    if module_name.endswith(".py"):
+        module_dir, module_file = os.path.split(os.path.abspath(module_name))
+        if module_dir not in sys.path:
+            sys.path.insert(0, module_dir)
+        module_name = module_file[:-len(".py")]
+    return load_model(module_name, class_name or module_name, reload_module=reload_module)
+
+
+def model_spec_name(spec):
+    """
+    Derive the name under which a model specification is served, e.g. "stiphout_pCR_Clinical"
+    for "../stiphout_pCR-Clinical/stiphout_pCR_Clinical.py" and "ntcp_model_dysphalgia" for
+    "../ntcp_model/ntcp_model_dysphalgia.json:metadata.json".
+    """
+    if ".json" in spec:
+        path = spec.partition(".json")[0]
+    else:
+        path, _, class_name = spec.partition(":")
+        if class_name:
+            return class_name
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def parse_model_specs(text):
+    """
+    Parse a list of model specifications, as given in the MODELS environment variable.
+
+    Parameters:
+    - text: comma or newline separated entries, each "name=spec" or just "spec" (see load_model_spec),
+      e.g. "tubefeed=willemsen_tubefeed, ../ntcp_model/ntcp_model_dysphalgia.json"
+
+    Returns:
+    - specs: dictionary mapping model name to model specification, in the given order
+    """
+    specs = {}
+    for entry in text.replace("\n", ",").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, separator, spec = entry.partition("=")
+        if not separator:
+            name, spec = model_spec_name(entry), entry
+        name, spec = name.strip(), spec.strip()
+        if name in specs:
+            raise ValueError(f"Duplicate model name: {name}")
+        specs[name] = spec
+    return specs
+
+
+class model_registry:
+    """
+    Keeps a single model instance per process, shared by all requests and threads.
+
+    The model is built once (normally at application startup) and handed out as-is
+    afterwards. Model objects do not keep per-request state, so the same instance can
+    serve concurrent requests. `reload()` builds a fresh instance and swaps it in
+    atomically; requests that are already running keep using the old instance.
+    """
+
+    def __init__(self, module_name=None, class_name=None, spec=None):
+        self._module_name = module_name
+        self._class_name = class_name
+        self._spec = spec
+        self._instance = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Create a registry for the model selected by the MODULE_NAME/CLASS_NAME environment variables.
+        """
+        return cls(os.environ.get("MODULE_NAME"), os.environ.get("CLASS_NAME"))
+
+    @property
+    def configured(self):
+        return bool(self._spec or self._module_name)
+
+    @property
+    def loaded(self):
+        return self._instance is not None
+
+    @property
+    def spec(self):
+        """
+        Model specification (see load_model_spec) that builds this model, e.g. in another process.
+        """
+        if self._spec:
+            return self._spec
+        return f"{self._module_name}:{self._class_name}"
+
+    def _load(self, reload_module=False):
+        if self._spec:
+            return load_model_spec(self._spec, reload_module=reload_module)
+        return load_model(self._module_name, self._class_name, reload_module=reload_module)
+
+    def get(self):
+        """
+        Get the shared model instance, loading it on first use.
+
+        Returns:
+        - instance: the model object
+        """
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._load()
+                instance = self._instance
+        return instance
+
+    def reload(self):
+        """
+        Re-import the model module and replace the shared instance.
+
+        Returns:
+        - instance: the newly loaded model object
+        """
+        instance = self._load(reload_module=True)
+        with self._lock:
+            self._instance = instance
+        return instance
+
+
+class multi_model_registry:
+    """
+    Serves many models from one process, each under its own name.
+
+    Every model gets its own model_registry, so a model is only imported and built when it is
+    first requested, and concurrent first requests for the same model load it once.
+    """
+
+    def __init__(self, specs=None):
+        self._registries = {name: model_registry(spec=spec) for name, spec in (specs or {}).items()}
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Create a registry for the models listed in the MODELS environment variable (see parse_model_specs).
+        """
+        return cls(parse_model_specs(os.environ.get("MODELS", "")))
+
+    def names(self):
+        return list(self._registries)
+
+    def __contains__(self, name):
+        return name in self._registries
+
+    def __len__(self):
+        return len(self._registries)
+
+    def loaded(self, name):
+        return self._registry(name).loaded
+
+    def spec(self, name):
+        return self._registry(name).spec
+
+    def _registry(self, name):
+        try:
+            return self._registries[name]
+        except KeyError:
+            raise KeyError(f"Unknown model: {name}") from None
+
+    def get(self, name):
+        """
+        Get the model served under a name, loading it on first use.
+
+        Returns:
+        - instance: the model object
+        """
+        return self._registry(name).get()
+
+    def reload(self, name):
+        """
+        Rebuild the model served under a name and swap it in.
+
+        Returns:
+        - instance: the newly loaded model object
+        """
+        return self._registry(name).reload()
@@ -0,0 +1,430 @@
+import secrets
+from itertools import repeat
+
+import numpy as np
+
+from model_execution import _sigmoid, error_message
+
+# predictions are clipped to [EPSILON, 1 - EPSILON] before taking their logit
+EPSILON = 1e-12
+# bootstrap resamples per task; fixed, so the intervals do not depend on the number of processes
+BOOTSTRAP_SHARD_SIZE = 100
+# maximum number of elements of the resample count matrices computed at once
+BOOTSTRAP_BLOCK_ELEMENTS = 4000000
+METRICS = ("auc", "brier", "calibration_intercept", "calibration_slope", "observed_expected_ratio")
+
+
+def outcome_values(values, start_index=0):
+    """
+    Convert observed outcomes to a float64 array of zeros and ones.
+
+    Parameters:
+    - values: sequence or numpy array of outcomes, each 0, 1, False or True
+    - start_index: position of the first value in the cohort, used in error messages
+
+    Raises:
+    - ValueError if a value is not a binary outcome
+    """
+    outcomes = np.asarray(values)
+    if outcomes.dtype.kind not in "biuf":
+        outcomes = np.asarray([value if isinstance(value, (bool, int, float, np.number, np.bool_)) else np.nan
+                               for value in values], dtype=np.float64)
+    outcomes = outcomes.astype(np.float64, copy=False)
+    invalid = (outcomes != 0) & (outcomes != 1)
+    if invalid.any():
+        index = int(np.argmax(invalid))
+        raise ValueError(f"Invalid outcome value in item {start_index + index}: {values[index]} (expected 0 or 1)")
+    return outcomes
+
+
+def pop_outcomes(records, outcome, start_index=0):
+    """
+    Remove the outcome from every record of a list.
+
+    Parameters:
+    - records: list of dictionaries holding the input parameters and the outcome
+    - outcome: name of the outcome
+    - start_index: position of the first record in the cohort, used in error messages
+
+    Returns:
+    - outcomes: float64 numpy array of zeros and ones, aligned with the records
+
+    Raises:
+    - ValueError if a record has no outcome, or not a binary one
+    """
+    values = []
+    for index, record in enumerate(records, start_index):
+        if not isinstance(record, dict) or outcome not in record:
+            raise ValueError(f"Missing outcome {outcome} in item {index}")
+        values.append(record.pop(outcome))
+    return outcome_values(values, start_index)
+
+
+def area_under_curve(predictions, outcomes):
+    """
+    Area under the ROC curve, from the ranks of the predictions (Mann-Whitney U); tied
+    predictions get their average rank.
+
+    Returns:
+    - auc: the area, or None when the outcomes are all events or all non-events
+    """
+    events = int(outcomes.sum())
+    non_events = len(outcomes) - events
+    if events == 0 or non_events == 0:
+        return None
+    _, inverse, counts = np.unique(predictions, return_inverse=True, return_counts=True)
+    average_ranks = np.cumsum(counts) - (counts - 1) / 2.0
+    rank_sum = average_ranks[inverse][outcomes == 1].sum()
+    return float((rank_sum - events * (events + 1) / 2.0) / (events * non_events))
+
+
+def _fit_logistic(design, outcomes, offset, max_iterations=50, tolerance=1e-10):
+    """
+    Fit a logistic regression with Newton-Raphson.
+
+    Returns:
+    - coefficients: numpy array with one coefficient per column of the design matrix, or None
+      when the fit does not converge (e.g. with perfectly separated outcomes)
+    """
+    coefficients = np.zeros(design.shape[1])
+    for _ in range(max_iterations):
+        fitted = _sigmoid(design @ coefficients + offset)
+        weights = fitted * (1.0 - fitted)
+        gradient = design.T @ (outcomes - fitted)
+        hessian = (design * weights[:, None]).T @ design
+        try:
+            step = np.linalg.solve(hessian, gradient)
+        except np.linalg.LinAlgError:
+            return None
+        coefficients += step
+        if not np.all(np.isfinite(coefficients)):
+            return None
+        if np.max(np.abs(step)) < tolerance:
+            return coefficients
+    return None
+
+
+def _logit(predictions):
+    clipped = np.clip(predictions, EPSILON, 1.0 - EPSILON)
+    return np.log(clipped) - np.log1p(-clipped)
+
+
+def _calibration_fits(linear_predictor, outcomes):
+    """
+    Returns:
+    - intercept: coefficients of the fit with the linear predictor as offset, or None
+    - slope: coefficients (offset, slope) of the fit on the linear predictor, or None
+    """
+    ones = np.ones((len(outcomes), 1))
+    return (_fit_logistic(ones, outcomes, linear_predictor),
+            _fit_logistic(np.column_stack([ones, linear_predictor]), outcomes, 0.0))
+
+
+def calibration(predictions, outcomes):
+    """
+    Logistic recalibration of the predictions against the observed outcomes.
+
+    Returns:
+    - intercept: the calibration intercept (calibration-in-the-large), fitted with the logit of
+      the predictions as offset; 0 when the mean prediction matches the event rate
+    - slope: the calibration slope, the coefficient of the logit of the predictions; 1 for a
+      perfectly calibrated model, below 1 when the predictions are too extreme
+    Either is None when it cannot be estimated.
+    """
+    if len(outcomes) == 0:
+        return None, None
+    intercept, slope = _calibration_fits(_logit(predictions), outcomes)
+    return (float(intercept[0]) if intercept is not None else None,
+            float(slope[1]) if slope is not None else None)
+
+
+def _resample_counts(generator, length, resamples):
+    """
+    Draw bootstrap resamples of a cohort.
+
+    Returns:
+    - counts: float64 matrix with shape (resamples, length), how often every record is drawn in
+      every resample
+    """
+    indices = generator.integers(0, length, size=(resamples, length))
+    indices += (np.arange(resamples) * length)[:, None]
+    return np.bincount(indices.ravel(), minlength=resamples * length).reshape(resamples, length).astype(np.float64)
+
+
+def _expit(values):
+    # exp overflows to inf for very negative values, giving the correct limit 0
+    with np.errstate(over="ignore"):
+        return 1.0 / (1.0 + np.exp(-values))
+
+
+def _weighted_calibration(counts, outcomes, linear_predictor, initial, max_iterations=50, tolerance=1e-10):
+    """
+    Calibration intercept and slope (see calibration) of every resample, weighting the records by
+    their counts; Newton-Raphson runs for all resamples at once.
+
+    Parameters:
+    - initial: (intercept, offset, slope) to start from, e.g. the fits on the whole cohort
+
+    Returns:
+    - intercepts, slopes: float64 arrays with one value per resample, NaN where the fit does not converge
+    """
+    resamples = len(counts)
+    observed = counts @ outcomes
+    intercepts = np.full(resamples, initial[0])
+    converged = np.zeros(resamples, dtype=bool)
+    for _ in range(max_iterations):
+        fitted = _expit(intercepts[:, None] + linear_predictor)
+        weighted = counts * fitted
+        step = (observed - weighted.sum(axis=1)) / (weighted * (1.0 - fitted)).sum(axis=1)
+        intercepts += step
+        converged = np.abs(step) < tolerance
+        if converged.all() or not np.isfinite(intercepts).any():
+            break
+    intercepts[~converged] = np.nan
+
+    offsets = np.full(resamples, initial[1])
+    slopes = np.full(resamples, initial[2])
+    converged = np.zeros(resamples, dtype=bool)
+    for _ in range(max_iterations):
+        fitted = _expit(offsets[:, None] + slopes[:, None] * linear_predictor)
+        weights = counts * fitted * (1.0 - fitted)
+        residuals = counts * (outcomes - fitted)
+        gradient_offset = residuals.sum(axis=1)
+        gradient_slope = residuals @ linear_predictor
+        hessian_00 = weights.sum(axis=1)
+        hessian_01 = weights @ linear_predictor
+        hessian_11 = weights @ np.square(linear_predictor)
+        determinant = hessian_00 * hessian_11 - hessian_01 * hessian_01
+        step_offset = (hessian_11 * gradient_offset - hessian_01 * gradient_slope) / determinant
+        step_slope = (hessian_00 * gradient_slope - hessian_01 * gradient_offset) / determinant
+        offsets += step_offset
+        slopes += step_slope
+        converged = (np.abs(step_offset) < tolerance) & (np.abs(step_slope) < tolerance)
+        if converged.all() or not np.isfinite(slopes).any():
+            break
+    slopes[~converged] = np.nan
+    return intercepts, slopes
+
+
+def _bootstrap_shard(predictions, outcomes, seed, resamples):
+    """
+    Compute the metrics of a number of bootstrap resamples, drawn with the given seed.
+
+    The predictions must be sorted, so tied predictions are adjacent.
+
+    Returns:
+    - values: dictionary mapping metric name to a float64 array with one value per resample
+      (NaN where the metric is undefined for the resample)
+    """
+    generator = np.random.default_rng(seed)
+    length = len(predictions)
+    _, group_starts = np.unique(predictions, return_index=True)
+    linear_predictor = _logit(predictions)
+    squared_errors = np.square(predictions - outcomes)
+    # start the fits of the resamples from the fits on the whole cohort
+    intercept, slope = _calibration_fits(linear_predictor, outcomes)
+    initial = (intercept[0] if intercept is not None else 0.0,) + (tuple(slope) if slope is not None else (0.0, 1.0))
+
+    values = {metric: [] for metric in METRICS}
+    block = max(1, BOOTSTRAP_BLOCK_ELEMENTS // max(1, length))
+    for start in range(0, resamples, block):
+        counts = _resample_counts(generator, length, min(block, resamples - start))
+        events = counts @ outcomes
+        non_events = length - events
+        # AUC from the counts per group of tied predictions: every event scores the non-events
+        # below it, plus half of the tied non-events
+        event_counts = np.add.reduceat(counts * outcomes, group_starts, axis=1)
+        non_event_counts = np.add.reduceat(counts * (1.0 - outcomes), group_starts, axis=1)
+        non_events_below = np.cumsum(non_event_counts, axis=1) - non_event_counts
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values["auc"].append(
+                (event_counts * (non_events_below + 0.5 * non_event_counts)).sum(axis=1) / (events * non_events))
+            values["observed_expected_ratio"].append(events / (counts @ predictions))
+            values["brier"].append(counts @ squared_errors / length)
+            intercepts, slopes = _weighted_calibration(counts, outcomes, linear_predictor, initial)
+        values["calibration_intercept"].append(intercepts)
+        values["calibration_slope"].append(slopes)
+    return {metric: np.concatenate(arrays) for metric, arrays in values.items()}
+
+
+def bootstrap_intervals(predictions, outcomes, resamples=1000, confidence=0.95, seed=None, map_function=map):
+    """
+    Percentile bootstrap confidence intervals of the validation metrics.
+
+    The resamples are drawn as matrices of counts (how often every record is drawn), from which
+    the metrics of many resamples are computed at once. They are split in shards of
+    BOOTSTRAP_SHARD_SIZE resamples, each seeded with its own child of one SeedSequence, so the
+    intervals only depend on the seed, also when the shards run in other processes.
+
+    Parameters:
+    - predictions: float64 array of predicted probabilities
+    - outcomes: float64 array of observed outcomes (0 or 1), aligned with the predictions
+    - resamples: number of bootstrap resamples
+    - confidence: confidence level of the intervals, e.g. 0.95
+    - seed: integer seed; a random seed is drawn (and returned) when None
+    - map_function: function like the builtin map, used to run the shards (e.g. in a process pool)
+
+    Returns:
+    - bootstrap: dictionary with the resamples, confidence and seed, and per metric the
+      [low, up] interval (None when the metric is undefined in most resamples)
+    """
+    if seed is None:
+        seed = secrets.randbits(63)
+    order = np.argsort(predictions, kind="stable")
+    predictions, outcomes = predictions[order], outcomes[order]
+    sizes = [min(BOOTSTRAP_SHARD_SIZE, resamples - start) for start in range(0, resamples, BOOTSTRAP_SHARD_SIZE)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    shards = list(map_function(_bootstrap_shard, repeat(predictions), repeat(outcomes), seeds, sizes))
+
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    intervals = {}
+    for metric in METRICS:
+        values = np.concatenate([shard[metric] for shard in shards]) if shards else np.zeros(0)
+        values = values[np.isfinite(values)]
+        if len(values) < resamples / 2 or len(values) == 0:
+            intervals[metric] = None
+        else:
+            low, up = np.percentile(values, [tail, 100.0 - tail])
+            intervals[metric] = [float(low), float(up)]
+    return {"resamples": resamples, "confidence": confidence, "seed": seed, "intervals": intervals}
+
+
+class validation_accumulator:
+    """
+    Collects the predictions and observed outcomes of a cohort batch by batch, and computes
+    the performance of the model from them.
+
+    The Brier score and the observed/expected ratio are running sums. The AUC and the calibration
+    need all predictions at once, so those are kept as compact float64 arrays (16 bytes per record,
+    instead of the input records).
+    """
+
+    def __init__(self):
+        self.records = 0
+        self.events = 0.0
+        self.expected = 0.0
+        self.squared_error = 0.0
+        self.excluded = 0
+        self._predictions = []
+        self._outcomes = []
+
+    def add(self, predictions, outcomes):
+        """
+        Add a batch of predictions with their observed outcomes.
+
+        Parameters:
+        - predictions: probabilities, possibly containing {"error": message} dictionaries for
+          records that are excluded (see model_execution.predict_records)
+        - outcomes: float64 numpy array of zeros and ones, aligned with the predictions
+
+        Raises:
+        - ValueError if a prediction is not a probability between 0 and 1
+        """
+        if not isinstance(predictions, np.ndarray):
+            valid = np.fromiter((not isinstance(prediction, dict) for prediction in predictions),
+                                dtype=bool, count=len(predictions))
+            if not valid.all():
+                self.excluded += int(len(valid) - valid.sum())
+                predictions = [prediction for prediction in predictions if not isinstance(prediction, dict)]
+                outcomes = outcomes[valid]
+        predictions = np.asarray(predictions, dtype=np.float64)
+        if len(predictions) and not ((predictions >= 0) & (predictions <= 1)).all():
+            raise ValueError("Validation needs a model predicting probabilities between 0 and 1")
+
+        self.records += len(predictions)
+        self.events += float(outcomes.sum())
+        self.expected += float(predictions.sum())
+        self.squared_error += float(np.square(predictions - outcomes).sum())
+        self._predictions.append(predictions)
+        self._outcomes.append(outcomes)
+
+    def summary(self, resamples=0, confidence=0.95, seed=None, map_function=map):
+        """
+        Compute the performance of the model on the records added so far.
+
+        Parameters:
+        - resamples: number of bootstrap resamples for confidence intervals (see
+          bootstrap_intervals); 0 for none
+        - confidence, seed, map_function: see bootstrap_intervals
+
+        Returns:
+        - summary: dictionary with the number of records, events and excluded records, the AUC,
+          Brier score, calibration intercept and slope, and observed/expected ratio (None where
+          undefined), plus the bootstrap confidence intervals when resamples is set
+        """
+        predictions = np.concatenate(self._predictions) if self._predictions else np.zeros(0)
+        outcomes = np.concatenate(self._outcomes) if self._outcomes else np.zeros(0)
+        intercept, slope = calibration(predictions, outcomes)
+        summary = {
+            "records": self.records,
+            "events": int(self.events),
+            "excluded": self.excluded,
+            "auc": area_under_curve(predictions, outcomes),
+            "brier": self.squared_error / self.records if self.records else None,
+            "calibration_intercept": intercept,
+            "calibration_slope": slope,
+            "observed_expected_ratio": self.events / self.expected if self.expected else None,
+        }
+        if resamples > 0 and len(predictions):
+            summary["bootstrap"] = bootstrap_intervals(predictions, outcomes, resamples, confidence, seed, map_function)
+        return summary
+
+
+def validate_records(model_obj, records, outcome, chunk_size, partial=False, **summary_options):
+    """
+    Score a cohort given as a list of records holding an outcome, and compute the performance
+    of the model on it.
+
+    Parameters:
+    - model_obj: the model object
+    - records: list of dictionaries with the input parameters and the outcome
+    - outcome: name of the outcome
+    - chunk_size: number of records scored together
+    - partial: leave invalid records out (they are counted as excluded) instead of failing
+    - summary_options: passed to validation_accumulator.summary, e.g. resamples
+
+    Returns:
+    - summary: see validation_accumulator.summary, or {"error": message}
+    """
+    try:
+        if not isinstance(records, list):
+            raise TypeError("Input data must be a list of dicts")
+        outcomes = pop_outcomes(records, outcome)
+        accumulator = validation_accumulator()
+        start = 0
+        for predictions in model_obj.iter_predictions(records, chunk_size, partial):
+            accumulator.add(predictions, outcomes[start:start + len(predictions)])
+            start += len(predictions)
+        return accumulator.summary(**summary_options)
+    except Exception as e:
+        return {"error": error_message(e)}
+
+
+def validate_columns(model_obj, columns, outcome, predict_columns=None, **summary_options):
+    """
+    Score a cohort given as one array per input parameter plus an outcome column, and compute
+    the performance of the model on it.
+
+    Parameters:
+    - model_obj: the model object
+    - columns: dictionary (or record_batch) mapping name to an array of values
+    - outcome: name of the outcome column
+    - predict_columns: function scoring the input columns, model_obj.predict_columns by default
+    - summary_options: passed to validation_accumulator.summary, e.g. resamples
+
+    Returns:
+    - summary: see validation_accumulator.summary, or {"error": message}
+    """
+    try:
+        if outcome not in columns:
+            raise ValueError(f"Missing outcome {outcome}")
+        outcomes = outcome_values(columns[outcome])
+        inputs = {name: column for name, column in columns.items() if name != outcome}
+        probabilities = (predict_columns or model_obj.predict_columns)(inputs)
+        if isinstance(probabilities, dict):
+            return probabilities
+        accumulator = validation_accumulator()
+        accumulator.add(probabilities, outcomes)
+        return accumulator.summary(**summary_options)
+    except Exception as e:
+        return {"error": error_message(e)}
@@ -0,0 +1,44 @@
+import time
+
+import json_codec
+from model_execution import error_message
+from request_models import get_request_model
+
+
+def warm_up(model_obj):
+    """
+    Prepare a model for its first request: compile its feature schema and typed request model,
+    and score a synthetic in-range record, on its own and as a list, so everything built on first
+    use (coefficients, compiled validators, numpy code paths) is in place.
+
+    The synthetic record is preprocessed and scored directly instead of through predict, so it is
+    not counted in the metrics and does not end up in the prediction cache.
+
+    Parameters:
+    - model_obj: the model object
+
+    Returns:
+    - warm_up: the synthetic record, its probability and the seconds the warm-up took
+
+    Raises:
+    - RuntimeError if the synthetic record cannot be scored
+    """
+    start = time.perf_counter()
+    schema = model_obj.get_feature_schema()
+    if schema is None:
+        # models without input metadata are loaded, but cannot be scored without real input
+        return {"record": None, "probability": None, "seconds": time.perf_counter() - start}
+
+    record = schema.example_record()
+    request_model = get_request_model(model_obj)
+    validated = request_model.validate_record_json(json_codec.dumps(record)) if request_model is not None else None
+    try:
+        if validated is not None and model_obj.schema_preprocessing:
+            single = schema.apply_transforms(validated)
+        else:
+            single = model_obj._preprocess(dict(record))
+        probability = model_obj._calculate_probability_single(single)
+        model_obj._calculate_probability_batch(model_obj._preprocess([dict(record), dict(record)]))
+    except Exception as e:
+        raise RuntimeError(f"Warm-up prediction failed: {error_message(e)}") from e
+    return {"record": record, "probability": probability, "seconds": time.perf_counter() - start}
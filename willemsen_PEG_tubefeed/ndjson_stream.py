@@ -0,0 +1,171 @@
+from starlette.requests import ClientDisconnect
+from starlette.responses import StreamingResponse
+
+import json_codec
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class ndjson_line_error:
+    """
+    Placeholder for an input line that could not be parsed, so it still gets a result.
+    """
+
+    __slots__ = ("message",)
+
+    def __init__(self, message):
+        self.message = message
+
+
+def _parse_line(line):
+    """
+    Parse one NDJSON line into the records it contains (a line may hold an object or an array of objects).
+    """
+    try:
+        value = json_codec.loads(line)
+    except ValueError as e:
+        return [ndjson_line_error(f"Validation error: Invalid JSON: {str(e)}")]
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+class request_body:
+    """
+    The chunks of a request body, remembering whether the body has been received completely.
+
+    Parameters:
+    - request: the starlette Request
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.received = False
+
+    async def __aiter__(self):
+        # read from the receive channel as request.stream() does, so the last chunk is known to be
+        # the last one before it is parsed
+        while not self.received:
+            message = await self.request.receive()
+            if message["type"] == "http.disconnect":
+                raise ClientDisconnect()
+            if message["type"] == "http.request":
+                self.received = not message.get("more_body", False)
+                yield message.get("body", b"")
+
+    async def disconnected(self):
+        """
+        Check whether the client has gone away. Only checked once the body has been received:
+        before, listening on the receive channel would consume body chunks, and a disconnect ends
+        reading the body with a ClientDisconnect instead.
+        """
+        return self.received and await self.request.is_disconnected()
+
+
+async def iter_records(chunks):
+    """
+    Parse newline-delimited JSON from an iterator of byte chunks, while the chunks are arriving.
+
+    Every byte is scanned for a line break once, and the parsed lines are dropped from the buffer,
+    so memory is bounded by the longest line (a line holding a JSON array is parsed as a whole).
+
+    Parameters:
+    - chunks: async iterator of bytes, e.g. starlette's request.stream()
+
+    Yields:
+    - record: every JSON value of the stream; lines with a JSON array yield each element
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        # the bytes already in the buffer hold no line break
+        end = chunk.find(b"\n")
+        if end != -1:
+            end += len(buffer)
+        buffer += chunk
+        start = 0
+        while end != -1:
+            line = bytes(buffer[start:end])
+            start = end + 1
+            if line.strip():
+                for record in _parse_line(line):
+                    yield record
+            end = buffer.find(b"\n", start)
+        if start:
+            del buffer[:start]
+    if buffer.strip():
+        for record in _parse_line(bytes(buffer)):
+            yield record
+
+
+async def iter_batches(records, batch_size):
+    """
+    Group an async iterator of records into lists of at most batch_size records.
+    """
+    batch = []
+    async for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def predict_batch(model_obj, batch, start_index=0):
+    """
+    Score one micro-batch record by record (see model_execution.predict_records).
+
+    Parameters:
+    - model_obj: the model object
+    - batch: list of parsed records, possibly containing ndjson_line_error placeholders
+    - start_index: position of the first record of the batch in the whole stream
+
+    Returns:
+    - results: list aligned with the batch, holding either the probability or {"error": message}
+    """
+    results = [{"error": record.message} if isinstance(record, ndjson_line_error) else None for record in batch]
+    parsed_indices = [index for index, result in enumerate(results) if result is None]
+    parsed_records = [batch[index] for index in parsed_indices]
+    positions = [start_index + index for index in parsed_indices]
+    for index, result in zip(parsed_indices, model_obj.predict_records(parsed_records, positions)):
+        results[index] = result
+    return results
+
+
+def encode_results(results, start_index):
+    """
+    Encode the results of one micro-batch as NDJSON lines, tagged with their position in the stream.
+
+    Parameters:
+    - results: list of probabilities or {"error": message} dictionaries
+    - start_index: position of the first result in the whole stream
+
+    Returns:
+    - lines: bytes with one JSON object per result
+    """
+    lines = []
+    for index, result in enumerate(results, start_index):
+        if isinstance(result, dict):
+            lines.append(json_codec.dumps({"index": index, **result}))
+        else:
+            lines.append(json_codec.dumps({"index": index, "probability": result}))
+    lines.append(b"")
+    return b"\n".join(lines)
+
+
+class ndjson_streaming_response(StreamingResponse):
+    """
+    StreamingResponse that sends results while the request body is still being received.
+
+    Starlette's StreamingResponse may listen for a client disconnect on the receive channel while
+    streaming, which would consume the request body chunks this response is generated from. The
+    content checks for a disconnect itself instead (see request_body.disconnected).
+    """
+
+    def __init__(self, content, status_code=200, headers=None):
+        super().__init__(content, status_code=status_code, headers=headers, media_type=NDJSON_MEDIA_TYPE)
+
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
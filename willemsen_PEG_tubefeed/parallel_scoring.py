@@ -0,0 +1,287 @@
+import logging
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import metrics
+from feature_schema import _NUMBER_TYPES
+from model_registry import load_model_spec
+from record_batch import record_batch
+
+logger = logging.getLogger(__name__)
+
+# model objects of a worker process, by model specification, loaded once per pool
+_worker_models = {}
+# key of the pool whose workers do not load a model, used by parallel_scorer.map
+_NO_MODEL = ""
+
+
+def _init_worker(model_spec):
+    _worker_models[model_spec] = load_model_spec(model_spec)
+
+
+def _pack_records(records, names):
+    """
+    Pack the model inputs of a list of records into a record_batch for the worker processes.
+    Other fields of the records (e.g. a patient id) are left out.
+
+    Parameters:
+    - records: list of input dictionaries
+    - names: the input parameters of the model
+
+    Returns:
+    - batch: the record_batch, or None when a value of an input parameter is not an int or a
+      float: numpy would turn e.g. True into 1.0 or "1" into a string column, so such lists are
+      left to the checks of the model itself
+
+    Raises:
+    - KeyError or TypeError if a record lacks an input parameter, or is not a dict
+    """
+    columns = {name: [record[name] for record in records] for name in names}
+    for column in columns.values():
+        if not _NUMBER_TYPES.issuperset(map(type, column)):
+            return None
+    return record_batch(columns)
+
+
+class _shared_batch:
+    """
+    Numerical columns of a record_batch copied into one shared memory block, followed by room
+    for one float64 probability per row.
+
+    Workers attach to the block by name and score views of it, so the columns are not pickled.
+    Columns of other types (e.g. strings) are pickled per shard instead.
+    """
+
+    def __init__(self, batch):
+        self.length = len(batch)
+        self.names = list(batch.keys())
+        self.layout = []
+        self.other_columns = {}
+        offset = 0
+        for name, column in batch.items():
+            if column.dtype.kind in "biuf":
+                self.layout.append((name, column.dtype.str, offset))
+                offset += column.nbytes
+                offset += -offset % 8  # keep every column 8 byte aligned
+            else:
+                self.other_columns[name] = column
+        self.output_offset = offset
+        self.memory = shared_memory.SharedMemory(create=True, size=max(offset + 8 * self.length, 1))
+        for name, dtype, offset in self.layout:
+            self._view(dtype, offset)[:] = batch[name]
+
+    def _view(self, dtype, offset):
+        return np.ndarray(self.length, dtype=dtype, buffer=self.memory.buf, offset=offset)
+
+    def shard(self, start, stop):
+        """
+        Get the arguments of _score_shard for the rows start to stop.
+        """
+        other_columns = {name: column[start:stop] for name, column in self.other_columns.items()}
+        return (self.memory.name, self.names, self.layout, self.length, self.output_offset,
+                other_columns, start, stop)
+
+    def probabilities(self):
+        return self._view(np.float64, self.output_offset).copy()
+
+    def release(self):
+        self.memory.close()
+        self.memory.unlink()
+
+
+def _predict_shard(model_obj, memory, names, layout, length, output_offset, other_columns, start, stop):
+    columns = dict(other_columns)
+    for name, dtype, offset in layout:
+        columns[name] = np.ndarray(length, dtype=dtype, buffer=memory.buf, offset=offset)[start:stop]
+    probabilities = model_obj.predict_columns(record_batch({name: columns[name] for name in names}))
+    if isinstance(probabilities, dict):
+        return probabilities["error"]
+    np.ndarray(length, dtype=np.float64, buffer=memory.buf, offset=output_offset)[start:stop] = probabilities
+    return None
+
+
+def _score_shard(model_spec, memory_name, *shard):
+    """
+    Validate and score rows start to stop of a shared batch in a worker process, writing the
+    probabilities into the shared block.
+
+    Returns:
+    - error: the error message when a row is not valid, otherwise None
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    try:
+        # every view of the block is gone when _predict_shard returns, so it can be closed
+        return _predict_shard(_worker_models[model_spec], memory, *shard)
+    finally:
+        memory.close()
+
+
+class parallel_scorer:
+    """
+    Scores large batches on several cores, by sharding them across a pool of worker processes.
+
+    Each model specification gets its own pool, whose workers build the model once. The numerical
+    columns of a batch are shared with the workers through shared memory; every worker validates
+    and scores its shard column-wise (model_execution.predict_columns) and writes the
+    probabilities into the shared block, so the results are merged in input order without
+    copying. Batches with an invalid row are scored again in the calling process, so the error
+    message is the same as without the pool.
+
+    Parameters:
+    - processes: number of worker processes per model; 0 or 1 disables parallel scoring
+    - threshold: minimum number of rows of a batch scored in parallel
+    - start_method: multiprocessing start method of the workers
+    """
+
+    def __init__(self, processes=0, threshold=100000, start_method="spawn"):
+        self.processes = processes
+        self.threshold = threshold
+        self.start_method = start_method
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Create the scorer configured by SCORING_PROCESSES ("auto" for one per core) and
+        SCORING_PROCESS_THRESHOLD.
+        """
+        processes = os.environ.get("SCORING_PROCESSES", "0").strip().lower()
+        return cls(
+            processes=(os.cpu_count() or 1) if processes == "auto" else int(processes or 0),
+            threshold=int(os.environ.get("SCORING_PROCESS_THRESHOLD", "100000")),
+        )
+
+    @property
+    def enabled(self):
+        return self.processes > 1
+
+    def accepts(self, rows):
+        """
+        Check whether a batch of the given number of rows is scored in parallel.
+        """
+        return self.enabled and rows >= self.threshold
+
+    def _pool(self, model_spec):
+        with self._lock:
+            pool = self._pools.get(model_spec)
+            if pool is None:
+                pool = self._pools[model_spec] = ProcessPoolExecutor(
+                    self.processes, mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker if model_spec != _NO_MODEL else None,
+                    initargs=(model_spec,) if model_spec != _NO_MODEL else ())
+            return pool
+
+    def reset(self, model_spec=None):
+        """
+        Stop the workers of a model (e.g. after it has been reloaded), or of every model; new
+        workers are started on the next parallel batch.
+        """
+        with self._lock:
+            specs = [model_spec] if model_spec is not None else list(self._pools)
+            pools = [self._pools.pop(spec) for spec in specs if spec in self._pools]
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        self.reset()
+
+    def map(self, function, *iterables):
+        """
+        Like the builtin map, running a module level function in the worker processes (or in
+        this process when parallel scoring is disabled).
+
+        Returns:
+        - results: list of the results, in the order of the arguments
+        """
+        if not self.enabled:
+            return list(map(function, *iterables))
+        try:
+            return list(self._pool(_NO_MODEL).map(function, *iterables))
+        except BrokenProcessPool:
+            self.reset(_NO_MODEL)
+            raise
+
+    def _score(self, model_obj, model_spec, batch):
+        """
+        Score a record_batch in the worker processes.
+
+        Returns:
+        - probabilities: float64 numpy array, or None when the batch must be scored in this
+          process (it has an invalid row, or a worker died)
+        """
+        shared = _shared_batch(batch)
+        try:
+            shard_size = math.ceil(len(batch) / self.processes)
+            pool = self._pool(model_spec)
+            with metrics.stage_timer(model_obj, "score"):
+                futures = [
+                    pool.submit(_score_shard, model_spec, *shared.shard(start, min(start + shard_size, len(batch))))
+                    for start in range(0, len(batch), shard_size)
+                ]
+                errors = [future.result() for future in futures]
+            if any(error is not None for error in errors):
+                return None
+            metrics.count_scored(model_obj, len(batch))
+            return shared.probabilities()
+        except BrokenProcessPool:
+            # a worker died (e.g. out of memory): start over with new workers next time
+            logger.warning("A scoring process died, %d rows are scored in this process", len(batch))
+            self.reset(model_spec)
+            return None
+        finally:
+            shared.release()
+
+    def predict_columns(self, model_obj, model_spec, batch):
+        """
+        Calculate the probabilities for input given as one array per feature, see
+        model_execution.predict_columns.
+
+        Parameters:
+        - model_obj: the model object, used for small and invalid batches
+        - model_spec: the specification the workers build the same model from
+        - batch: a record_batch
+
+        Returns:
+        - probabilities: float64 numpy array with one probability per row, or {"error": message}
+        """
+        if self.accepts(len(batch)):
+            probabilities = self._score(model_obj, model_spec, batch)
+            if probabilities is not None:
+                return probabilities
+        return model_obj.predict_columns(batch)
+
+    def predict(self, model_obj, model_spec, records):
+        """
+        Calculate the probabilities for a list of input dictionaries, see model_execution.predict.
+
+        The input parameters of the records are packed into a record_batch (other fields are
+        left out) and scored column-wise; lists whose records lack an input parameter, or hold
+        values other than ints and floats in one, are scored by the model object itself, so
+        they get the same results and errors as without the pool. Such fallbacks are logged.
+
+        Returns:
+        - probabilities: list with one probability per record, or {"error": message}
+        """
+        if self.accepts(len(records)):
+            try:
+                batch = _pack_records(records, model_obj.get_input_parameters() or list(records[0]))
+                reason = "an input parameter holds values other than numbers"
+            except KeyError as e:
+                batch, reason = None, f"a record lacks the input parameter {e}"
+            except (TypeError, ValueError):
+                batch, reason = None, "a record is not a dictionary"
+            if batch is not None:
+                probabilities = self._score(model_obj, model_spec, batch)
+                if probabilities is not None:
+                    return probabilities.tolist()
+                reason = "a record is not valid, or a scoring process died"
+            logger.info("Scoring %d records in this process instead of in parallel: %s", len(records), reason)
+        return model_obj.predict(records)
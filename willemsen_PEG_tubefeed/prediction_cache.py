@@ -0,0 +1,218 @@
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:  # the shared backend is optional, the in-process cache works without redis
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+def _check_ttl(ttl):
+    if ttl is not None and not ttl > 0:
+        raise ValueError(f"The prediction cache TTL must be a positive number of seconds, got {ttl}")
+    return ttl
+
+
+class redis_cache_backend:
+    """
+    Prediction cache shared by all replicas of a model service, stored in Redis.
+
+    The shared cache only saves work, so Redis errors never fail a prediction: they are logged,
+    and Redis is left alone for retry_interval seconds, during which only the cache of each
+    process is used.
+
+    Parameters:
+    - url: Redis URL, e.g. redis://cache:6379/0
+    - ttl: seconds after which an entry expires (None: never); fractions are rounded up to milliseconds
+    - prefix: prefix of all keys written by the prediction cache
+    - timeout: seconds to wait for Redis to connect or answer
+    - retry_interval: seconds Redis is not used after an error
+    """
+
+    def __init__(self, url, ttl=None, prefix="faivor:prediction:", timeout=0.5, retry_interval=30.0):
+        if redis is None:
+            raise ImportError("redis is required for a shared prediction cache")
+        self._client = redis.Redis.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+        # milliseconds, as Redis rejects a TTL of 0 and int() would turn e.g. 0.5 seconds into 0
+        self._ttl_ms = None if _check_ttl(ttl) is None else math.ceil(ttl * 1000)
+        self._prefix = prefix
+        self._retry_interval = retry_interval
+        self._unavailable_until = 0.0
+
+    def _key(self, namespace, key):
+        return self._prefix + ":".join(namespace) + ":" + ",".join(repr(value) for value in key)
+
+    def _available(self):
+        return time.monotonic() >= self._unavailable_until
+
+    def _failed(self, operation, e):
+        self._unavailable_until = time.monotonic() + self._retry_interval
+        logger.warning("Shared prediction cache %s failed, using the local cache for %s seconds: %s",
+                       operation, self._retry_interval, e)
+
+    def get_many(self, namespace, keys):
+        """
+        Look up covariate vectors in Redis.
+
+        Returns:
+        - values: list aligned with keys, holding the cached output or None (also when Redis fails)
+        """
+        if not self._available():
+            return [None] * len(keys)
+        try:
+            values = self._client.mget([self._key(namespace, key) for key in keys])
+        except (redis.RedisError, OSError) as e:
+            self._failed("lookup", e)
+            return [None] * len(keys)
+        return [None if value is None else float(value) for value in values]
+
+    def set_many(self, namespace, keys, values):
+        """
+        Store outputs in Redis; nothing is stored when Redis fails.
+        """
+        if not self._available():
+            return
+        try:
+            pipeline = self._client.pipeline(transaction=False)
+            for key, value in zip(keys, values):
+                pipeline.set(self._key(namespace, key), repr(value), px=self._ttl_ms)
+            pipeline.execute()
+        except (redis.RedisError, OSError) as e:
+            self._failed("update", e)
+
+
+class prediction_cache:
+    """
+    LRU cache of model outputs, keyed on a model namespace and a covariate vector.
+
+    The namespace identifies the model and its parameters (see
+    generalized_linear_model._get_cache_namespace). A model whose parameters change gets a new
+    namespace, so it never receives outputs computed with the old parameters; those entries are
+    evicted as they become least recently used.
+
+    The cache is consulted by model_execution.predict and predict_records, so by JSON /predict
+    requests (also with partial=true or coalescing), and by /predict/stream. Columnar input
+    (predict_columns: Arrow, Parquet, /predict/local and columnar /validate), batches scored by
+    the parallel_scorer workers, and the chunks of asynchronous jobs and /validate without
+    partial=true (iter_predictions) skip the cache: these are large batches of mostly distinct
+    patients, for which looking up every row costs more than scoring it.
+
+    Parameters:
+    - max_entries: maximum number of entries kept in this process
+    - ttl: seconds after which an entry expires (None: never)
+    - backend: optional shared cache (e.g. redis_cache_backend) consulted on local misses
+    """
+
+    def __init__(self, max_entries=100000, ttl=None, backend=None):
+        self.max_entries = max_entries
+        self.ttl = _check_ttl(ttl)
+        self.backend = backend
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Create the cache configured by PREDICTION_CACHE_SIZE (0 or unset: no cache),
+        PREDICTION_CACHE_TTL (seconds) and PREDICTION_CACHE_URL (Redis URL of a shared cache).
+
+        Returns:
+        - cache: the prediction cache, or None when caching is disabled
+        """
+        max_entries = int(os.environ.get("PREDICTION_CACHE_SIZE", "0"))
+        if max_entries <= 0:
+            return None
+        ttl = os.environ.get("PREDICTION_CACHE_TTL")
+        ttl = float(ttl) if ttl else None
+        url = os.environ.get("PREDICTION_CACHE_URL")
+        backend = redis_cache_backend(url, ttl=ttl) if url else None
+        return cls(max_entries=max_entries, ttl=ttl, backend=backend)
+
+    def get_many(self, namespace, keys):
+        """
+        Look up the cached outputs of a list of covariate vectors.
+
+        Parameters:
+        - namespace: tuple of strings identifying the model and its parameters
+        - keys: list of covariate vectors (tuples of floats)
+
+        Returns:
+        - values: list aligned with keys, holding the cached output or None
+        """
+        now = time.monotonic()
+        values = []
+        missing = []
+        with self._lock:
+            for index, key in enumerate(keys):
+                entry = self._entries.get((namespace, key))
+                if entry is not None and (entry[0] is None or entry[0] > now):
+                    self._entries.move_to_end((namespace, key))
+                    values.append(entry[1])
+                else:
+                    if entry is not None:
+                        del self._entries[(namespace, key)]
+                    values.append(None)
+                    missing.append(index)
+            self.hits += len(keys) - len(missing)
+
+        if missing and self.backend is not None:
+            shared_values = self.backend.get_many(namespace, [keys[index] for index in missing])
+            found = [(index, value) for index, value in zip(missing, shared_values) if value is not None]
+            for index, value in found:
+                values[index] = value
+            self._store(namespace, [keys[index] for index, _ in found], [value for _, value in found])
+            with self._lock:
+                self.shared_hits += len(found)
+            missing = [index for index in missing if values[index] is None]
+
+        with self._lock:
+            self.misses += len(missing)
+        return values
+
+    def set_many(self, namespace, keys, values):
+        """
+        Store the outputs of a list of covariate vectors, locally and in the shared backend.
+        """
+        self._store(namespace, keys, values)
+        if self.backend is not None and keys:
+            self.backend.set_many(namespace, keys, values)
+
+    def _store(self, namespace, keys, values):
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            for key, value in zip(keys, values):
+                self._entries[(namespace, key)] = (expires_at, value)
+                self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Drop all entries kept in this process (the shared backend is left as is).
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Get the size and the hit/miss counters of the cache.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "shared": self.backend is not None,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,286 @@
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from model_execution import error_message
+from model_registry import load_model_spec
+
+# job status codes, as reported by /status
+JOB_QUEUED = 0
+JOB_RUNNING = 1
+JOB_FAILED = 2
+JOB_COMPLETED = 3
+
+JOB_STATUS_MESSAGES = {
+    JOB_QUEUED: "queued",
+    JOB_RUNNING: "running",
+    JOB_FAILED: "failed",
+    JOB_COMPLETED: "completed",
+}
+
+
+# model objects of a worker process, by model specification, loaded on first use
+_worker_models = {}
+
+
+def _score_in_worker(model_spec, method, *args):
+    """
+    Call a prediction method of a model in a worker process, e.g. predict_records for one chunk of a job.
+    """
+    model_obj = _worker_models.get(model_spec)
+    if model_obj is None:
+        model_obj = _worker_models[model_spec] = load_model_spec(model_spec)
+    return getattr(model_obj, method)(*args)
+
+
+class job_queue_full(Exception):
+    """
+    Raised when a job is submitted while the maximum number of unfinished jobs is reached.
+    """
+
+
+class prediction_job:
+    """
+    State of one asynchronous prediction; updated by the worker thread, read by the endpoints.
+    """
+
+    __slots__ = ("job_id", "status", "total", "processed", "results", "error", "created_on", "finished_on")
+
+    def __init__(self, total):
+        self.job_id = uuid.uuid4().hex
+        self.status = JOB_QUEUED
+        self.total = total
+        self.processed = 0
+        self.results = []
+        self.error = None
+        self.created_on = time.time()
+        self.finished_on = None
+
+    @property
+    def finished(self):
+        return self.status in (JOB_COMPLETED, JOB_FAILED)
+
+    def describe(self):
+        """
+        Get the status of the job.
+
+        Returns:
+        - status: dictionary with the job id, status code, message and progress
+        """
+        message = JOB_STATUS_MESSAGES[self.status]
+        if self.error is not None:
+            message = f"{message}: {self.error}"
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "message": message,
+            "processed": self.processed,
+            "total": self.total,
+        }
+
+
+class job_manager:
+    """
+    Runs predictions in the background and keeps their results for retrieval.
+
+    Scoring is CPU-bound Python and numpy code holding the GIL, so with processes > 0 the chunks of
+    a job are scored in a pool of worker processes, which build the model from its specification
+    once; the threads only hand out the chunks and collect the results, and do not compete with
+    the threads answering requests. Jobs of models without a specification are scored in the
+    threads themselves.
+
+    Parameters:
+    - max_workers: number of jobs that run at the same time
+    - max_pending: number of unfinished (queued or running) jobs accepted
+    - max_finished: number of finished jobs kept; the oldest results are dropped first
+    - chunk_size: number of records scored between progress updates
+    - processes: number of worker processes scoring the chunks; 0 scores them in the threads
+    - finished_ttl: seconds the results of a finished job are kept
+    """
+
+    def __init__(self, max_workers=2, max_pending=16, max_finished=32, chunk_size=10000, processes=0,
+                 finished_ttl=3600.0, start_method="spawn"):
+        self._max_workers = max_workers
+        self._executor = None
+        self._max_pending = max_pending
+        self._max_finished = max_finished
+        self._chunk_size = chunk_size
+        self._processes = processes
+        self._finished_ttl = finished_ttl
+        self._start_method = start_method
+        self._pool = None
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, model_obj, data, partial=False, model_spec=None):
+        """
+        Queue a prediction.
+
+        Parameters:
+        - model_obj: the model object
+        - data: a dictionary, or list of dictionaries, containing the input data
+        - partial: score every record of a list independently (see model_execution.predict_records)
+        - model_spec: the specification the worker processes build the same model from; without
+          it, the job is scored in this process
+
+        Returns:
+        - job: the queued prediction_job
+        """
+        job = prediction_job(len(data) if isinstance(data, list) else 1)
+        with self._lock:
+            self._drop_finished()
+            pending = sum(1 for queued_job in self._jobs.values() if not queued_job.finished)
+            if pending >= self._max_pending:
+                raise job_queue_full(f"Too many unfinished jobs ({pending}), try again later")
+            self._jobs[job.job_id] = job
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix="prediction-job")
+            executor = self._executor
+        # handed over in a list, so the worker can drop the only reference to a large input
+        executor.submit(self._run, job, model_obj, [data], partial, model_spec)
+        return job
+
+    def get(self, job_id=None):
+        """
+        Get a job by id, or the most recently submitted job when no id is given.
+
+        Returns:
+        - job: the prediction_job, or None when it does not exist (anymore)
+        """
+        with self._lock:
+            self._drop_finished()
+            if job_id is None:
+                return next(reversed(self._jobs.values()), None)
+            return self._jobs.get(job_id)
+
+    def reset(self):
+        """
+        Stop the worker processes (e.g. after a model has been reloaded) once their running jobs are
+        done; the next job starts new workers, which build the models again.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def shutdown(self):
+        """
+        Cancel the queued jobs and stop the threads and worker processes; they are started again
+        by the next job.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            pool, self._pool = self._pool, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _drop_finished(self):
+        # called with the lock held: drops expired results, and the oldest beyond max_finished
+        expired = time.time() - self._finished_ttl
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for index, job_id in enumerate(finished):
+            if index < len(finished) - self._max_finished or self._jobs[job_id].finished_on < expired:
+                del self._jobs[job_id]
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self._processes,
+                                                 mp_context=multiprocessing.get_context(self._start_method))
+            return self._pool
+
+    def _reset_pool(self, pool):
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job, model_obj, payload, partial, model_spec):
+        job.status = JOB_RUNNING
+        data = payload.pop()
+        try:
+            if model_spec is not None and self._processes > 0:
+                self._run_in_processes(job, model_obj, data, partial, model_spec)
+            elif isinstance(data, list):
+                # iter_predictions may pack the records into a record_batch and free them
+                predictions = model_obj.iter_predictions(data, self._chunk_size, partial)
+                del data
+                for results in predictions:
+                    job.results.extend(results)
+                    job.processed = len(job.results)
+            else:
+                self._set_result(job, model_obj.predict(data))
+        except Exception as e:
+            job.error = error_message(e)
+        finally:
+            job.finished_on = time.time()
+            job.status = JOB_FAILED if job.error is not None else JOB_COMPLETED
+
+    @staticmethod
+    def _set_result(job, result):
+        if isinstance(result, dict) and "error" in result:
+            job.error = result["error"]
+        else:
+            job.results.append(result)
+            job.processed = 1
+
+    def _run_in_processes(self, job, model_obj, data, partial, model_spec):
+        """
+        Score a job chunk by chunk in the worker processes, with a bounded number of chunks in flight.
+        """
+        pool = self._get_pool()
+        if not isinstance(data, list):
+            try:
+                self._set_result(job, pool.submit(_score_in_worker, model_spec, "predict", data).result())
+            except BrokenProcessPool:
+                self._reset_pool(pool)
+                raise
+            return
+
+        in_flight = deque()
+        try:
+            for start in range(0, len(data), self._chunk_size):
+                chunk = data[start:start + self._chunk_size]
+                if partial:
+                    arguments = ("predict_records", chunk, range(start, start + len(chunk)))
+                else:
+                    arguments = ("predict", chunk)
+                in_flight.append(pool.submit(_score_in_worker, model_spec, *arguments))
+                if len(in_flight) < 2 * self._processes:
+                    continue
+                if not self._collect(job, in_flight.popleft().result()):
+                    break
+            while in_flight and job.error is None:
+                self._collect(job, in_flight.popleft().result())
+        except BrokenProcessPool:
+            # a worker died (e.g. out of memory): start over with new workers next time
+            self._reset_pool(pool)
+            raise
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+        if job.error is not None:
+            # the chunks were validated on their own: the whole list is validated again here, so
+            # the error names the same record and position as when scoring in this process
+            job.results = []
+            job.processed = 0
+            try:
+                model_obj._preprocess(data)
+            except Exception as e:
+                job.error = error_message(e)
+
+    @staticmethod
+    def _collect(job, results):
+        if isinstance(results, dict) and "error" in results:
+            job.error = results["error"]
+            return False
+        job.results.extend(results)
+        job.processed = len(job.results)
+        return True
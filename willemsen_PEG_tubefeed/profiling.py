@@ -0,0 +1,265 @@
+import contextvars
+import functools
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+
+from starlette.concurrency import run_in_threadpool
+
+# accept profiling requests and serve /profiles; when off, nothing is sampled
+enabled = os.environ.get("PROFILING_ENABLED", "").lower() in ("1", "true", "yes")
+
+PROFILE_HEADER = "x-profile"
+FOLDED_MEDIA_TYPE = "text/plain; charset=utf-8"
+
+# profile of the request being handled, visible in the threads running its model code
+current_profile = contextvars.ContextVar("current_profile", default=None)
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class request_profile:
+    """
+    Sampling profile of one request, collected by a background thread.
+
+    Every interval the stacks of the worker threads running the model code of the request (see
+    tracked) are recorded. The event loop thread is not sampled, as it serves all requests at the
+    same time, so the profile only holds the work of this request. The result is kept as
+    folded stacks ("outer;inner;innermost count" per line), the input format of flamegraph.pl,
+    speedscope and similar flame graph tools.
+
+    Parameters:
+    - path: path of the profiled request
+    - interval: seconds between two samples
+    """
+
+    def __init__(self, path, interval=0.005):
+        self.profile_id = uuid.uuid4().hex
+        self.path = path
+        self.interval = interval
+        self.started = time.time()
+        self.duration = None
+        self.samples = 0
+        self.stacks = Counter()
+        self._threads = {}
+        self._threads_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._run, name=f"profile-{self.profile_id[:8]}", daemon=True)
+
+    def start(self):
+        self._sampler.start()
+        return self
+
+    def stop(self):
+        """
+        Stop sampling, waiting for the sampler thread; blocks, so not to be called in the event loop.
+        """
+        self._stop.set()
+        self._sampler.join()
+        self.duration = time.time() - self.started
+        return self
+
+    def add_thread(self, thread_id):
+        with self._threads_lock:
+            self._threads[thread_id] = self._threads.get(thread_id, 0) + 1
+
+    def remove_thread(self, thread_id):
+        with self._threads_lock:
+            count = self._threads.get(thread_id, 0) - 1
+            if count > 0:
+                self._threads[thread_id] = count
+            else:
+                self._threads.pop(thread_id, None)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self._threads_lock:
+                thread_ids = list(self._threads)
+            frames = sys._current_frames()
+            for thread_id in thread_ids:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_name(frame))
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(stack))] += 1
+                self.samples += 1
+
+    def describe(self):
+        return {
+            "profile_id": self.profile_id,
+            "path": self.path,
+            "started": self.started,
+            "duration": self.duration,
+            "samples": self.samples,
+            "interval": self.interval,
+        }
+
+    def folded(self):
+        """
+        Get the profile as folded stacks, one "frame;frame;frame count" line per distinct stack.
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def tracked(func):
+    """
+    Wrap a function that will run in a worker thread, so the profile of the current request
+    (if any) samples that thread while the function runs.
+    """
+    profile = current_profile.get()
+    if profile is None:
+        return func
+
+    @functools.wraps(func)
+    def run_tracked(*args, **kwargs):
+        thread_id = threading.get_ident()
+        profile.add_thread(thread_id)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.remove_thread(thread_id)
+
+    return run_tracked
+
+
+class rate_limiter:
+    """
+    Token bucket allowing on average per_minute events per minute, with bursts of up to burst events.
+    """
+
+    def __init__(self, per_minute, burst=None):
+        self.rate = per_minute / 60.0
+        self.burst = burst if burst is not None else max(1, per_minute)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class profile_store:
+    """
+    Keeps the most recent profiles, dropping the oldest ones beyond max_profiles.
+    """
+
+    def __init__(self, max_profiles=20):
+        self.max_profiles = max_profiles
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile):
+        with self._lock:
+            self._profiles[profile.profile_id] = profile
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id):
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self):
+        with self._lock:
+            return [profile.describe() for profile in reversed(self._profiles.values())]
+
+
+class profiler:
+    """
+    Decides which requests are profiled and keeps their profiles.
+
+    A request is profiled when it sends the X-Profile header, or, for prediction endpoints, when
+    it is picked by the sample rate; in both cases only while the rate limit allows it.
+
+    Parameters:
+    - sample_rate: fraction of prediction requests profiled without asking (0 to 1)
+    - max_per_minute: maximum number of profiles taken per minute
+    - interval: seconds between two samples of a profile
+    - max_profiles: number of profiles kept for /profiles
+    """
+
+    def __init__(self, sample_rate=0.0, max_per_minute=6, interval=0.005, max_profiles=20):
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.limiter = rate_limiter(max_per_minute)
+        self.store = profile_store(max_profiles)
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Create the profiler configured by PROFILE_SAMPLE_RATE, PROFILE_MAX_PER_MINUTE,
+        PROFILE_INTERVAL and PROFILE_MAX_STORED.
+        """
+        return cls(
+            sample_rate=float(os.environ.get("PROFILE_SAMPLE_RATE", "0")),
+            max_per_minute=float(os.environ.get("PROFILE_MAX_PER_MINUTE", "6")),
+            interval=float(os.environ.get("PROFILE_INTERVAL", "0.005")),
+            max_profiles=int(os.environ.get("PROFILE_MAX_STORED", "20")),
+        )
+
+    def wants(self, scope):
+        """
+        Check whether a request should be profiled (before applying the rate limit).
+        """
+        for name, value in scope.get("headers", ()):
+            if name == PROFILE_HEADER.encode() and value.strip().lower() not in (b"", b"0", b"false"):
+                return True
+        path = scope.get("path", "")
+        return self.sample_rate > 0 and "/predict" in path and random.random() < self.sample_rate
+
+
+class profiling_middleware:
+    """
+    ASGI middleware profiling the requests selected by a profiler.
+
+    Profiled responses carry an X-Profile-Id header; the profile is stored and served by
+    /profiles/{profile_id}. Requests that ask for a profile while the rate limit is exhausted are
+    handled normally, with an "X-Profile-Id: rate-limited" header.
+    """
+
+    def __init__(self, app, profiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.profiler.wants(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not self.profiler.limiter.allow():
+            await self.app(scope, receive, self._with_header(send, b"rate-limited"))
+            return
+
+        profile = request_profile(scope.get("path", ""), self.profiler.interval).start()
+        token = current_profile.set(profile)
+        try:
+            await self.app(scope, receive, self._with_header(send, profile.profile_id.encode()))
+        finally:
+            current_profile.reset(token)
+            # joining the sampler thread would block the event loop
+            self.profiler.store.add(await run_in_threadpool(profile.stop))
+
+    @staticmethod
+    def _with_header(send, profile_id):
+        async def send_with_header(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": list(message.get("headers", [])) + [(b"x-profile-id", profile_id)]}
+            await send(message)
+
+        return send_with_header
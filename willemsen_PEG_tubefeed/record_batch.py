@@ -0,0 +1,111 @@
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+
+
+def _as_array(column: Any) -> np.ndarray:
+    """
+    Convert a column to a numpy array; sequences with strings keep their original python values.
+    """
+    if isinstance(column, np.ndarray):
+        return column
+    array = np.asarray(column)
+    if array.dtype.kind in "US":  # numpy would turn mixed values like [1, "a"] into strings
+        array = np.empty(len(column), dtype=object)
+        array[:] = list(column)
+    return array
+
+
+class record_batch:
+    """
+    Batch of input records held as one numpy array per feature instead of one dict per record.
+
+    Numerical features are stored unboxed (8 bytes per value for float64, instead of a dict entry
+    and a Python object per value), so a million patients take tens of megabytes. The batch
+    behaves like a read-only dictionary of columns, so it can be used wherever a dictionary of
+    columns is accepted.
+
+    Parameters:
+    - columns: dictionary mapping feature name to a sequence or numpy array of values
+    """
+
+    __slots__ = ("columns", "length")
+
+    def __init__(self, columns: Dict[str, Any]):
+        self.columns = {name: _as_array(column) for name, column in columns.items()}
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All input columns must have the same length")
+        self.length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]], names: List[str], numeric: bool = False) -> "record_batch":
+        """
+        Pack the given features of a list of (validated) records into columns.
+
+        Parameters:
+        - records: list of dictionaries
+        - names: the features to pack
+        - numeric: convert every value with float() into float64 columns, filled without an
+          intermediate list; otherwise the type of each column is inferred
+
+        Raises:
+        - KeyError if a record lacks one of the features
+        - TypeError or ValueError if numeric is set and a value is not a number
+        """
+        if not numeric:
+            return cls({name: [record[name] for record in records] for name in names})
+        return cls({
+            name: np.fromiter((float(record[name]) for record in records), dtype=np.float64, count=len(records))
+            for name in names
+        })
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def keys(self):
+        return self.columns.keys()
+
+    def values(self):
+        return self.columns.values()
+
+    def items(self):
+        return self.columns.items()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def take(self, index) -> "record_batch":
+        """
+        Select rows by slice, integer index array or boolean mask.
+        """
+        return record_batch({name: column[index] for name, column in self.columns.items()})
+
+    def to_matrix(self, names: List[str]) -> np.ndarray:
+        """
+        Stack the given features into a contiguous float64 matrix, one column per feature.
+
+        Returns:
+        - matrix: numpy array with shape (len(self), len(names))
+        """
+        matrix = np.empty((self.length, len(names)), dtype=np.float64)
+        for index, name in enumerate(names):
+            matrix[:, index] = self.columns[name]  # converted in place, without a float64 copy per column
+        return matrix
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Convert the batch back to one dictionary per record, with Python values.
+        """
+        names = list(self.columns)
+        return [dict(zip(names, row)) for row in zip(*(self.columns[name].tolist() for name in names))]
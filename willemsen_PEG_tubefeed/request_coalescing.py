@@ -0,0 +1,118 @@
+import asyncio
+import os
+
+import metrics
+
+
+class _pending_batch:
+    __slots__ = ("model_obj", "records", "futures", "timer")
+
+    def __init__(self, model_obj):
+        self.model_obj = model_obj
+        self.records = []
+        self.futures = []
+        self.timer = None
+
+
+class request_coalescer:
+    """
+    Coalesces concurrent single-record predictions of a model into one batch.
+
+    A record that arrives while the model is idle is scored right away (together with the
+    records that arrived in the same iteration of the event loop), so a lone request does not
+    wait. Records that arrive while a batch of the model is being scored are collected into the
+    next batch, which is scored as soon as the current one is done, max_batch_size records are
+    waiting, or its first record has waited max_delay seconds. Every batch is validated and scored
+    with model_execution.predict_each in a single call in the thread pool, so each caller gets
+    the probability (or the error) of its own record, as if it had been scored on its own.
+
+    Parameters:
+    - run: coroutine function running a function outside the event loop, e.g. main.run_model
+    - max_delay: the longest time in seconds a record waits for other records; 0 disables coalescing
+    - max_batch_size: number of records scored together at most
+    """
+
+    def __init__(self, run, max_delay=0.0, max_batch_size=64):
+        self.run = run
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+        # batch waiting for records, by id of the model object (the batch holds on to the object)
+        self._pending = {}
+        # number of batches being scored, by id of the model object
+        self._scoring = {}
+        # tasks of the batches being scored, referenced so they are not garbage collected
+        self._tasks = set()
+
+    @classmethod
+    def from_environment(cls, run):
+        """
+        Create the coalescer configured by COALESCE_MAX_DELAY_MS and COALESCE_MAX_BATCH_SIZE.
+        """
+        return cls(
+            run,
+            max_delay=float(os.environ.get("COALESCE_MAX_DELAY_MS", "0")) / 1000,
+            max_batch_size=int(os.environ.get("COALESCE_MAX_BATCH_SIZE", "64")),
+        )
+
+    @property
+    def enabled(self):
+        return self.max_delay > 0 and self.max_batch_size > 1
+
+    async def predict(self, model_obj, record):
+        """
+        Calculate the probability for one input dictionary, together with the records of
+        concurrent requests.
+
+        Returns:
+        - probability: the probability, or {"error": message} when the record is not valid
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(id(model_obj))
+        if batch is None:
+            batch = self._pending[id(model_obj)] = _pending_batch(model_obj)
+            if self._scoring.get(id(model_obj)):
+                batch.timer = loop.call_later(self.max_delay, self._flush, batch)
+            else:
+                batch.timer = loop.call_soon(self._flush, batch)
+        future = loop.create_future()
+        batch.records.append(record)
+        batch.futures.append(future)
+        if len(batch.records) >= self.max_batch_size:
+            self._flush(batch)
+        return await future
+
+    def _flush(self, batch):
+        if self._pending.get(id(batch.model_obj)) is not batch:
+            return
+        del self._pending[id(batch.model_obj)]
+        batch.timer.cancel()
+        self._scoring[id(batch.model_obj)] = self._scoring.get(id(batch.model_obj), 0) + 1
+        task = asyncio.ensure_future(self._score(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _score(self, batch):
+        metrics.observe_coalesced(batch.model_obj, len(batch.records))
+        try:
+            if len(batch.records) == 1:
+                results = [await self.run(batch.model_obj.predict, batch.records[0])]
+            else:
+                results = await self.run(batch.model_obj.predict_each, batch.records)
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future, result in zip(batch.futures, results):
+                # the future of a request that was cancelled (e.g. the client went away) is done already
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            key = id(batch.model_obj)
+            self._scoring[key] -= 1
+            if not self._scoring[key]:
+                del self._scoring[key]
+            # the records collected in the meantime do not wait any longer
+            waiting = self._pending.get(key)
+            if waiting is not None:
+                self._flush(waiting)
@@ -0,0 +1,109 @@
+from typing import Any, List, Literal, Union
+
+from pydantic import Field, TypeAdapter, ValidationError
+from typing_extensions import Annotated, NotRequired, TypedDict
+
+
+def _field_type(feature, inclusive_bounds):
+    """
+    Build the annotated type of one feature: a strict, finite number within the metadata range,
+    or a literal of the allowed categories.
+    """
+    if feature.type == "categorical":
+        if feature.categories is None:
+            return Any
+        return Literal[tuple(sorted(feature.categories, key=lambda category: (isinstance(category, str), category)))]
+
+    bounds = {}
+    if feature.minimum is not None:
+        bounds["ge" if inclusive_bounds else "gt"] = feature.minimum
+    if feature.maximum is not None:
+        bounds["le" if inclusive_bounds else "lt"] = feature.maximum
+    return Annotated[float, Field(strict=True, allow_inf_nan=False, **bounds)]
+
+
+def record_type(schema, name):
+    """
+    Generate a TypedDict describing one input record of a model from its feature schema.
+
+    Parameters:
+    - schema: the feature_schema of the model
+    - name: name of the generated type, shown in the OpenAPI documentation
+
+    Returns:
+    - record: the TypedDict class
+    """
+    fields = {}
+    for feature in schema:
+        field_type = _field_type(feature, schema.inclusive_bounds)
+        fields[feature.name] = field_type if feature.required else NotRequired[field_type]
+    return TypedDict(name, fields)
+
+
+class typed_request_model:
+    """
+    Typed request models of a model, generated from its feature schema.
+
+    validate_record_json and validate_request_json decode and validate a JSON record (or a list of
+    records) in a single pass of pydantic-core. They accept a subset of what the feature schema accepts (e.g. it does not apply the
+    transforms), so a record it rejects is left to the regular validation, which produces the
+    error message for the client.
+
+    Parameters:
+    - schema: the feature_schema of the model
+    - name: name of the record type
+    """
+
+    def __init__(self, schema, name):
+        self.record = record_type(schema, name)
+        self._record_adapter = TypeAdapter(self.record)
+        self._request_adapter = TypeAdapter(Union[self.record, List[self.record]])
+
+    def validate_record_json(self, body):
+        """
+        Decode and validate a JSON object holding one input record.
+
+        Returns:
+        - record: the validated record as a new dictionary, without unknown keys, or None when
+          the record is not valid
+        """
+        try:
+            return self._record_adapter.validate_json(body)
+        except ValidationError:
+            return None
+
+    def validate_request_json(self, body):
+        """
+        Decode and validate a JSON request body: one input record, or a list of them.
+
+        Returns:
+        - data: the validated record, or list of records, as new dictionaries without unknown keys,
+          or None when the body (or any record in it) is not valid
+        """
+        try:
+            return self._request_adapter.validate_json(body)
+        except ValidationError:
+            return None
+
+    def json_schema(self, ref_template="#/$defs/{model}"):
+        """
+        Get the JSON schema of a request body: one record, or a list of records.
+        """
+        return self._request_adapter.json_schema(ref_template=ref_template)
+
+
+def get_request_model(model_obj):
+    """
+    Get the typed request model of a model object, generated on first use.
+
+    Returns:
+    - request_model: the typed_request_model, or None when the model has no feature schema
+    """
+    request_model = model_obj.__dict__.get("_request_model")
+    if request_model is None:
+        schema = model_obj.get_feature_schema()
+        if schema is None:
+            return None
+        request_model = typed_request_model(schema, f"{type(model_obj).__name__}_record")
+        model_obj._request_model = request_model
+    return request_model